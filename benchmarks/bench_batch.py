@@ -0,0 +1,72 @@
+"""Benchmark batch chord parsing.
+
+Compares `ChordEditor.create_chords` with a list comprehension over `ChordEditor.create_chord` on a corpus of chord tokens, a few of which are invalid. Run from the repository root with::
+
+    python benchmarks/bench_batch.py [number of tokens]
+
+"""
+import itertools
+import random
+import sys
+import time
+
+from chordparser.editors.chords_editor import ChordEditor
+
+
+ROOTS = ("C", "C#", "Db", "D", "Eb", "E", "F", "F#", "G", "Ab", "A", "Bb", "B")
+QUALITIES = (
+    "", "m", "7", "maj7", "m7", "m7b5", "dim7", "aug", "sus2", "sus4",
+    "9", "m9", "13", "7b9", "add9", "6", "m6", "5",
+)
+BASSES = ("", "", "", "/E", "/G", "/B")
+JUNK = ("N.C.", "x2", "riff", "|", "%")
+
+
+def make_corpus(size, seed=0):
+    """Return `size` chord tokens, about 5% of which are invalid."""
+    rng = random.Random(seed)
+    vocabulary = [
+        root + quality + bass
+        for root, quality, bass in itertools.product(ROOTS, QUALITIES, BASSES)
+    ]
+    # a few chords are far more common than the rest
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    tokens = rng.choices(vocabulary, weights, k=size)
+    for i in rng.sample(range(size), size // 20):
+        tokens[i] = rng.choice(JUNK)
+    return tokens
+
+
+def create_each(CE, tokens, frozen):
+    chords = []
+    for token in tokens:
+        try:
+            chords.append(CE.create_chord(token, frozen=frozen))
+        except SyntaxError:
+            pass
+    return chords
+
+
+def bench(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main(size):
+    CE = ChordEditor()
+    tokens = make_corpus(size)
+    print(f"{size} tokens, {len(set(tokens))} distinct")
+    for frozen in (False, True):
+        CE.clear_chord_cache()
+        each = bench(create_each, CE, tokens, frozen)
+        CE.clear_chord_cache()
+        batch = bench(CE.create_chords, tokens, 'skip', frozen)
+        print(f"frozen={frozen}")
+        print(f"  create_chord:  {each:8.2f} s")
+        print(f"  create_chords: {batch:8.2f} s")
+        print(f"  speedup:       {each / batch:8.2f}x")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
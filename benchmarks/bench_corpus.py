@@ -0,0 +1,69 @@
+"""Benchmark parallel corpus analysis.
+
+Analyses a synthetic corpus of ChordPro songs with `CorpusAnalyser.analyse_corpus` using an increasing number of worker processes, and reports the throughput and speedup over a single worker. Run from the repository root with::
+
+    python benchmarks/bench_corpus.py [number of songs] [maximum workers]
+
+The maximum number of workers defaults to the number of CPUs.
+
+"""
+import os
+import random
+import sys
+import time
+
+from chordparser.analysers.corpus_analyser import CorpusAnalyser
+
+
+KEYS = ("C", "G", "D", "A", "E", "F", "Bb", "Eb", "Am", "Em", "Dm", "F#m")
+CHORDS = (
+    "C", "Dm", "Em", "F", "G", "Am", "G7", "Cmaj7", "Dm7", "E7", "A7",
+    "Bb", "Fm", "D", "E", "Bm7b5", "Gsus4", "Cadd9", "F/C", "G/B", "N.C.",
+)
+WORDS = ("la", "love", "you", "night", "home", "the", "and", "day")
+
+
+def make_song(rng, number):
+    """Return the ChordPro text of a song of about 40 lines."""
+    lines = [f"{{t:Song {number}}}", f"{{key:{rng.choice(KEYS)}}}"]
+    for _ in range(40):
+        lines.append(' '.join(
+            f"[{rng.choice(CHORDS)}]{rng.choice(WORDS)}" for _ in range(4)
+        ))
+    return '\n'.join(lines) + '\n'
+
+
+def make_corpus(size, seed=0):
+    rng = random.Random(seed)
+    return [make_song(rng, number) for number in range(size)]
+
+
+def bench(songs, workers):
+    CA = CorpusAnalyser()
+    start = time.perf_counter()
+    for _ in CA.analyse_corpus(songs, workers):
+        pass
+    return time.perf_counter() - start
+
+
+def main(size, max_workers):
+    songs = make_corpus(size)
+    print(f"{size} songs, {os.cpu_count()} CPUs")
+    workers = 1
+    base = None
+    while workers <= max_workers:
+        elapsed = bench(songs, workers)
+        base = base or elapsed
+        print(
+            f"  {workers:3} workers: {elapsed:8.2f} s"
+            f" {size / elapsed:10.0f} songs/s"
+            f" {base / elapsed:6.2f}x"
+        )
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1,
+    )
@@ -0,0 +1,47 @@
+"""Benchmark diatonic analysis.
+
+Times `ChordAnalyser.analyse_diatonic` on every chord of a corpus against scales of every root and mode, with and without the minor submodes. Run from the repository root with::
+
+    python benchmarks/bench_diatonic.py [number of chords]
+
+"""
+import sys
+import time
+
+from bench_batch import make_corpus
+
+from chordparser.analysers.chords_analyser import ChordAnalyser
+from chordparser.editors.chords_editor import ChordEditor
+from chordparser.editors.scales_editor import ScaleEditor
+
+
+ROOTS = ("C", "D", "Eb", "F#", "A", "Bb")
+MODES = ("major", "minor", "dorian", "mixolydian")
+
+
+def analyse(CA, chords, scales, incl_submodes):
+    for scale in scales:
+        for chord in chords:
+            CA.analyse_diatonic(chord, scale, incl_submodes)
+
+
+def main(size):
+    CE = ChordEditor()
+    SE = ScaleEditor()
+    CA = ChordAnalyser()
+    chords = CE.create_chords(make_corpus(size), 'skip', frozen=True)
+    scales = [SE.create_scale(root, mode) for root in ROOTS for mode in MODES]
+    print(f"{len(chords)} chords, {len(scales)} scales")
+    for incl_submodes in (False, True):
+        start = time.perf_counter()
+        analyse(CA, chords, scales, incl_submodes)
+        elapsed = time.perf_counter() - start
+        calls = len(chords) * len(scales)
+        print(
+            f"  incl_submodes={incl_submodes}: {elapsed:8.2f} s"
+            f" {elapsed / calls * 1e6:8.2f} us/call"
+        )
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,78 @@
+"""Benchmark key estimation.
+
+Estimates the keys of songs in random keys with `KeyAnalyser.estimate_keys` and reports the songs per second and how often the estimated key is the key of the song. Each song is a random progression of diatonic chords, with a few secondary dominants. Run from the repository root with::
+
+    python benchmarks/bench_keys.py [number of songs] [chords per song]
+
+"""
+import random
+import sys
+import time
+
+from chordparser.analysers.key_analyser import KeyAnalyser
+from chordparser.editors.chords_editor import ChordEditor
+from chordparser.editors.scales_editor import ScaleEditor
+from chordparser.music.notes import FrozenNote
+
+
+# the degrees of the chords of a song and how often they are used
+DEGREES = (1, 4, 5, 6, 2, 3, 7)
+WEIGHTS = (8, 4, 5, 3, 2, 1, 1)
+
+
+def make_songs(count, length, seed=0):
+    """Return `count` songs of `length` chords and the key of each song."""
+    rng = random.Random(seed)
+    CE = ChordEditor()
+    SE = ScaleEditor()
+    keys = [
+        (note, mode) for note in FrozenNote._spellings
+        for mode in ("major", "minor")
+        if abs(note._symbol_num) < 2
+    ]
+    songs = []
+    answers = []
+    for _ in range(count):
+        while True:
+            note, mode = rng.choice(keys)
+            try:
+                scale = SE.create_scale(note, mode)
+                diatonic = {
+                    degree: CE.create_diatonic(scale, degree)
+                    for degree in DEGREES
+                }
+                for chord in diatonic.values():
+                    chord.pitch_class_mask  # build the notes of the chord
+                break
+            except ValueError:
+                continue  # the key needs more than double accidentals
+        degrees = rng.choices(DEGREES, WEIGHTS, k=length - 2)
+        songs.append(
+            [diatonic[1]] + [diatonic[d] for d in degrees] + [diatonic[1]]
+        )
+        answers.append(scale.key)
+    return songs, answers
+
+
+def main(count, length):
+    KA = KeyAnalyser()
+    songs, answers = make_songs(count, length)
+    KA.estimate_keys(songs[:1])  # build the profiles
+    start = time.perf_counter()
+    estimates = KA.estimate_keys(songs)
+    elapsed = time.perf_counter() - start
+    right = sum(
+        estimate[0].key.root.num_value() == key.root.num_value()
+        and estimate[0].key.mode == key.mode
+        for estimate, key in zip(estimates, answers)
+    )
+    print(f"{count} songs of {length} chords")
+    print(f"  estimate_keys: {elapsed:8.3f} s {count / elapsed:10,.0f} songs/s")
+    print(f"  right key:     {right / count:8.1%}")
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 60,
+    )
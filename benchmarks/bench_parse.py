@@ -0,0 +1,46 @@
+"""Benchmark chord notation parsing.
+
+Compares the single-pass scanner with the reference regex, without the parse cache. Run from the repository root with::
+
+    python benchmarks/bench_parse.py
+
+"""
+import itertools
+import timeit
+
+from chordparser.editors.chords_editor import ChordEditor
+
+
+ROOTS = ("C", "C#", "Db", "E", "F#", "Gb", "A", "Bb", "b", "e")
+QUALITIES = (
+    "", "m", "7", "maj7", "m7", "m7b5", "dim7", "aug", "sus2", "sus4",
+    "9", "m11", "13", "7b9", "add9", "6", "5", "mM7", "7#5", "b13",
+)
+BASSES = ("", "/E", "/G", "/Bb")
+NOTATIONS = [
+    root + quality + bass
+    for root, quality, bass in itertools.product(ROOTS, QUALITIES, BASSES)
+]
+
+
+def bench(parse, repeat=5):
+    """Return the best time in microseconds to parse one notation."""
+    def run():
+        for notation in NOTATIONS:
+            parse(notation)
+    best = min(timeit.repeat(run, number=1, repeat=repeat))
+    return best / len(NOTATIONS) * 1e6
+
+
+def main():
+    CE = ChordEditor()
+    regex = bench(CE._parse_chord_regex)
+    scanner = bench(CE._parse_chord)
+    print(f"{len(NOTATIONS)} notations")
+    print(f"regex:   {regex:8.2f} us/chord")
+    print(f"scanner: {scanner:8.2f} us/chord")
+    print(f"speedup: {regex / scanner:8.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark roman numeral realisation.
+
+Realises roman numeral progressions in all 12 major keys with `ChordRomanConverter.to_chords`, and checks that each `Chord` converts back to its `Roman`. Run from the repository root with::
+
+    python benchmarks/bench_realise.py [number of progressions] [chords per progression]
+
+"""
+import sys
+import time
+import warnings
+
+from bench_batch import make_corpus
+
+from chordparser.editors.chord_roman_converter import ChordRomanConverter
+from chordparser.editors.chords_editor import ChordEditor
+from chordparser.editors.scales_editor import ScaleEditor
+
+
+KEYS = ("C", "Db", "D", "Eb", "E", "F", "F#", "G", "Ab", "A", "Bb", "B")
+
+
+def main(size, length):
+    CE = ChordEditor()
+    SE = ScaleEditor()
+    CRC = ChordRomanConverter()
+    chords = [
+        chord for chord in CE.create_chords(make_corpus(size * length), 'skip')
+        if not chord.add and not chord.bass
+        and chord.quality.value not in {"power", "sus2", "sus4"}
+    ]
+    scales = [SE.create_scale(key) for key in KEYS]
+    romans = []
+    for roman in CRC.to_roman_sequence(chords, SE.create_scale("C")):
+        try:
+            for scale in scales:
+                CRC.to_chord(roman, scale)
+        except ValueError:
+            continue  # the chord needs more than double accidentals
+        romans.append(roman)
+    CRC._scale_chords.clear()  # start the timings without memoised chords
+    progressions = [
+        romans[i:i+length] for i in range(0, len(romans), length)
+    ]
+    realised = len(romans) * len(scales)
+    print(f"{len(progressions)} progressions, {len(scales)} keys")
+    for run in ("first", "warm"):
+        start = time.perf_counter()
+        results = [
+            CRC.to_chords(progression, scale, frozen=True)
+            for scale in scales for progression in progressions
+        ]
+        elapsed = time.perf_counter() - start
+        print(
+            f"  to_chords {run:>5}: {elapsed:8.3f} s"
+            f" {realised / elapsed:12,.0f} chords/s"
+        )
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        back = [
+            CRC.to_roman_sequence(chords, scales[i // len(progressions)])
+            for i, chords in enumerate(results)
+        ]
+    same = back == [progression for _ in scales for progression in progressions]
+    print("  round trip:", "identical" if same else "DIFFERENT")
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 16,
+    )
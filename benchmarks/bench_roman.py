@@ -0,0 +1,62 @@
+"""Benchmark song-level roman numeral analysis.
+
+Converts songs of chords to `Romans` with `ChordRomanConverter.to_roman` for each chord and with `to_roman_sequence` for each song, and checks that the results are the same. Run from the repository root with::
+
+    python benchmarks/bench_roman.py [number of songs] [chords per song]
+
+"""
+import random
+import sys
+import time
+import warnings
+
+from bench_batch import make_corpus
+
+from chordparser.editors.chord_roman_converter import ChordRomanConverter
+from chordparser.editors.chords_editor import ChordEditor
+from chordparser.editors.keys_editor import KeyEditor
+
+
+KEYS = (("C", "major"), ("G", "major"), ("Eb", "major"), ("A", "minor"))
+
+
+def main(songs, length):
+    CE = ChordEditor()
+    KE = KeyEditor()
+    CRC = ChordRomanConverter()
+    chords = CE.create_chords(make_corpus(songs * length), 'skip')
+    rng = random.Random(0)
+    corpus = [
+        (chords[i:i+length], KE.create_key(*rng.choice(KEYS)))
+        for i in range(0, len(chords), length)
+    ]
+    print(f"{len(corpus)} songs, {len(chords)} chords")
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        start = time.perf_counter()
+        expected = [
+            [CRC.to_roman(chord, key) for chord in song]
+            for song, key in corpus
+        ]
+        loop = time.perf_counter() - start
+        print(f"  to_roman loop:           {loop:8.2f} s")
+        # the first pass builds the romans of each scale, later passes
+        # only look them up
+        for run in ("first", "warm"):
+            start = time.perf_counter()
+            results = [
+                CRC.to_roman_sequence(song, key) for song, key in corpus
+            ]
+            sequence = time.perf_counter() - start
+            same = "identical" if results == expected else "DIFFERENT"
+            print(
+                f"  to_roman_sequence {run:>5}: {sequence:8.2f} s"
+                f" {loop / sequence:6.1f}x  {same}"
+            )
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 60,
+    )
@@ -0,0 +1,66 @@
+"""Benchmark secondary chord analysis of songs.
+
+Analyses the pairs of consecutive chords of songs with `ChordAnalyser.analyse_secondary` for each pair and with `analyse_secondary_sequence` for each song, and checks that the results are the same. Like real songs, each song repeats a few chords of its own. Run from the repository root with::
+
+    python benchmarks/bench_secondary.py [number of songs] [chords per song]
+
+"""
+import random
+import sys
+import time
+
+from bench_batch import make_corpus
+
+from chordparser.analysers.chords_analyser import ChordAnalyser
+from chordparser.editors.chords_editor import ChordEditor
+from chordparser.editors.scales_editor import ScaleEditor
+
+
+KEYS = (("C", "major"), ("G", "major"), ("Eb", "major"), ("A", "minor"))
+VOCABULARY = 8  # the number of different chords of each song
+
+
+def main(songs, length):
+    CE = ChordEditor()
+    SE = ScaleEditor()
+    CA = ChordAnalyser()
+    chords = CE.create_chords(make_corpus(songs * VOCABULARY), 'skip')
+    rng = random.Random(0)
+    corpus = []
+    for i in range(0, len(chords), VOCABULARY):
+        vocabulary = chords[i:i+VOCABULARY]
+        corpus.append((
+            rng.choices(vocabulary, k=length),
+            SE.create_scale(*rng.choice(KEYS)),
+        ))
+    print(f"{len(corpus)} songs, {len(corpus) * length} chords")
+    for incl_submodes in (False, True):
+        start = time.perf_counter()
+        expected = [
+            [
+                CA.analyse_secondary(prev, nxt, scale, incl_submodes)
+                for prev, nxt in zip(song, song[1:])
+            ] + [""]
+            for song, scale in corpus
+        ]
+        pairs = time.perf_counter() - start
+        start = time.perf_counter()
+        results = [
+            CA.analyse_secondary_sequence(song, scale, incl_submodes)
+            for song, scale in corpus
+        ]
+        sequence = time.perf_counter() - start
+        same = "identical" if results == expected else "DIFFERENT"
+        print(f"  incl_submodes={incl_submodes}")
+        print(f"    analyse_secondary loop:     {pairs:8.2f} s")
+        print(
+            f"    analyse_secondary_sequence: {sequence:8.2f} s"
+            f" {pairs / sequence:6.1f}x  {same}"
+        )
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 60,
+    )
@@ -0,0 +1,58 @@
+"""Benchmark `ChordAnalyser.analyse_all` on many threads.
+
+Analyses every chord of a corpus against scales of several roots and modes with a thread pool of an increasing size, and checks that the results are the same as a sequential run. On an interpreter with a global interpreter lock the threads do not run in parallel, so the throughput stays about the same. Run from the repository root with::
+
+    python benchmarks/bench_threads.py [number of chords] [maximum threads]
+
+"""
+from concurrent.futures import ThreadPoolExecutor
+import os
+import sys
+import time
+
+from bench_batch import make_corpus
+
+from chordparser.analysers.chords_analyser import ChordAnalyser
+from chordparser.editors.chords_editor import ChordEditor
+from chordparser.editors.scales_editor import ScaleEditor
+
+
+ROOTS = ("C", "Eb", "F#", "A")
+MODES = ("major", "minor", "dorian")
+
+
+def main(size, max_threads):
+    CE = ChordEditor()
+    SE = ScaleEditor()
+    CA = ChordAnalyser()
+    chords = CE.create_chords(make_corpus(size), 'skip', frozen=True)
+    scales = [SE.create_scale(root, mode) for root in ROOTS for mode in MODES]
+    tasks = [(chord, scale) for chord in chords for scale in scales]
+
+    def analyse(task):
+        return CA.analyse_all(*task, incl_submodes=True)
+
+    start = time.perf_counter()
+    expected = [analyse(task) for task in tasks]
+    base = time.perf_counter() - start
+    print(f"{len(tasks)} analyses, {os.cpu_count()} CPUs")
+    print(f"  sequential: {base:8.2f} s")
+    threads = 1
+    while threads <= max_threads:
+        with ThreadPoolExecutor(threads) as pool:
+            start = time.perf_counter()
+            results = list(pool.map(analyse, tasks, chunksize=64))
+            elapsed = time.perf_counter() - start
+        same = "identical" if results == expected else "DIFFERENT"
+        print(
+            f"  {threads:3} threads: {elapsed:8.2f} s"
+            f" {base / elapsed:6.2f}x  {same}"
+        )
+        threads *= 2
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 16,
+    )
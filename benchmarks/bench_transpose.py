@@ -0,0 +1,58 @@
+"""Benchmark transposing a chord library to every key.
+
+Compares `Chord.transpose_simple` on each chord with `ChordArray.transpose_simple` on the whole library. Run from the repository root with::
+
+    python benchmarks/bench_transpose.py [number of chords]
+
+"""
+import sys
+import time
+
+from bench_batch import make_corpus
+
+from chordparser.editors.chords_editor import ChordEditor
+from chordparser.music.chord_array import ChordArray
+
+
+def transposable(chord):
+    """Return whether the chord can be transposed to every key."""
+    try:
+        for semitones in range(12):
+            chord.transpose_simple(semitones)
+    except ValueError:  # e.g. Db/B needs a triple sharp in A#
+        return False
+    return True
+
+
+def transpose_each(chords):
+    for semitones in range(12):
+        for chord in chords:
+            chord.thaw().transpose_simple(semitones)
+
+
+def transpose_array(chords):
+    for semitones in range(12):
+        chords.transpose_simple(semitones)
+
+
+def bench(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main(size):
+    CE = ChordEditor()
+    chords = CE.create_chords(make_corpus(size), 'skip', frozen=True)
+    chords = [chord for chord in chords if transposable(chord)]
+    array = ChordArray.from_chords(chords)
+    print(f"{len(chords)} chords, 12 keys")
+    each = bench(transpose_each, chords)
+    vectorized = bench(transpose_array, array)
+    print(f"  Chord.transpose_simple:      {each:8.3f} s")
+    print(f"  ChordArray.transpose_simple: {vectorized:8.3f} s")
+    print(f"  speedup:                     {each / vectorized:8.0f}x")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -55,5 +55,6 @@ setup(name='chordparser',
       setup_requires=['pytest-runner'],
       tests_require=['pytest'],
       install_requires=[],
+      extras_require={'numpy': ['numpy']},
       include_package_data=True,
       zip_safe=False)
@@ -1,16 +1,28 @@
 from chordparser.analysers.chords_analyser import ChordAnalyser
+from chordparser.analysers.corpus_analyser import (
+    CorpusAnalyser, SongAnalysis,
+)
+from chordparser.analysers.key_analyser import KeyAnalyser, KeyEstimate
 from chordparser.editors.chord_roman_converter import ChordRomanConverter
 from chordparser.editors.chords_editor import ChordEditor
 from chordparser.editors.keys_editor import KeyEditor, ModeError
 from chordparser.editors.notes_editor import NoteEditor
+from chordparser.editors.parse_result import ParseResult
 from chordparser.editors.quality_editor import QualityEditor
+from chordparser.editors.roman_editor import RomanEditor
 from chordparser.editors.scales_editor import ScaleEditor
-from chordparser.music.keys import Key
-from chordparser.music.notes import Note
+from chordparser.music.keys import FrozenKey, Key
+from chordparser.music.notes import FrozenNote, Note
+from chordparser.music.pitch_set import PitchSet
 from chordparser.music.scales import Scale
 from chordparser.music.quality import Quality
 from chordparser.music.roman import Roman
-from chordparser.music.chords import Chord
+from chordparser.music.chords import Chord, FrozenChord
+from chordparser.music.chord_array import ChordArray
+from chordparser.readers.chordpro_corpus import ChordProCorpus, CorpusSong
+from chordparser.readers.chordpro_reader import (
+    ChordEvent, ChordProReader, DirectiveEvent, LyricEvent,
+)
 from chordparser.parser import Parser
 
 
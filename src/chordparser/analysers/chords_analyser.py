@@ -4,6 +4,8 @@ from chordparser.editors.chord_roman_converter import ChordRomanConverter
 from chordparser.editors.chords_editor import ChordEditor
 from chordparser.editors.notes_editor import NoteEditor
 from chordparser.editors.scales_editor import ScaleEditor
+from chordparser.music.roman import Roman
+from chordparser.music.scales import Scale
 
 
 class ChordAnalyser:
@@ -12,7 +14,7 @@ class ChordAnalyser:
     The ChordAnalyser can analyse `Chords` with reference to `Scales` and other `Chords` and find their relationships or functions.
 
     """
-    _mode_list = [
+    _mode_list = (
         'major',
         'minor',
         'dorian',
@@ -20,10 +22,13 @@ class ChordAnalyser:
         'lydian',
         'phrygian',
         'locrian',
-        ]
+        )
     _CE = ChordEditor()
     _SE = ScaleEditor()
     _CRC = ChordRomanConverter()
+    _diatonic_index = {}  # (root, mode, submode) -> {triad: degree}
+    _tonicised_scales = {}  # (root, mode) -> Scale
+    _tonicised = frozenset(("major", "minor", "dominant"))
 
     def analyse_diatonic(
             self, chord, scale,
@@ -100,18 +105,43 @@ class ChordAnalyser:
         else:
             j = [None]
         chords = []
+        root = scale.key.root.freeze()
+        triad = chord.base_notes[0:3]
         for submode in j:
-            for i in range(7):
-                nscale = self._SE.create_scale(scale.key.root, scale.key.mode, submode)
-                diatonic = self._CE.create_diatonic(nscale, i+1)
-                if chord.base_notes[0:3] == diatonic.base_notes:
-                    chords.append(
-                        (self._CRC.to_roman(chord, nscale),
-                         nscale.key.mode,
-                         submode)
-                    )
+            degrees = self._diatonic_degrees(root, scale.key.mode, submode)
+            degree = degrees.get(triad)
+            if degree is not None:
+                chords.append(
+                    (self._diatonic_roman(chord, degree),
+                     scale.key.mode,
+                     submode)
+                )
         return chords
 
+    def _diatonic_degrees(self, root, mode, submode):
+        """Return the scale degree of each diatonic triad of a `Scale`."""
+        idx = (root, mode, submode)
+        degrees = ChordAnalyser._diatonic_index.get(idx)
+        if degrees is None:
+            notes = self._SE.create_scale(root, mode, submode).notes
+            degrees = ChordAnalyser._diatonic_index[idx] = {
+                (notes[i], notes[i+2], notes[i+4]): i + 1 for i in range(7)
+            }
+        return degrees
+
+    def _diatonic_roman(self, chord, degree):
+        """Return the `Roman` of a `Chord` whose triad is diatonic."""
+        # the root is a scale note, so it has no accidental
+        if chord.quality.value in {"major", "augmented", "dominant"}:
+            root = ChordRomanConverter._roman_deg[degree]
+        else:
+            root = ChordRomanConverter._roman_deg[degree].lower()
+        return Roman(
+            root,
+            self._CRC._get_roman_quality(chord),
+            self._CRC._get_roman_inversion(chord),
+        )
+
     def analyse_all(
             self, chord, scale,
             incl_submodes=False,
@@ -120,7 +150,7 @@ class ChordAnalyser:
     ):
         """Analyse if a `Chord` is diatonic to a `Scale` for any mode.
 
-        The `Chord` is analysed against the `Scale` as well as the other modes of the `Scale`.
+        The `Chord` is analysed against the `Scale` as well as the other modes of the `Scale`, starting with the mode of the `Scale`. The `ChordAnalyser` has no state that is changed by the analysis, so it can be used by many threads at once.
 
         Parameters
         ----------
@@ -170,10 +200,15 @@ class ChordAnalyser:
         [(I roman chord, 'major', None), (I roman chord, 'mixolydian', None), (I roman chord, 'lydian', None)]
 
         """
-        self._mode_list.remove(scale.key.mode)
-        self._mode_list.insert(0, scale.key.mode)  # shift to the front
+        # the mode of the scale goes first, followed by the other modes
+        # that are not the same mode under another name
+        shift = Scale._scales[scale.key.mode]
+        modes = [scale.key.mode] + [
+            mode for mode in ChordAnalyser._mode_list
+            if Scale._scales[mode] != shift
+        ]
         chords = []
-        for mode in self._mode_list:
+        for mode in modes:
             nscale = self._SE.create_scale(scale.key.root, mode)
             result = self.analyse_diatonic(
                 chord, nscale, incl_submodes,
@@ -258,17 +293,94 @@ class ChordAnalyser:
 
         """
         # We only care about chords leading to major/minor/dominant chords
-        if next_chord.quality.value not in {"major", "minor", "dominant"}:
+        if next_chord.quality.value not in ChordAnalyser._tonicised:
             return ""
         next_roman = self._CRC.to_roman(next_chord, scale)
+        return self._secondary(
+            prev_chord, next_chord, next_roman, incl_submodes,
+            allow_power_sus, default_power_sus, limit,
+        )
+
+    def analyse_secondary_sequence(
+            self, chords, scale, incl_submodes=False,
+            allow_power_sus=False,
+            default_power_sus="M",
+            limit=True,
+    ):
+        """Analyse the secondary function of each `Chord` of a sequence.
+
+        Each `Chord` is analysed as a secondary chord of the `Chord` after it, as in `analyse_secondary`. The roman numerals of the tonicised `Chords` are found in one pass, the `Scales` they tonicise are shared between songs and each distinct pair of `Chords` is only analysed once, so this is much faster than calling `analyse_secondary` for each pair.
+
+        Parameters
+        ----------
+        chords : iterable of Chord
+            The `Chords` to be analysed, such as the `Chords` of a song.
+        scale : Scale
+            The `Scale` to check against.
+        incl_submodes : boolean, Optional
+            Selector to include the minor submodes if `scale` is minor. Default False when optional.
+        allow_power_sus : boolean, Optional
+            Selector to allow power and sus chords when analysing them. Default False when optional.
+        default_power_sus : {"M", "m"}, Optional
+            The default quality to convert power and sus chords to if analysing them. "M" is major and "m" is minor.
+        limit : boolean, Optional
+            Selector to only check for secondary dominant and leading tone chords. Default True when optional.
+
+        Returns
+        -------
+        list of str
+            The secondary chord notation ``prev_roman``/``next_roman`` of each `Chord`, or an empty string if the `Chord` does not have a secondary function. The last `Chord` does not lead to another `Chord`, so its notation is always empty.
+
+        Examples
+        --------
+        >>> CE = ChordEditor()
+        >>> SE = ScaleEditor()
+        >>> CA = ChordAnalyser()
+        >>> c_scale = SE.create_scale("C")
+        >>> chords = CE.create_chords(["C", "A7", "Dm", "D7", "G", "C"])
+        >>> CA.analyse_secondary_sequence(chords, c_scale)
+        ['', '', '', 'V7/V', '', '']
+        >>> CA.analyse_secondary_sequence(chords, c_scale, incl_submodes=True)
+        ['', 'V7/ii', '', 'V7/V', '', '']
+
+        """
+        chords = list(chords)
+        notations = [str(chord) for chord in chords]
+        # the roman numerals of the chords that can be tonicised
+        targets = {}
+        for notation, chord in zip(notations, chords):
+            if chord.quality.value in ChordAnalyser._tonicised:
+                targets.setdefault(notation, chord)
+        romans = dict(zip(
+            targets, self._CRC.to_roman_sequence(targets.values(), scale)
+        ))
+        known = {}  # the notation of each distinct pair of chords
+        annotations = []
+        for i in range(1, len(chords)):
+            next_roman = romans.get(notations[i])
+            if next_roman is None:  # the next chord cannot be tonicised
+                annotations.append("")
+                continue
+            pair = (notations[i-1], notations[i])
+            annotation = known.get(pair)
+            if annotation is None:
+                annotation = known[pair] = self._secondary(
+                    chords[i-1], chords[i], next_roman, incl_submodes,
+                    allow_power_sus, default_power_sus, limit,
+                )
+            annotations.append(annotation)
+        if chords:
+            annotations.append("")
+        return annotations
+
+    def _secondary(
+            self, prev_chord, next_chord, next_roman, incl_submodes,
+            allow_power_sus, default_power_sus, limit,
+    ):
+        """Get the secondary chord notation of a pair of `Chords`."""
         if next_roman.root in {"i", "I"}:  # ignore tonic next chords
             return ""
-        if next_chord.quality.value == "dominant":
-            next_scale = self._SE.create_scale(next_chord.root, "major")
-        else:
-            next_scale = self._SE.create_scale(
-                next_chord.root, next_chord.quality.value
-            )
+        next_scale = self._tonicised_scale(next_chord)
         results = self.analyse_diatonic(
             prev_chord, next_scale, incl_submodes,
             allow_power_sus, default_power_sus
@@ -277,3 +389,16 @@ class ChordAnalyser:
             return "{}/{}".format(results[0][0], next_roman.root)
         return ""
 
+    def _tonicised_scale(self, chord):
+        """Get the `Scale` tonicised by a major, minor or dominant `Chord`."""
+        root = chord.root.freeze()
+        if chord.quality.value == "dominant":
+            mode = "major"
+        else:
+            mode = chord.quality.value
+        scale = ChordAnalyser._tonicised_scales.get((root, mode))
+        if scale is None:
+            scale = ChordAnalyser._tonicised_scales[root, mode] = (
+                self._SE.create_scale(root, mode)
+            )
+        return scale
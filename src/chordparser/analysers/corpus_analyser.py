@@ -0,0 +1,184 @@
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import io
+import itertools
+import os
+
+from chordparser.analysers.chords_analyser import ChordAnalyser
+from chordparser.editors.chords_editor import ChordEditor
+from chordparser.editors.scales_editor import ScaleEditor
+from chordparser.music.notes import FrozenNote
+from chordparser.readers.chordpro_corpus import CorpusSong
+from chordparser.readers.chordpro_reader import (
+    ChordEvent, ChordProReader, DirectiveEvent,
+)
+
+
+SongAnalysis = namedtuple(
+    'SongAnalysis', ['title', 'key', 'chords', 'romans', 'invalid']
+)
+SongAnalysis.__doc__ = """The analysis of a song by the `CorpusAnalyser`.
+
+The `title` and `key` are the values of the song's directives, or None if the song does not have them. The `chords` are the standardised notations of the song's chords in order, and the `romans` are their diatonic roman numerals in the `key`, or None if a chord is not diatonic or the key is unknown. `invalid` is the number of chords that could not be parsed.
+
+"""
+
+
+class CorpusAnalyser:
+    """An analyser of many ChordPro songs using multiple processes.
+
+    Parsing and analysing `Chords` is CPU-bound, so the `CorpusAnalyser` spreads the songs over worker processes. The songs are sent to the workers in chunks, and each worker builds the note, quality and scale tables once, when it analyses its first chunk. The results are sent back as a `SongAnalysis` of strings, which is much smaller to send between processes than the `Chords`.
+
+    """
+
+    def analyse_corpus(self, songs, workers=None, chunksize=32):
+        """Analyse the chords of ChordPro songs.
+
+        The songs are read lazily and only a few chunks are sent to the workers at a time, so corpora of any size can be analysed.
+
+        Parameters
+        ----------
+        songs : iterable of str, bytes or CorpusSong
+            The ChordPro text of each song, such as a `ChordProCorpus`.
+        workers : int, Optional
+            The number of worker processes. If None, the number of CPUs is used. If 0, the songs are analysed in the current process. Default None when optional.
+        chunksize : int, Optional
+            The number of songs sent to a worker at a time. Default 32 when optional.
+
+        Returns
+        -------
+        iterator of SongAnalysis
+            The analysis of each song, in the same order as the songs.
+
+        Raises
+        ------
+        ValueError
+            If `workers` is negative or `chunksize` is less than 1.
+
+        Examples
+        --------
+        >>> CA = CorpusAnalyser()
+        >>> song = "{t:Song}\\n{key:C}\\n[C]la [Am]la [E7]la"
+        >>> list(CA.analyse_corpus([song], workers=0))
+        [SongAnalysis(title='Song', key='C', chords=('C', 'Am', 'E7'), romans=('I', 'vi', None), invalid=0)]
+
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 0:
+            raise ValueError("The number of workers cannot be negative")
+        if chunksize < 1:
+            raise ValueError("The chunk size must be at least 1")
+        # the arguments are checked now rather than on the first song
+        return self._analyse(self._chunks(songs, chunksize), workers)
+
+    def _analyse(self, chunks, workers):
+        """Yield the analysis of each song of the chunks."""
+        if not workers:
+            for chunk in chunks:
+                yield from _analyse_chunk(chunk)
+            return
+        with ProcessPoolExecutor(workers) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(_analyse_chunk, chunk))
+                # keep a few chunks per worker queued at a time
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    def _chunks(self, songs, chunksize):
+        """Yield lists of the encoded text of the songs."""
+        songs = iter(songs)
+        while True:
+            chunk = [
+                _encode(song) for song in itertools.islice(songs, chunksize)
+            ]
+            if not chunk:
+                return
+            yield chunk
+
+
+def _encode(song):
+    """Return the song as bytes that can be sent to a worker."""
+    if isinstance(song, CorpusSong):
+        return bytes(song.data)
+    if isinstance(song, str):
+        return song.encode('utf-8')
+    return bytes(song)
+
+
+_worker = {}  # the editors of the current process
+
+
+def _init_worker():
+    """Build the editors and warm the tables of a worker process."""
+    if _worker:
+        return
+    SE = ScaleEditor()
+    for note in FrozenNote._spellings:
+        for mode in ('major', 'minor'):
+            try:
+                SE.create_scale(note, mode)
+            except ValueError:
+                pass  # the scale needs more than double accidentals
+    _worker.update(
+        CE=ChordEditor(), SE=SE, CA=ChordAnalyser(), CPR=ChordProReader(),
+    )
+
+
+def _analyse_chunk(chunk):
+    """Analyse the encoded songs of a chunk."""
+    _init_worker()
+    romans = {}  # the roman numerals of the chunk by chord and scale
+    return [_analyse_song(song.decode('utf-8'), romans) for song in chunk]
+
+
+def _analyse_song(text, known):
+    """Analyse the chords of a song."""
+    title = key = scale = None
+    chords = []
+    romans = []
+    invalid = 0
+    for event in _worker['CPR'].read_chordpro(io.StringIO(text)):
+        if isinstance(event, DirectiveEvent):
+            if event.name == 'title' and title is None:
+                title = event.value
+            elif event.name == 'key':
+                key = event.value
+                scale = _scale(key)
+        elif isinstance(event, ChordEvent):
+            if event.chord is None:
+                invalid += 1
+                continue
+            chords.append(str(event.chord))
+            try:
+                roman = known[event.chord, key]
+            except KeyError:
+                roman = known[event.chord, key] = _roman(event.chord, scale)
+            romans.append(roman)
+    return SongAnalysis(title, key, tuple(chords), tuple(romans), invalid)
+
+
+def _scale(key):
+    """Return the scale of a key notation such as 'G' or 'F#m'."""
+    result = _worker['CE'].try_create_chord(key or '', frozen=True)
+    if not result:
+        return None
+    chord = result.value
+    mode = 'minor' if chord.quality.value == 'minor' else 'major'
+    try:
+        return _worker['SE'].create_scale(chord.root, mode)
+    except ValueError:
+        return None
+
+
+def _roman(chord, scale):
+    """Return the diatonic roman numeral of a chord in a scale."""
+    if scale is None:
+        return None
+    analysis = _worker['CA'].analyse_diatonic(chord, scale)
+    if not analysis:
+        return None
+    return str(analysis[0][0])
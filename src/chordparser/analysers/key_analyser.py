@@ -0,0 +1,217 @@
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
+
+from chordparser.editors.keys_editor import KeyEditor
+from chordparser.editors.scales_editor import ScaleEditor
+from chordparser.music.notes import FrozenNote
+from chordparser.music.scales import Scale
+
+
+KeyEstimate = namedtuple('KeyEstimate', ['key', 'score'])
+KeyEstimate.__doc__ = """A candidate `Key` of a song found by the `KeyAnalyser`.
+
+The `key` is a `FrozenKey` and the `score` is how well the `Chords` of the song fit it. Higher scores are better fits.
+
+"""
+
+
+class KeyAnalyser:
+    """An analyser that estimates the `Key` of a sequence of `Chords`.
+
+    Every root in every mode of the `KeyEditor` (and every minor submode) is a candidate `Key`. Each candidate has a profile of weights for the pitch classes of the `Chords` and for their roots: the pitch classes score +1 if they are in the `Scale` of the `Key` and -1 if not, and the roots score by their scale degree, most for the tonic, then the dominant and subdominant. The major and minor modes also score a small bonus, since they are far more common than the other modes. A song's `Chords` are counted into a histogram of pitch classes and roots, and all the candidates are scored at once by multiplying the histograms with the matrix of profiles.
+
+    The `KeyAnalyser` requires NumPy.
+
+    """
+
+    _degree_weights = (2.0, 0.25, 0.25, 0.5, 1.0, 0.25, 0.25)
+    _mode_weights = {
+        ('major', None): 0.1, ('minor', 'natural'): 0.1,
+        ('minor', 'harmonic'): 0.05,
+    }
+    _candidates = ()  # the candidate FrozenKeys
+    _profiles = None  # (25, candidates) weights of pitch classes, roots and mode
+    _mask_bits = None  # (4096, 12) pitch classes of each pitch class mask
+    _SE = ScaleEditor()
+
+    def estimate_key(self, chords, top=1):
+        """Estimate the `Key` of a sequence of `Chords`.
+
+        Parameters
+        ----------
+        chords : iterable of Chord
+            The `Chords` of the song.
+        top : int or None, Optional
+            The number of candidate `Keys` returned. If None, every candidate is returned. Default 1 when optional.
+
+        Returns
+        -------
+        list of KeyEstimate
+            The candidate `Keys` and their scores, best first. The list is empty if there are no `Chords`.
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+
+        Examples
+        --------
+        >>> CE = ChordEditor()
+        >>> KA = KeyAnalyser()
+        >>> chords = CE.create_chords(["Am", "Dm", "E7", "Am"])
+        >>> KA.estimate_key(chords)
+        [KeyEstimate(key=A harmonic minor, score=4.675)]
+        >>> KA.estimate_key(chords, top=2)[1].key
+        A natural minor
+
+        """
+        return self.estimate_keys([chords], top)[0]
+
+    def estimate_keys(self, songs, top=1):
+        """Estimate the `Keys` of many sequences of `Chords`.
+
+        All the songs are scored by a single matrix product, which is much faster than calling `estimate_key` for each song.
+
+        Parameters
+        ----------
+        songs : iterable of iterable of Chord
+            The `Chords` of each song.
+        top : int or None, Optional
+            The number of candidate `Keys` returned for each song. If None, every candidate is returned. Default 1 when optional.
+
+        Returns
+        -------
+        list of list of KeyEstimate
+            The candidate `Keys` and their scores of each song, best first. The list of a song is empty if it has no `Chords`.
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+        ValueError
+            If `top` is less than 1.
+
+        Examples
+        --------
+        >>> CE = ChordEditor()
+        >>> KA = KeyAnalyser()
+        >>> songs = [
+        ...     CE.create_chords(["C", "F", "G", "C"]),
+        ...     CE.create_chords(["Em", "Am", "B7", "Em"]),
+        ... ]
+        >>> [estimates[0].key for estimates in KA.estimate_keys(songs)]
+        [C major, E harmonic minor]
+
+        """
+        if np is None:
+            raise ImportError(
+                "The KeyAnalyser requires NumPy, which can be installed with "
+                "'pip install chordparser[numpy]'"
+            )
+        if top is not None and top < 1:
+            raise ValueError("At least 1 key must be returned")
+        if KeyAnalyser._profiles is None:
+            self._build_profiles()
+        features, lengths = self._key_features(songs)
+        scores = features @ KeyAnalyser._profiles
+        # a stable sort ranks the more common modes first in a tie
+        ranks = np.argsort(-scores, axis=1, kind='stable')[:, :top]
+        candidates = KeyAnalyser._candidates
+        return [
+            [
+                KeyEstimate(candidates[j], float(song_scores[j]))
+                for j in song_ranks
+            ] if length else []
+            for song_scores, song_ranks, length in zip(scores, ranks, lengths)
+        ]
+
+    def _key_features(self, songs):
+        """Return the pitch class and root histogram of each song and the number of its chords.
+
+        The last feature of a song is 1 if it has chords, and adds the weight of the mode.
+
+        """
+        masks = []
+        roots = []
+        lengths = []
+        for song in songs:
+            start = len(masks)
+            for chord in song:
+                masks.append(chord.pitch_class_mask)
+                roots.append(chord.root.freeze()._num)
+            lengths.append(len(masks) - start)
+        lengths = np.array(lengths, dtype=np.intp)
+        songs = len(lengths)
+        features = np.zeros((songs, 25))
+        filled = lengths > 0
+        if filled.any():
+            starts = np.cumsum(lengths) - lengths
+            tones = KeyAnalyser._mask_bits[np.array(masks, dtype=np.intp)]
+            features[filled, :12] = np.add.reduceat(
+                tones, starts[filled], axis=0
+            )
+            song_index = np.repeat(np.arange(songs), lengths)
+            features[:, 12:24] = np.bincount(
+                song_index*12 + np.array(roots, dtype=np.intp),
+                minlength=songs*12,
+            ).reshape(songs, 12)
+            features[filled, :24] /= lengths[filled, None]
+            features[filled, 24] = 1.0
+        return features, lengths
+
+    def _build_profiles(self):
+        """Build the profiles of the candidate `Keys`."""
+        # the modes that are not the same mode under another name
+        modes = []
+        for mode in KeyEditor._modes:
+            if all(Scale._scales[mode] != Scale._scales[m] for m, _ in modes):
+                if mode in KeyEditor._modes_with_submodes:
+                    modes.append((mode, 'natural'))
+                    modes += [
+                        (mode, submode) for submode in KeyEditor._submodes
+                        if submode != 'natural'
+                    ]
+                else:
+                    modes.append((mode, None))
+        candidates = []
+        profiles = []
+        for mode, submode in modes:
+            for pitch in range(12):
+                scale = self._simplest_scale(pitch, mode, submode)
+                profile = [-1.0] * 12 + [0.0] * 12 + [
+                    KeyAnalyser._mode_weights.get((mode, submode), 0.0)
+                ]
+                for degree, note in enumerate(scale.notes[:7]):
+                    profile[note._num] = 1.0
+                    profile[12 + note._num] = (
+                        KeyAnalyser._degree_weights[degree]
+                    )
+                candidates.append(scale.key.freeze())
+                profiles.append(profile)
+        KeyAnalyser._mask_bits = (
+            np.arange(4096)[:, None] >> np.arange(12) & 1
+        ).astype(float)
+        KeyAnalyser._candidates = tuple(candidates)
+        KeyAnalyser._profiles = np.array(profiles).T
+
+    def _simplest_scale(self, pitch, mode, submode):
+        """Return the `Scale` of a root pitch with the fewest accidentals."""
+        scales = []
+        for note in FrozenNote._spellings:
+            if note._num != pitch or abs(note._symbol_num) > 1:
+                continue
+            try:
+                scale = self._SE.create_scale(note, mode, submode)
+            except ValueError:
+                continue  # the scale needs more than double accidentals
+            accidentals = sum(
+                abs(each.freeze()._symbol_num) for each in scale.notes[:7]
+            )
+            scales.append(
+                (accidentals, abs(note._symbol_num), note._symbol_num, scale)
+            )
+        return min(scales, key=lambda x: x[:3])[3]
@@ -0,0 +1,158 @@
+from collections import OrderedDict, namedtuple
+import threading
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class LRUCache:
+    """A bounded mapping that evicts its least recently used entries.
+
+    The `LRUCache` is used by the `Editors` to memoise the objects they parse, so that repeated notations are only parsed once. It keeps count of its hits and misses and is safe to share between threads.
+
+    Parameters
+    ----------
+    maxsize : int or None, Optional
+        The maximum number of entries. If None, the cache is unbounded. If 0, nothing is cached. Default 1024 when optional.
+
+    Attributes
+    ----------
+    hits : int
+        The number of lookups that found an entry.
+    misses : int
+        The number of lookups that did not find an entry.
+
+    """
+
+    def __init__(self, maxsize=1024):
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = None
+        self.hits = 0
+        self.misses = 0
+        self.maxsize = maxsize
+
+    @property
+    def maxsize(self):
+        """int or None: The maximum number of entries of the `LRUCache`.
+
+        Lowering the `maxsize` evicts the least recently used entries until the `LRUCache` fits.
+
+        Raises
+        ------
+        ValueError
+            If the `maxsize` is negative.
+
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value):
+        if value is not None and value < 0:
+            raise ValueError("The cache size cannot be negative")
+        with self._lock:
+            self._maxsize = value
+            self._evict()
+
+    def get(self, key, default=None):
+        """Return the entry for `key`, or `default` if there is none.
+
+        A successful lookup marks the entry as the most recently used.
+
+        Parameters
+        ----------
+        key
+            The key of the entry.
+        default : Optional
+            The value returned if there is no entry. Default None when optional.
+
+        Returns
+        -------
+        The entry for `key`, or `default`.
+
+        Examples
+        --------
+        >>> cache = LRUCache(2)
+        >>> cache.put("C", 1)
+        >>> cache.get("C")
+        1
+        >>> cache.get("D", 0)
+        0
+
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Store an entry, evicting the least recently used entry if the `LRUCache` is full.
+
+        Parameters
+        ----------
+        key
+            The key of the entry.
+        value
+            The entry to be stored.
+
+        Examples
+        --------
+        >>> cache = LRUCache(1)
+        >>> cache.put("C", 1)
+        >>> cache.put("D", 2)
+        >>> cache.get("C") is None
+        True
+
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def _evict(self):
+        """Drop the oldest entries until the cache fits its maxsize."""
+        if self._maxsize is None:
+            return
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries and reset the hit and miss counts."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """Return the statistics of the `LRUCache`.
+
+        Returns
+        -------
+        CacheInfo
+            A named tuple of the `hits`, `misses`, `maxsize` and current size of the `LRUCache`.
+
+        Examples
+        --------
+        >>> cache = LRUCache(4)
+        >>> cache.put("C", 1)
+        >>> cache.get("C")
+        1
+        >>> cache.info()
+        CacheInfo(hits=1, misses=0, maxsize=4, currsize=1)
+
+        """
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self._maxsize, len(self._data)
+            )
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
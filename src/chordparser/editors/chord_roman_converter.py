@@ -3,7 +3,11 @@ import warnings
 
 from chordparser.editors.chords_editor import ChordEditor
 from chordparser.editors.notes_editor import NoteEditor
+from chordparser.editors.quality_editor import QualityEditor
+from chordparser.editors.roman_editor import RomanEditor
 from chordparser.editors.scales_editor import ScaleEditor
+from chordparser.music.chords import FrozenChord
+from chordparser.music.notes import FrozenNote
 from chordparser.music.roman import Roman
 from chordparser.music.scales import Scale
 
@@ -11,7 +15,7 @@ from chordparser.music.scales import Scale
 class ChordRomanConverter:
     """A `Chord`-`Roman` converter.
 
-    The `ChordRomanConverter` can convert `Chords` to `Romans` based on a `Scale` or `Key`.
+    The `ChordRomanConverter` can convert `Chords` to `Romans` and `Romans` to `Chords` based on a `Scale` or `Key`.
 
     """
     _symbols = {
@@ -35,9 +39,37 @@ class ChordRomanConverter:
         'augmented': '+',
         'half-diminished': '\u00f8',
     }
+    _shifts = {
+        '\u266d': -1, '\U0001D12B': -2,
+        '\u266f': +1, '\U0001D12A': +2,
+        '': 0,
+    }
+    _deg_roman = {
+        'I': 1, 'II': 2, 'III': 3,
+        'IV': 4, 'V': 5, 'VI': 6, 'VII': 7,
+    }
+    _q_marks = {
+        '\u00B0': 'diminished',
+        '+': 'augmented',
+        '\u00f8': 'half-diminished',
+    }
+    _figures = {  # inversion -> (extension, chord tone of the bass)
+        (): (None, 0), (6,): (None, 1), (6, 4): (None, 2),
+        (7,): (7, 0), (6, 5): (7, 1), (4, 3): (7, 2), (4, 2): (7, 3),
+        (9,): (9, 0), (11,): (11, 0), (13,): (13, 0),
+    }
+    _chord_qualities = {}  # (quality, extension, major) -> Quality
     _NE = NoteEditor()
     _CE = ChordEditor()
+    _QE = QualityEditor()
+    _RE = RomanEditor()
     _SE = ScaleEditor()
+    _tonicised = frozenset(("major", "minor", "dominant"))
+    _power_sus = frozenset(("power", "sus2", "sus4"))
+    _upper = frozenset(("major", "augmented", "dominant"))
+    _scale_romans = {}  # scale id -> ({letter: (degree, pitch)}, romans)
+    _scale_chords = {}  # scale id -> (notes, {roman: FrozenChord})
+    _max_romans = 4096  # the most romans memoised for each scale
 
     def to_roman(self, chord, scale_key):
         """Converts a `Chord` to `Roman`.
@@ -114,13 +146,14 @@ class ChordRomanConverter:
     def _get_roman_inversion(self, chord):
         """Get Roman inversion notation of the chord."""
         notes = len(chord.base_notes)
-        if chord.inversion and notes <= 4:  # get inversion notation
-            if chord.quality.ext:
-                inv_dict = ChordRomanConverter._inversions_ext
-            else:
-                inv_dict = ChordRomanConverter._inversions
-            return inv_dict.get(chord.inversion, (notes*2-1,))
-        elif notes > 3:
+        if chord.quality.ext:
+            inv_dict = ChordRomanConverter._inversions_ext
+        else:
+            inv_dict = ChordRomanConverter._inversions
+        if chord.inversion in inv_dict and notes <= 4:
+            return inv_dict[chord.inversion]  # get inversion notation
+        # a bass on the root or an added note is written in root position
+        if notes > 3:
             return (notes*2-1,)  # chord extension
         return ()
 
@@ -132,5 +165,264 @@ class ChordRomanConverter:
         q_str += ChordRomanConverter._q_dict.get(chord.quality.value, "")
         return q_str
 
-    # def to_chord(self, roman, scale_key):
-    #     pass
+    def to_roman_sequence(self, chords, scale_key):
+        """Converts a sequence of `Chords` to `Romans`.
+
+        The `Scale` is resolved once for the whole sequence and the `Roman` of each distinct `Chord` notation is memoised for each `Scale`, so this is much faster than calling `to_roman` for every `Chord` of a song. Power and sus chords are defaulted to major chords as in `to_roman`, with a single warning for the whole sequence.
+
+        Parameters
+        ----------
+        chords : iterable of Chord
+            The `Chords` to be converted.
+        scale_key : Scale or Key
+            The `Scale` or `Key` to base the `Romans` on.
+
+        Returns
+        -------
+        list of Roman
+            The `Roman` of each `Chord`, in the same order as the `Chords`.
+
+        Warns
+        -----
+        UserWarning
+            If any of the `Chords` is a power or sus chord.
+
+        Examples
+        --------
+        >>> CE = ChordEditor()
+        >>> CRC = ChordRomanConverter()
+        >>> chords = CE.create_chords(["C", "Am", "Dm7", "G7", "C"])
+        >>> CRC.to_roman_sequence(chords, KeyEditor().create_key("C"))
+        [I roman chord, vi roman chord, ii7 roman chord, V7 roman chord, I roman chord]
+
+        """
+        if isinstance(scale_key, Scale):
+            scale = scale_key
+        else:
+            scale = self._SE.create_scale(scale_key)
+        degrees, known = self._get_scale_romans(scale)
+        romans = []
+        defaulted = 0
+        for chord in chords:
+            if chord.quality.value in ChordRomanConverter._power_sus:
+                defaulted += 1
+            notation = str(chord)
+            roman = known.get(notation)
+            if roman is None:
+                roman = self._sequence_roman(chord, degrees)
+                if len(known) < ChordRomanConverter._max_romans:
+                    known[notation] = roman
+            romans.append(roman)
+        if defaulted:
+            warnings.warn(
+                f"Warning: {defaulted} power and sus chords are defaulted "
+                "to major chords",
+                UserWarning
+            )
+        return romans
+
+    def _get_scale_romans(self, scale):
+        """Get the degree and pitch of each letter of a `Scale` and its memoised `Romans`."""
+        scale_id = self._get_scale_id(scale)
+        entry = ChordRomanConverter._scale_romans.get(scale_id)
+        if entry is None:
+            degrees = {}
+            for degree, note in enumerate(scale.notes[:7], 1):
+                note = note.freeze()
+                degrees.setdefault(note._pos, (degree, note._num))
+            entry = ChordRomanConverter._scale_romans[scale_id] = (degrees, {})
+        return entry
+
+    def _get_scale_id(self, scale):
+        """Get a number that identifies a `Scale` by its spelling and root."""
+        return scale.spelled_mask * 35 + scale.notes[0].freeze()._id
+
+    def _sequence_roman(self, chord, degrees):
+        """Get the `Roman` of a `Chord` from the degrees of its `Scale`."""
+        if chord.quality.value in ChordRomanConverter._power_sus:
+            chord = self._CE.change_chord(chord, quality="Maj", inplace=False)
+        root = chord.root.freeze()
+        degree, pitch = degrees[root._pos]
+        shift = (root._num - pitch) % 12
+        if shift > 12 - shift:
+            shift -= 12
+        numeral = ChordRomanConverter._roman_deg[degree]
+        if chord.quality.value not in ChordRomanConverter._upper:
+            numeral = numeral.lower()
+        return Roman(
+            ChordRomanConverter._symbols[shift] + numeral,
+            self._get_roman_quality(chord),
+            self._get_roman_inversion(chord),
+        )
+
+    def to_chord(self, roman, scale_key, frozen=False):
+        """Converts a `Roman` to `Chord`.
+
+        Realises the `Roman` as a `Chord` in a `Scale` or `Key`. The root of the `Chord` is the scale degree of the `Roman` with its accidental, the quality is read from the case, quality marks and extension of the `Roman`, and an inverted `Roman` has the chord tone of its inversion as the bass. A secondary `Roman` is realised in the major or minor `Scale` of the `Chord` it tonicises. The realised `Chords` are memoised for each `Scale`.
+
+        Parameters
+        ----------
+        roman : Roman or str
+            The `Roman` or `Roman` notation to be converted.
+        scale_key : Scale or Key
+            The `Scale` or `Key` to realise the `Roman` in.
+        frozen : boolean, Optional
+            Selector to return a `FrozenChord`. Default False when optional.
+
+        Returns
+        -------
+        Chord
+            The `Chord` of the `Roman`.
+
+        Raises
+        ------
+        ValueError
+            If the `Roman` does not describe a `Chord`, tonicises a `Chord` that is not major, minor or dominant, or the `Chord` needs more than doublesharps or doubleflats.
+        SyntaxError
+            If the `Roman` notation is invalid.
+
+        Examples
+        --------
+        >>> SE = ScaleEditor()
+        >>> CRC = ChordRomanConverter()
+        >>> c_scale = SE.create_scale("C")
+        >>> CRC.to_chord(Roman("V", "", (6, 5)), c_scale)
+        G7/B chord
+        >>> CRC.to_chord(Roman("vii", "\u00f8", (7,)), c_scale)
+        Bm7\u266d5 chord
+        >>> CRC.to_chord("V7/ii", c_scale)
+        A7 chord
+
+        """
+        return self.to_chords([roman], scale_key, frozen)[0]
+
+    def to_chords(self, romans, scale_key, frozen=False):
+        """Converts a sequence of `Romans` to `Chords`.
+
+        The `Scale` is resolved once for the whole sequence, so this is faster than calling `to_chord` for each `Roman`.
+
+        Parameters
+        ----------
+        romans : iterable of Roman or str
+            The `Romans` or `Roman` notations to be converted.
+        scale_key : Scale or Key
+            The `Scale` or `Key` to realise the `Romans` in.
+        frozen : boolean, Optional
+            Selector to return `FrozenChords`. Default False when optional.
+
+        Returns
+        -------
+        list of Chord
+            The `Chord` of each `Roman`, in the same order as the `Romans`.
+
+        Raises
+        ------
+        ValueError
+            If a `Roman` does not describe a `Chord`, tonicises a `Chord` that is not major, minor or dominant, or the `Chord` needs more than doublesharps or doubleflats.
+        SyntaxError
+            If a `Roman` notation is invalid.
+
+        Examples
+        --------
+        >>> KE = KeyEditor()
+        >>> CRC = ChordRomanConverter()
+        >>> romans = [Roman("ii", "", (7,)), Roman("V", "", (7,)), Roman("I", "", ())]
+        >>> CRC.to_chords(romans, KE.create_key("Bb"))
+        [Cm7 chord, F7 chord, B\u266d chord]
+
+        """
+        if isinstance(scale_key, Scale):
+            scale = scale_key
+        else:
+            scale = self._SE.create_scale(scale_key)
+        scale_id = self._get_scale_id(scale)
+        entry = ChordRomanConverter._scale_chords.get(scale_id)
+        if entry is None:
+            notes = tuple(note.freeze() for note in scale.notes[:7])
+            entry = ChordRomanConverter._scale_chords[scale_id] = (notes, {})
+        notes, known = entry
+        chords = []
+        for roman in romans:
+            chord = known.get(roman)
+            if chord is None:
+                chord = self._realise(roman, notes)
+                if len(known) < ChordRomanConverter._max_romans:
+                    known[roman] = chord
+            chords.append(chord if frozen else chord.thaw())
+        return chords
+
+    def _realise(self, roman, notes):
+        """Realise a `Roman` as a `FrozenChord` from the notes of its `Scale`."""
+        if isinstance(roman, str):
+            roman = self._RE.create_roman(roman)
+        if roman.secondary is not None:
+            target = self._realise(roman.secondary, notes)
+            if target.quality.value not in ChordRomanConverter._tonicised:
+                raise ValueError(f"'{roman.secondary}' cannot be tonicised")
+            if target.quality.value == "minor":
+                scale = self._SE.create_scale(target.root, "minor")
+            else:
+                scale = self._SE.create_scale(target.root, "major")
+            notes = tuple(note.freeze() for note in scale.notes[:7])
+        numeral = roman.root.lstrip(''.join(ChordRomanConverter._shifts))
+        symbol = roman.root[:len(roman.root) - len(numeral)]
+        degree = ChordRomanConverter._deg_roman.get(numeral.upper())
+        shift = ChordRomanConverter._shifts.get(symbol)
+        figures = ChordRomanConverter._figures.get(tuple(roman.inversion))
+        major = roman.quality.startswith('M')
+        mark = roman.quality[1:] if major else roman.quality
+        if mark:
+            value = ChordRomanConverter._q_marks.get(mark)
+        elif numeral.isupper():
+            value = 'major'
+        else:
+            value = 'minor'
+        if None in (degree, shift, figures, value) or (
+                numeral not in {numeral.upper(), numeral.lower()}):
+            raise ValueError(f"'{roman}' is not a valid Roman")
+        ext, tone = figures
+        quality = ChordRomanConverter._chord_qualities.get(
+            (value, ext, major)
+        )
+        if quality is None:
+            raise ValueError(f"'{roman}' is not a valid Roman")
+        note = notes[degree-1]
+        symbol_num = note._symbol_num + shift
+        if not -2 <= symbol_num <= 2:
+            raise ValueError(
+                "Only symbols up to doublesharps and doubleflats are accepted"
+            )
+        root = FrozenNote._spellings[note._pos*5 + symbol_num + 2]
+        chord = FrozenChord(root, quality)
+        bass = chord.base_notes[tone]  # builds and checks the chord tones
+        if tone:
+            chord = FrozenChord(root, quality, bass=bass)
+        return chord
+
+
+def _chord_qualities():
+    """Return the `Quality` of each quality, extension and major mark of a `Roman`."""
+    notations = {
+        ('major', None, False): '',
+        ('minor', None, False): 'm',
+        ('diminished', None, False): 'dim',
+        ('augmented', None, False): 'aug',
+        ('diminished', 7, False): 'dim7',
+    }
+    for ext in (7, 9, 11, 13):
+        notations.update({
+            ('major', ext, False): f'{ext}',
+            ('major', ext, True): f'maj{ext}',
+            ('minor', ext, False): f'm{ext}',
+            ('minor', ext, True): f'mmaj{ext}',
+            ('half-diminished', ext, False): f'm{ext}b5',
+            ('augmented', ext, False): f'aug{ext}',
+            ('augmented', ext, True): f'augmaj{ext}',
+        })
+    return {
+        key: ChordRomanConverter._QE.create_quality(notation)
+        for key, notation in notations.items()
+    }
+
+
+ChordRomanConverter._chord_qualities = _chord_qualities()
@@ -1,9 +1,15 @@
+import itertools
+import numbers
+import operator
 import re
 
+from chordparser.editors.cache import LRUCache
 from chordparser.editors.notes_editor import NoteEditor
+from chordparser.editors.parse_result import ParseResult
 from chordparser.editors.quality_editor import QualityEditor
-from chordparser.music.chords import Chord
+from chordparser.music.chords import Chord, FrozenChord, _spellable
 from chordparser.music.keys import Key
+from chordparser.music.notes import FrozenNote
 from chordparser.music.quality import Quality
 from chordparser.music.scales import Scale
 
@@ -13,10 +19,15 @@ class ChordEditor:
 
     The `ChordEditor` can create a `Chord` from standard chord notation, or by specifying a scale degree based on a `Scale`. It can also change the `Chord`'s attributes.
 
+    Chord notation is read by a single-pass scanner. The regex `_pattern` is kept as a reference implementation that creates the same `Chords`.
+
     """
 
     _NE = NoteEditor()
     _QE = QualityEditor()
+    _cache = LRUCache(4096)
+    _identities = None  # mask*12 + bass -> (root, quality, add) or None
+    _identified = {}  # (mask*12 + bass, use_flats) -> FrozenChord
     _letter_pattern = '[a-gA-G]'
     _flat_pattern = '\u266D|\U0001D12B|bb|b'
     _sharp_pattern = '\u266F|\U0001D12A|##|#'
@@ -24,6 +35,7 @@ class ChordEditor:
     _note_pattern = f"(?:{_letter_pattern})(?:{_symbol_pattern}){{0,1}}"
     _others = f"[^/]+"
     _added = f"(?:add){{0,1}}({_symbol_pattern}){{0,1}}(2|4|6|9|11|13)"
+    _added_regex = re.compile(_added, re.UNICODE)
     _pattern = (
         f"({_note_pattern})"
         f"({_QE.quality_pattern})"
@@ -31,18 +43,24 @@ class ChordEditor:
         f"(?:/({_note_pattern})){{0,1}}"
     )
     _symbols = {
+        '\u266D': '\u266D', '\U0001D12B': '\U0001D12B',
+        '\u266F': '\u266F', '\U0001D12A': '\U0001D12A',
         'b': '\u266D', 'bb': '\U0001D12B',
         '#': '\u266F', '##': '\U0001D12A',
         None: '',
     }
 
-    def create_chord(self, notation):
+    def create_chord(self, notation, frozen=False):
         """Create a `Chord`.
 
+        Repeated notations are served from a parse cache (see `chord_cache_info`). A `FrozenChord` is shared with the cache, while a `Chord` is returned as a copy, so changing a created `Chord` does not affect later ones.
+
         Parameters
         ----------
         notation : str
             The `Chord` notation. Standard chord notation [1]_ is accepted.
+        frozen : boolean, Optional
+            Selector to return an immutable and hashable `FrozenChord`. Default False when optional.
 
         Returns
         -------
@@ -55,6 +73,10 @@ class ChordEditor:
             If the notation is invalid.
         SyntaxError
             If the string of added notes is invalid.
+        ValueError
+            If the quality is invalid.
+        ValueError
+            If the notes of the `Chord` need more than doublesharps or doubleflats.
 
         References
         ----------
@@ -69,17 +91,254 @@ class ChordEditor:
         E\u266dsus\u266f9/G chord
 
         """
+        chord = ChordEditor._cache.get(notation)
+        if chord is None:
+            chord = self._parse_chord(notation).freeze()
+            ChordEditor._cache.put(notation, chord)
+        if frozen:
+            return chord
+        return chord.thaw()
+
+    def try_create_chord(self, notation, frozen=False):
+        """Create a `Chord` without raising an error if the notation is invalid.
+
+        Invalid notations are common in scraped chord sheets, so instead of raising an error, the `Chord` or the reason that it could not be created is returned in a `ParseResult`. The error code is 'root' if the notation does not start with a note, 'quality' if the quality is invalid, 'add' if the added notes are invalid, or 'spelling' if the notes of the `Chord` need more than doublesharps or doubleflats.
+
+        Parameters
+        ----------
+        notation : str
+            The `Chord` notation.
+        frozen : boolean, Optional
+            Selector to return an immutable and hashable `FrozenChord`. Default False when optional.
+
+        Returns
+        -------
+        ParseResult
+            The created `Chord` and the span of its notation, or the error code and the span of the invalid part of the notation.
+
+        Examples
+        --------
+        >>> CE = ChordEditor()
+        >>> CE.try_create_chord("Am7")
+        ParseResult(Am7 chord, span=(0, 3))
+        >>> CE.try_create_chord("N.C.")
+        ParseResult(error='root', span=(0, 4))
+
+        """
+        chord = ChordEditor._cache.get(notation)
+        if chord is None:
+            result = self._try_parse_chord(notation)
+            if not result:
+                return result
+            chord = result.value.freeze()
+            ChordEditor._cache.put(notation, chord)
+        if not frozen:
+            chord = chord.thaw()
+        return ParseResult(chord, span=(0, len(chord.string)))
+
+    def create_chords(self, notations, on_error='raise', frozen=False):
+        """Create a list of `Chords`.
+
+        Each distinct notation is only parsed once per call, and the `Chords` are returned in the same order as their notations.
+
+        Parameters
+        ----------
+        notations : iterable of str
+            The `Chord` notations.
+        on_error : {'raise', 'skip', 'none'}, Optional
+            The handling of invalid notations. If 'raise', the error of the first invalid notation is raised. If 'skip', invalid notations are left out of the list. If 'none', None is put in their place. Default 'raise' when optional.
+        frozen : boolean, Optional
+            Selector to return immutable and hashable `FrozenChords`. Default False when optional.
 
+        Returns
+        -------
+        list of Chord
+            The created `Chords`.
+
+        Raises
+        ------
+        ValueError
+            If `on_error` is not one of the accepted values.
+        SyntaxError
+            If a notation is invalid and `on_error` is 'raise'.
+        ValueError
+            If the quality of a notation is invalid, or its notes need more than doublesharps or doubleflats, and `on_error` is 'raise'.
+
+        Examples
+        --------
+        >>> CE = ChordEditor()
+        >>> CE.create_chords(["C", "Am", "N.C.", "C"], on_error='none')
+        [C chord, Am chord, None, C chord]
+        >>> CE.create_chords(["C", "Am", "N.C.", "C"], on_error='skip')
+        [C chord, Am chord, C chord]
+
+        """
+        if on_error not in {'raise', 'skip', 'none'}:
+            raise ValueError("on_error must be 'raise', 'skip' or 'none'")
+        parsed = {}  # notation -> FrozenChord, or None if invalid
+        chords = []
+        for notation in notations:
+            try:
+                chord = parsed[notation]
+            except KeyError:
+                result = self.try_create_chord(notation, frozen=True)
+                if not result and on_error == 'raise':
+                    raise self._parse_error(notation, result)
+                chord = parsed[notation] = result.value
+            if chord is None:
+                if on_error == 'none':
+                    chords.append(None)
+            elif frozen:
+                chords.append(chord)
+            else:
+                chords.append(chord.thaw())
+        return chords
+
+    def _parse_chord(self, notation):
+        """Parse the chord notation into a new chord."""
+        result = self._try_parse_chord(notation)
+        if not result:
+            raise self._parse_error(notation, result)
+        return result.value
+
+    def _try_parse_chord(self, notation):
+        """Parse the chord notation into a result with a new chord."""
+        scanned = self._scan_chord(notation)
+        if scanned is None:
+            return ParseResult(None, ParseResult.ROOT, (0, len(notation)))
+        root, quality, add, add_pos, bass, end = scanned
+        quality = self._QE._try_scanned_quality(quality, root[0].isupper())
+        if isinstance(quality, str):
+            return ParseResult(
+                None, ParseResult.QUALITY, (len(root), add_pos)
+            )
+        add, span = self._scan_add(add, add_pos)
+        if span:
+            return ParseResult(None, ParseResult.ADD, span)
+        root_note = FrozenNote._table[NoteEditor._notations[root]]
+        bass_note = bass and FrozenNote._table[NoteEditor._notations[bass]]
+        if not _spellable(root_note, quality, add, bass_note):
+            return ParseResult(None, ParseResult.SPELLING, (0, end))
+        chord = Chord(
+            self._parse_root(root),
+            quality,
+            add,
+            self._parse_bass(bass),
+            string=notation[:end],
+        )
+        return ParseResult(chord, span=(0, end))
+
+    def _parse_error(self, notation, result):
+        """Return the error of an invalid parse result."""
+        if result.error == ParseResult.ROOT:
+            return SyntaxError(f"'{notation}' could not be parsed")
+        start, end = result.span
+        if result.error == ParseResult.QUALITY:
+            end, parts = self._QE._scan_quality(notation, start)
+            message = self._QE._try_scanned_quality(
+                parts, notation[0].isupper()
+            )
+            return ValueError(message)
+        if result.error == ParseResult.SPELLING:
+            return ValueError(
+                "Only symbols up to doublesharps and doubleflats are accepted"
+            )
+        return SyntaxError(f"'{notation[start:end]}' could not be parsed")
+
+    def _parse_chord_regex(self, notation):
+        """Parse the chord notation with the reference regex."""
         rgx = re.match(ChordEditor._pattern, notation, re.UNICODE)
         if not rgx:
             raise SyntaxError(f"'{notation}' could not be parsed")
         root, quality, add, bass = self._parse_rgx(rgx)
         return Chord(root, quality, add, bass, string=rgx.group(0))
 
+    def _scan_chord(self, notation):
+        """Scan the chord notation in a single left-to-right pass.
+
+        Return the root, the scanned quality parts, the added notes and their position, the bass and the end of the chord notation, which are the same as the groups that `_pattern` matches. Return None if the notation does not start with a note.
+
+        """
+        root_end = self._scan_note(notation, 0)
+        if not root_end:
+            return None
+        pos, quality = self._QE._scan_quality(notation, root_end)
+        end = notation.find('/', pos)
+        if end < 0:
+            end = len(notation)
+        add = notation[pos:end] or None
+        bass = None
+        bass_end = self._scan_note(notation, end + 1)
+        if bass_end:
+            bass = notation[end+1:bass_end]
+            end = bass_end
+        return notation[:root_end], quality, add, pos, bass, end
+
+    def _scan_note(self, notation, pos):
+        """Return the end of the note at `pos`, or 0 if there is none."""
+        # the longest note is the one that the regex matches
+        for size in (3, 2, 1):
+            note = notation[pos:pos+size]
+            if note in NoteEditor._notations:
+                return pos + len(note)
+        return 0
+
+    def chord_cache_info(self):
+        """Return the statistics of the `Chord` parse cache.
+
+        The parse cache is shared by all `ChordEditors`. It stores the `Chords` of the most recently created notations.
+
+        Returns
+        -------
+        CacheInfo
+            A named tuple of the `hits`, `misses`, `maxsize` and current size of the parse cache.
+
+        Examples
+        --------
+        >>> CE = ChordEditor()
+        >>> CE.clear_chord_cache()
+        >>> c = CE.create_chord("G")
+        >>> c2 = CE.create_chord("G")
+        >>> CE.chord_cache_info()
+        CacheInfo(hits=1, misses=1, maxsize=4096, currsize=1)
+
+        """
+        return ChordEditor._cache.info()
+
+    def clear_chord_cache(self):
+        """Remove all `Chords` from the parse cache and reset its statistics."""
+        ChordEditor._cache.clear()
+
+    def set_chord_cache_size(self, maxsize):
+        """Set the maximum number of notations in the `Chord` parse cache.
+
+        Parameters
+        ----------
+        maxsize : int or None
+            The maximum number of notations. If None, the cache is unbounded. If 0, parsing is not cached.
+
+        Raises
+        ------
+        ValueError
+            If `maxsize` is negative.
+
+        Examples
+        --------
+        >>> CE = ChordEditor()
+        >>> CE.set_chord_cache_size(2)
+        >>> chords = [CE.create_chord(x) for x in ("C", "D", "E")]
+        >>> CE.chord_cache_info().currsize
+        2
+
+        """
+        ChordEditor._cache.maxsize = maxsize
+
     def _parse_rgx(self, rgx):
         """Distribute regex groups and form chord notation."""
         root = self._parse_root(rgx.group(1))
-        quality = self._parse_quality(rgx.group(2), rgx.group(1)[0].isupper())
+        quality = self._QE._create_quality_regex(
+            rgx.group(2), rgx.group(1)[0].isupper()
+        )
         add = self._parse_add(rgx.groups()[-2])
         bass_note = self._parse_bass(rgx.groups()[-1])
         return root, quality, add, bass_note
@@ -94,20 +353,45 @@ class ChordEditor:
 
     def _parse_add(self, string):
         """Parse added notes."""
+        add, span = self._scan_add(string)
+        if span:
+            start, end = span
+            raise SyntaxError(f"'{string[start:end]}' could not be parsed")
+        return add
+
+    def _scan_add(self, string, pos=0):
+        """Scan the added notes in a single pass.
+
+        Anything between the added notes other than whitespace is invalid. Return the added notes and None, or None and the span of the first invalid part. `pos` is the position of `string` in the chord notation.
+
+        """
         if string is None:
-            return None
+            return None, None
         add = []
-        while True:
-            reg = re.search(ChordEditor._added, string, re.UNICODE)
-            if not reg:
-                break
-            foo = (ChordEditor._symbols[reg.group(1)], int(reg.group(2)))
-            add.append(foo)
-            string = ''.join(string.split(reg.group(0)))
-        if string.strip():
-            raise SyntaxError(f"'{string.strip()}' could not be parsed")
+        start = 0
+        for reg in ChordEditor._added_regex.finditer(string):
+            if reg.start() > start:
+                span = self._invalid_span(string, start, reg.start())
+                if span:
+                    return None, (pos + span[0], pos + span[1])
+            start = reg.end()
+            note = (ChordEditor._symbols[reg.group(1)], int(reg.group(2)))
+            if note not in add:  # repeated added notes are only added once
+                add.append(note)
+        span = self._invalid_span(string, start, len(string))
+        if span:
+            return None, (pos + span[0], pos + span[1])
         add.sort(key=lambda x: x[1])  # sort by scale degree
-        return add
+        return add, None
+
+    def _invalid_span(self, string, start, end):
+        """Return the span of the text between `start` and `end` without surrounding whitespace, or None if there is only whitespace."""
+        text = string[start:end]
+        stripped = text.strip()
+        if not stripped:
+            return None
+        start += len(text) - len(text.lstrip())
+        return start, start + len(stripped)
 
     def _parse_bass(self, string):
         """Parse the bass note."""
@@ -154,7 +438,7 @@ class ChordEditor:
             scale_ = Scale(scale_key)
         else:
             scale_ = scale_key
-        root = scale_.notes[degree - 1]
+        root = scale_.notes[degree - 1].thaw()
         bass = None
         add = None
         base_chord = (
@@ -173,6 +457,112 @@ class ChordEditor:
         quality = self._QE.create_quality(q_str)
         return Chord(root, quality, add, bass)
 
+    def identify(self, notes, use_flats=False, frozen=False):
+        """Identify the `Chord` of a set of notes.
+
+        The pitches of the notes and the bass note are looked up in a table of every set of pitches, which is built from the `Quality` catalogue with up to two added notes the first time a `Chord` is identified. The simplest `Chord` is preferred, with the bass as its `root` if possible. A `Chord` with a missing fifth is identified as the full `Chord`.
+
+        Parameters
+        ----------
+        notes : iterable of int, or iterable of Note or str
+            The MIDI note numbers (such as a NumPy integer array), in which case the lowest note is the bass note, or the `Notes` or their notation, in which case the first note is the bass note.
+        use_flats : boolean, Optional
+            Selector to use flats or sharps for black keys when the `root` is not spelt by a `Note`. Default False when optional.
+        frozen : boolean, Optional
+            Selector to return an immutable and hashable `FrozenChord`. Default False when optional.
+
+        Returns
+        -------
+        Chord
+            The identified `Chord`, or None if the notes are not a `Chord`.
+
+        Raises
+        ------
+        SyntaxError
+            If the notation of a note is invalid.
+
+        Examples
+        --------
+        >>> CE = ChordEditor()
+        >>> CE.identify([60, 64, 67, 70])
+        C7 chord
+        >>> CE.identify([52, 60, 67])
+        C/E chord
+        >>> CE.identify(["E", "G", "C", "A"])
+        Am7/E chord
+        >>> CE.identify([61, 65, 68], use_flats=True)
+        D\u266d chord
+
+        """
+        notes = list(notes)
+        if not notes:
+            return None
+        spellings = {}  # pitch -> the first Note spelt with that pitch
+        if isinstance(notes[0], numbers.Integral):
+            # NumPy and other integers are converted to plain ints
+            notes = [operator.index(note) for note in notes]
+            pitches = [note % 12 for note in notes]
+            bass = min(notes) % 12
+        else:
+            notes = [
+                self._NE.create_note(note).freeze() if isinstance(note, str)
+                else note.freeze()
+                for note in notes
+            ]
+            pitches = [note.num_value() for note in notes]
+            bass = pitches[0]
+            for note in reversed(notes):
+                spellings[note.num_value()] = note
+        mask = 0
+        for pitch in pitches:
+            mask |= 1 << pitch
+        if ChordEditor._identities is None:
+            ChordEditor._identities = _build_identities()
+        index = mask*12 + bass
+        identity = ChordEditor._identities[index]
+        if identity is None:
+            return None
+        if spellings:
+            chord = self._identified_chord(
+                identity, bass, spellings, use_flats
+            )
+        else:
+            # chords of MIDI notes only depend on the table entry
+            key = (index, bool(use_flats))
+            chord = ChordEditor._identified.get(key)
+            if chord is None:
+                chord = ChordEditor._identified[key] = self._identified_chord(
+                    identity, bass, spellings, use_flats
+                )
+        if frozen:
+            return chord
+        return chord.thaw()
+
+    def _identified_chord(self, identity, bass, spellings, use_flats):
+        """Return the `FrozenChord` of an identity, spelt from the notes if possible."""
+        root, quality, add = identity
+        for note in (spellings.get(root), self._spelling(root, use_flats)):
+            if note is None:
+                continue
+            chord = FrozenChord(note, quality, add or None)
+            try:
+                notes = chord.notes
+            except ValueError:
+                continue  # the spelling needs more than double accidentals
+            if bass == root:
+                return chord
+            bass_note = next(
+                (x for x in notes if x.num_value() == bass),
+                spellings.get(bass),
+            ) or self._spelling(bass, use_flats)
+            return FrozenChord(note, quality, add or None, bass_note)
+
+    def _spelling(self, pitch, use_flats):
+        """Return the `FrozenNote` of a pitch with sharps or flats."""
+        return FrozenNote._simple_transpositions[
+            FrozenNote._table['C', '']._id*24 + pitch*2 + bool(use_flats)
+        ]
+
     def change_chord(
             self, chord, root=None,
             quality=None, add=None,
@@ -203,7 +593,7 @@ class ChordEditor:
         Returns
         -------
         Chord
-            The changed `Chord`.
+            The changed `Chord`. If `chord` is a `FrozenChord`, a new `FrozenChord` is returned.
 
         Examples
         --------
@@ -217,11 +607,12 @@ class ChordEditor:
         D\u266fmaj7\u266d6 chord
 
         """
+        if isinstance(chord, FrozenChord):
+            return self.change_chord(
+                chord.thaw(), root, quality, add, remove, bass
+            ).freeze()
         if not inplace:
-            chord = Chord(
-                chord.root, chord.quality,
-                chord.add, chord.bass, chord.string
-            )
+            chord = chord.copy()
         if root:
             chord.root = self._parse_root(root)
         if quality:
@@ -249,3 +640,73 @@ class ChordEditor:
             chord.bass = None
         chord.build()
         return chord
+
+
+def _build_identities():
+    """Build the table of the best `Chord` of each set of pitches and bass.
+
+    The `Chords` are scored by their added notes (1 for each natural and 2 for each altered note), a missing fifth (1) and their bass (1 for an inversion and 3 for a bass that is not in the chord), then by the number of notes in the quality, then by how common the quality is.
+
+    """
+    common = (
+        'major', 'minor', 'dominant', 'diminished', 'half-diminished',
+        'sus4', 'sus2', 'augmented', 'power',
+    )
+    # pitch above the root -> the added note with that pitch
+    addable = {
+        1: ('\u266d', 9), 2: ('', 9), 3: ('\u266f', 9), 5: ('', 11),
+        6: ('\u266f', 11), 8: ('\u266d', 13), 9: ('', 6),
+    }
+    best = {}  # (mask, bass) above the root -> (score, quality, add)
+
+    def consider(mask, bass, score, quality, add):
+        known = best.get((mask, bass))
+        if known is None or score < known[0]:
+            best[mask, bass] = (score, quality, add)
+
+    for quality in Quality._qualities:
+        pitches = [0]
+        for interval in quality.intervals:
+            pitches.append((pitches[-1] + interval) % 12)
+        quality_mask = sum(1 << pitch for pitch in set(pitches))
+        rank = (
+            bin(quality_mask).count('1'),
+            common.index(quality.value), quality.flat_ext, quality._id,
+        )
+        variants = [(quality_mask, 0)]
+        if 7 in pitches and len(pitches) > 3:
+            variants.append((quality_mask & ~(1 << 7), 1))  # no fifth
+        extra = [pitch for pitch in addable if not quality_mask >> pitch & 1]
+        for count in range(3):
+            for added in itertools.combinations(extra, count):
+                add = tuple(addable[pitch] for pitch in added)
+                cost = sum(1 if addable[pitch][0] else 0 for pitch in added)
+                cost += count
+                for mask, missing in variants:
+                    mask |= sum(1 << pitch for pitch in added)
+                    for bass in range(12):
+                        if not bass:
+                            slash = 0
+                        elif mask >> bass & 1:
+                            slash = 1  # an inversion
+                        else:
+                            slash = 3  # a bass note that is not in the chord
+                        score = (cost + missing + slash, rank, added)
+                        consider(mask | 1 << bass, bass, score, quality, add)
+    identities = [None] * 4096 * 12
+    for mask in range(1, 4096):
+        for bass in range(12):
+            if not mask >> bass & 1:
+                continue
+            found = None
+            for root in range(12):
+                if not mask >> root & 1:
+                    continue
+                # rotate the mask so that the root is 0
+                relative = (mask >> root | mask << (12 - root)) & 0xFFF
+                known = best.get((relative, (bass - root) % 12))
+                if known and (found is None or known[0] < found[0]):
+                    found = (known[0], root, known[1], known[2])
+            if found:
+                identities[mask*12 + bass] = found[1:]
+    return tuple(identities)
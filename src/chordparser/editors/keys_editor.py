@@ -1,6 +1,6 @@
 from chordparser.editors.notes_editor import NoteEditor
-from chordparser.music.keys import Key
-from chordparser.music.notes import Note
+from chordparser.music.keys import FrozenKey, Key
+from chordparser.music.notes import FrozenNote, Note
 
 
 class ModeError(Exception):
@@ -69,6 +69,8 @@ class KeyEditor:
 
     def _check_root(self, root):
         """Check if root note is valid."""
+        if isinstance(root, FrozenNote):
+            return root.thaw()
         if not isinstance(root, Note):
             root = KeyEditor._NE.create_note(root)
         return root
@@ -102,6 +104,11 @@ class KeyEditor:
         key : Key
             The `Key` to be changed.
 
+        Returns
+        -------
+        Key
+            The changed `Key`. If `key` is a `FrozenKey`, a new `FrozenKey` is returned.
+
         Raises
         ------
         ModeError
@@ -117,6 +124,8 @@ class KeyEditor:
         """
         if key.mode not in {'minor', 'aeolian'}:
             raise ModeError(f"'{key}' is not minor")
+        if isinstance(key, FrozenKey):
+            return self.relative_major(key.thaw()).freeze()
         key.transpose(3, 2)
         key.submode = None
         key.mode = 'major'
@@ -134,6 +143,11 @@ class KeyEditor:
         submode : {'natural', 'harmonic', 'melodic'}, Optional
             The new submode of the relative minor `Key`.
 
+        Returns
+        -------
+        Key
+            The changed `Key`. If `key` is a `FrozenKey`, a new `FrozenKey` is returned.
+
         Raises
         ------
         ModeError
@@ -156,6 +170,8 @@ class KeyEditor:
             raise ModeError(f"'{key}' is not major")
         if submode.lower() not in KeyEditor._submodes:
             raise SyntaxError(f"'{submode}' could not be parsed")
+        if isinstance(key, FrozenKey):
+            return self.relative_minor(key.thaw(), submode).freeze()
         key.transpose(-3, -2)
         key.submode = submode
         key.mode = 'minor'
@@ -182,7 +198,7 @@ class KeyEditor:
         Returns
         -------
         Key
-            The `Key` with the new attributes.
+            The `Key` with the new attributes. If `key` is a `FrozenKey`, a new `FrozenKey` is returned.
 
         Examples
         --------
@@ -196,6 +212,10 @@ class KeyEditor:
         D harmonic minor
 
         """
+        if isinstance(key, FrozenKey):
+            return self.change_key(
+                key.thaw(), root, mode, submode
+            ).freeze()
         if not inplace:
             key = self.create_key(key.root, key.mode, key.submode)
         if root:
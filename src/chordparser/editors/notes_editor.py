@@ -1,6 +1,4 @@
-import re
-
-from chordparser.music.notes import Note
+from chordparser.music.notes import FrozenNote, Note
 
 
 class NoteEditor:
@@ -24,10 +22,11 @@ class NoteEditor:
     _notes_tuple = (
         'C', 'D', 'E', 'F', 'G', 'A', 'B',
         'C', 'D', 'E', 'F', 'G', 'A', 'B')
-    _pattern = (
-        '^([a-gA-G])(\u266F|\u266D|\U0001D12B|\U0001D12A'
-        '|bb|##|b|#){0,1}$'
-    )
+    _notations = {  # every accepted notation -> (letter, symbol)
+        letter + (symbol or ''): (letter.upper(), unicode)
+        for symbol, unicode in _symbol_converter.items()
+        for letter in 'abcdefgABCDEFG'
+    }
 
     def create_note(self, notation):
         """Create a `Note` from its notation.
@@ -63,12 +62,10 @@ class NoteEditor:
 
     def _parse_note(self, notation):
         """Parse the note string."""
-        rgx = re.match(NoteEditor._pattern, notation, re.UNICODE)
-        if not rgx:
-            raise SyntaxError(f"'{notation}' could not be parsed")
-        letter = rgx.group(1).upper()
-        symbol = NoteEditor._symbol_converter.get(rgx.group(2))
-        return letter, symbol
+        try:
+            return NoteEditor._notations[notation]
+        except (KeyError, TypeError):
+            raise SyntaxError(f"'{notation}' could not be parsed") from None
 
     def get_tone_letter(self, *notes):
         """Get the semitone and letter intervals between `Notes`.
@@ -220,7 +217,7 @@ class NoteEditor:
         Returns
         -------
         Note
-            The `Note` with the new notation.
+            The `Note` with the new notation. If `note` is a `FrozenNote`, a new `FrozenNote` is returned.
 
         Examples
         --------
@@ -234,6 +231,8 @@ class NoteEditor:
         B\u266d note
 
         """
+        if isinstance(note, FrozenNote):
+            return self.create_note(notation).freeze()
         if not inplace:
             note = self.create_note("C")
         note.letter, note.symbol = self._parse_note(notation)
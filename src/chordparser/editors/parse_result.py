@@ -0,0 +1,52 @@
+class ParseResult:
+    """The result of parsing a notation without raising an error.
+
+    A `ParseResult` holds either the parsed object or an error code, together with the span of the notation that it refers to. It is true if the notation was parsed.
+
+    Parameters
+    ----------
+    value
+        The parsed object, or None if the notation is invalid.
+    error : str, Optional
+        The error code, or None if the notation was parsed. Default None when optional.
+    span : (int, int), Optional
+        The start and end of the parsed notation, or of the part of the notation that is invalid. Default (0, 0) when optional.
+
+    Attributes
+    ----------
+    value
+        The parsed object, or None if the notation is invalid.
+    error : str
+        The error code, or None if the notation was parsed.
+    span : (int, int)
+        The start and end of the parsed notation, or of the part of the notation that is invalid.
+
+    Examples
+    --------
+    >>> CE = ChordEditor()
+    >>> result = CE.try_create_chord("Cadd9x")
+    >>> result
+    ParseResult(error='add', span=(5, 6))
+    >>> bool(result)
+    False
+
+    """
+
+    __slots__ = ('value', 'error', 'span')
+    ROOT = 'root'  # the notation does not start with a note
+    QUALITY = 'quality'  # the quality is invalid
+    ADD = 'add'  # the added notes are invalid
+    SPELLING = 'spelling'  # the notes need more than double accidentals
+
+    def __init__(self, value, error=None, span=(0, 0)):
+        self.value = value
+        self.error = error
+        self.span = span
+
+    def __bool__(self):
+        return self.error is None
+
+    def __repr__(self):
+        if self.error is None:
+            return f'ParseResult({self.value!r}, span={self.span})'
+        return f'ParseResult(error={self.error!r}, span={self.span})'
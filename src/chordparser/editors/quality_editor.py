@@ -6,7 +6,7 @@ from chordparser.music.quality import Quality
 class QualityEditor:
     """A `Quality` editor for creating `Chords'` `Qualities`.
 
-    The `QualityEditor` can create a `Chord`'s `Quality` from its notation.
+    The `QualityEditor` can create a `Chord`'s `Quality` from its notation. The notation is read by a table-driven scanner in a single pass. The regex `quality_pattern` is kept as a reference implementation, and the scanner finds the same groups as the regex.
 
     Attributes
     ----------
@@ -43,6 +43,19 @@ class QualityEditor:
         f"({_suspended}){{0,1}}"
     )
 
+    # Tokens of the patterns in regex alternation order
+    _flat_tokens = ('\u266D', '\U0001D12B', 'bb', 'b')
+    _sharp_tokens = ('\u266F', '\U0001D12A', '##', '#')
+    _major_tokens = ('Maj', 'Ma', 'M', 'maj', '\u0394')
+    _minor_tokens = ('min', 'm', '-')
+    _dim_tokens = ('dim', 'o', '\u00B0')
+    _aug_tokens = ('aug', '+')
+    _halfdim_tokens = ('\u00f8', '\u00d8')
+    _degree_tokens = ('7', '9', '11', '13')
+    _scan_tables = ()  # tries of notations, with priorities at key None
+    _scan_groups = ()  # priority -> regex groups
+    _scanned = {}  # (parts, capital_note) -> Quality or error message
+
     # Pattern notation [regex group]
     # Match string [0]:
     #     {
@@ -73,7 +86,7 @@ class QualityEditor:
     def create_quality(self, notation, capital_note=True):
         """Create a `Quality`.
 
-        Create a `Quality` from its notation and whether the `root` of the `Chord` was uppercase.
+        Create a `Quality` from its notation and whether the `root` of the `Chord` was uppercase. The same catalogued `Quality` is returned for every notation of the same quality.
 
         Parameters
         ----------
@@ -85,7 +98,7 @@ class QualityEditor:
         Returns
         -------
         Quality
-            The created `Quality`.
+            The catalogued `Quality`.
 
         Examples
         --------
@@ -100,7 +113,77 @@ class QualityEditor:
             if capital_note:
                 return Quality("major")
             return Quality("minor")
+        end, parts = self._scan_quality(notation)
+        return self._scanned_quality(parts, capital_note)
+
+    def _create_quality_regex(self, notation, capital_note=True):
+        """Create a quality with the reference regex."""
+        if notation is None:
+            return self.create_quality(notation, capital_note)
         rgx = re.match(QualityEditor.quality_pattern, notation, re.UNICODE)
+        return self._create_quality(rgx, capital_note)
+
+    def _scan_quality(self, notation, pos=0):
+        """Scan the quality notation from `pos` in a single pass.
+
+        Each part of the quality is read by walking a trie of every notation the part can have. Where more than one notation matches, the one that the regex would try first is chosen. Return the end of the quality notation and the numbers of the notations of its parts.
+
+        """
+        end = pos
+        parts = []
+        for trie in QualityEditor._scan_tables:
+            found = None
+            node = trie
+            for stop in range(end, len(notation)):
+                node = node.get(notation[stop])
+                if node is None:
+                    break
+                entry = node.get(None)
+                if entry is not None and (found is None or entry < found):
+                    found = entry
+                    found_stop = stop + 1
+            parts.append(found)
+            if found is not None:
+                end = found_stop
+        return end, tuple(parts)
+
+    def _match_quality(self, notation, pos, end, parts):
+        """Return the groups of the scanned quality as a `_QualityMatch`."""
+        groups = [None] * 23
+        for part in parts:
+            if part is not None:
+                for idx, value in QualityEditor._scan_groups[part]:
+                    groups[idx] = value
+        groups[0] = notation[pos:end]
+        return _QualityMatch(groups)
+
+    def _scanned_quality(self, parts, capital_note):
+        """Return the quality of the scanned parts."""
+        quality = self._try_scanned_quality(parts, capital_note)
+        if isinstance(quality, str):
+            raise ValueError(quality)
+        return quality
+
+    def _try_scanned_quality(self, parts, capital_note):
+        """Return the quality of the scanned parts, or the error message if the parts do not form a valid quality.
+
+        There are a limited number of parts, so each `Quality` is only worked out once from its groups.
+
+        """
+        try:
+            return QualityEditor._scanned[parts, capital_note]
+        except KeyError:
+            pass
+        rgx = self._match_quality('', 0, 0, parts)
+        try:
+            quality = self._create_quality(rgx, capital_note)
+        except ValueError as error:
+            quality = str(error)
+        QualityEditor._scanned[parts, capital_note] = quality
+        return quality
+
+    def _create_quality(self, rgx, capital_note):
+        """Create the quality from the groups of the quality pattern."""
         if rgx.group(2):  # power
             return Quality("power")
         alt5 = self._parse_alt5(rgx.group(20))
@@ -194,3 +277,86 @@ class QualityEditor:
         if flat:
             return True
         return False
+
+
+class _QualityMatch(tuple):
+    """The groups of `QualityEditor.quality_pattern` found by the scanner.
+
+    The groups can be read with `group` like those of a regex match.
+
+    """
+
+    __slots__ = ()
+
+    def group(self, index=0):
+        return self[index]
+
+    def groups(self):
+        return self[1:]
+
+
+def _build_scan_tables():
+    """Build the scanner tables of the quality notation.
+
+    The tries hold every notation of each part of the quality, numbered in the order that the regex tries them. The groups that the regex would match are listed by that number.
+
+    """
+    QE = QualityEditor
+    main = []  # power chords, extended chords and triads
+    main.append(('5', ((1, '5'), (2, '5'))))
+    prefixes = []
+    for group, tokens in (
+            (5, [x + y for x in QE._minor_tokens for y in QE._major_tokens]),
+            (6, [x + y for x in QE._aug_tokens for y in QE._major_tokens]),
+            (7, QE._aug_tokens),
+            (8, QE._dim_tokens),
+            (9, QE._halfdim_tokens),
+            (10, QE._major_tokens),
+            (11, QE._minor_tokens),
+    ):
+        prefixes.extend((x, ((4, x), (group, x))) for x in tokens)
+    prefixes.append(('', ()))  # dominant, or minor if the note is lowercase
+    for first, prefix in prefixes:
+        for flat in QE._flat_tokens + (None,):
+            for degree in QE._degree_tokens:
+                ext = (flat or '') + degree
+                string = first + ext
+                main.append((string, prefix + (
+                    (1, string), (3, string),
+                    (12, ext), (13, flat), (14, degree),
+                )))
+    for group, tokens in (
+            (16, QE._aug_tokens),
+            (17, QE._dim_tokens),
+            (18, QE._major_tokens),
+            (19, QE._minor_tokens),
+    ):
+        main.extend(((x, ((1, x), (15, x), (group, x))) for x in tokens))
+    altered = [
+        (x + '5', ((20, x),))
+        for x in (
+            QE._dim_tokens + QE._aug_tokens
+            + QE._flat_tokens + QE._sharp_tokens
+        )
+    ]
+    suspended = [
+        ('sus2', ((21, 'sus2'), (22, '2'))),
+        ('sus4', ((21, 'sus4'), (22, '4'))),
+        ('sus', ((21, 'sus'),)),
+    ]
+    tries = []
+    entries = []
+    for part in (main, altered, suspended):
+        trie = {}
+        for string, groups in part:
+            node = trie
+            for char in string:
+                node = node.setdefault(char, {})
+            # the regex tries the first entry of a notation first
+            node.setdefault(None, len(entries))
+            entries.append(groups)
+        tries.append(trie)
+    return tuple(tries), tuple(entries)
+
+
+QualityEditor._scan_tables, QualityEditor._scan_groups = _build_scan_tables()
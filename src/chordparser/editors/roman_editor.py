@@ -0,0 +1,102 @@
+import re
+
+from chordparser.editors.cache import LRUCache
+from chordparser.music.roman import Roman
+
+
+class RomanEditor:
+    """A `Roman` editor that can create `Romans` from their notation.
+
+    Created `Romans` are interned: every notation of the same `Roman` returns the same immutable `Roman`, so `Romans` read from user queries and corpora can be compared and hashed without being parsed again. The interned `Romans` are kept for the lifetime of the program, while only the most recent notations are cached.
+
+    """
+
+    _symbols = {
+        '\u266d': '\u266d', '\U0001D12B': '\U0001D12B',
+        '\u266f': '\u266f', '\U0001D12A': '\U0001D12A',
+        'b': '\u266d', 'bb': '\U0001D12B',
+        '#': '\u266f', '##': '\U0001D12A',
+        None: '',
+    }
+    _marks = {
+        '\u00B0': '\u00B0', 'o': '\u00B0',
+        '\u00f8': '\u00f8', '\u00d8': '\u00f8',
+        '+': '+',
+        None: '',
+    }
+    _figures = {
+        None: (),
+        '6': (6,), '64': (6, 4),
+        '7': (7,), '65': (6, 5), '43': (4, 3), '42': (4, 2),
+        '9': (9,), '11': (11,), '13': (13,),
+    }
+    _pattern = re.compile(
+        '(\u266d|\U0001D12B|\u266f|\U0001D12A|bb|b|##|#)?'
+        '(VII|VI|V|IV|III|II|I|vii|vi|v|iv|iii|ii|i)'
+        '(M)?'
+        '(\u00B0|o|\u00f8|\u00d8|\\+)?'
+        '(13|11|9|7|65|64|6|43|42)?'
+        '(?:/(.+))?',
+        re.UNICODE
+    )
+    _romans = LRUCache(4096)  # notation -> Roman
+    _interned = {}  # standard notation -> Roman
+
+    def create_roman(self, notation):
+        """Create a `Roman` from its notation.
+
+        Accepts a roman numeral from I to VII (uppercase for major and lowercase for minor) with an optional accidental (b, bb, #, ##, or their respective unicode characters \u266d, \U0001D12B, \u266f, or \U0001D12A), followed by an optional M for a major seventh, an optional quality mark (\u00B0 or o for diminished, \u00f8 for half-diminished and + for augmented) and optional inversion figures (6, 64, 7, 65, 43, 42, 9, 11 or 13). A secondary chord is written with a slash and the `Roman` it tonicises.
+
+        Parameters
+        ----------
+        notation : str
+            The notation of the `Roman`.
+
+        Returns
+        -------
+        Roman
+            The interned `Roman` of the notation.
+
+        Raises
+        ------
+        SyntaxError
+            If the notation does not follow accepted notation.
+
+        Examples
+        --------
+        >>> RE = RomanEditor()
+        >>> RE.create_roman("bVII")
+        \u266dVII roman chord
+        >>> RE.create_roman("viio65")
+        vii\u00B065 roman chord
+        >>> RE.create_roman("V7/V")
+        V7/V roman chord
+        >>> RE.create_roman("bVII") is RE.create_roman("\u266dVII")
+        True
+
+        """
+        roman = RomanEditor._romans.get(notation)
+        if roman is None:
+            roman = self._parse_roman(notation)
+            # share the Roman between all notations of it
+            roman = RomanEditor._interned.setdefault(str(roman), roman)
+            RomanEditor._romans.put(notation, roman)
+        return roman
+
+    def _parse_roman(self, notation):
+        """Parse the roman string."""
+        try:
+            rgx = RomanEditor._pattern.fullmatch(notation)
+        except TypeError:
+            rgx = None
+        if not rgx:
+            raise SyntaxError(f"'{notation}' could not be parsed")
+        symbol, numeral, major, mark, figures, secondary = rgx.groups()
+        if secondary is not None:
+            secondary = self.create_roman(secondary)
+        return Roman(
+            RomanEditor._symbols[symbol] + numeral,
+            (major or '') + RomanEditor._marks[mark],
+            RomanEditor._figures[figures],
+            secondary,
+        )
@@ -87,6 +87,6 @@ class ScaleEditor:
         """
         if not inplace:
             scale = self.create_scale(scale.key)
-        self._KE.change_key(scale.key, *args, **kwargs)
+        scale.key = self._KE.change_key(scale.key, *args, **kwargs)
         scale.build()
         return scale
@@ -0,0 +1,432 @@
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
+
+from chordparser.editors.chords_editor import ChordEditor
+from chordparser.music.chords import (
+    FrozenChord, _spelled_add, _spelled_bass, _spelled_table,
+)
+from chordparser.music.notes import FrozenNote, Note
+from chordparser.music.quality import Quality
+
+
+class ChordArray:
+    """A compact array of `Chords` stored column-wise.
+
+    Each `Chord` is stored as four integers in NumPy arrays: the spelling id of its `root`, the catalogue id of its `quality`, a bitmask of its `add` notes and the spelling id of its `bass`. A million `Chords` take about 8 MB, instead of the Python objects of each `Chord`. Indexing, slicing, boolean masks and concatenation work on the columns directly, and `Chords` and notations are only created for the distinct `Chords` when converting back.
+
+    The `ChordArray` requires NumPy, which can be installed with ``pip install chordparser[numpy]``.
+
+    Parameters
+    ----------
+    root : array_like of int
+        The spelling id of the `root` of each `Chord`.
+    quality : array_like of int
+        The catalogue id of the `quality` of each `Chord`.
+    add : array_like of int
+        The bitmask of the `add` notes of each `Chord`.
+    bass : array_like of int
+        The spelling id of the `bass` of each `Chord`, or -1 if it has no `bass`.
+
+    Attributes
+    ----------
+    root : numpy.ndarray of int8
+        The spelling id of the `root` of each `Chord`.
+    quality : numpy.ndarray of int16
+        The catalogue id of the `quality` of each `Chord`.
+    add : numpy.ndarray of uint32
+        The bitmask of the `add` notes of each `Chord`.
+    bass : numpy.ndarray of int8
+        The spelling id of the `bass` of each `Chord`, or -1 if it has no `bass`.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    ValueError
+        If the columns do not have the same length.
+
+    Notes
+    -----
+    The spelling id of a `Note` is ``5*letter + accidental + 2``, where the letter is 0 for C to 6 for B and the accidental is -2 for a doubleflat to +2 for a doublesharp. The 30 bits of the `add` bitmask are the added notes ``5*degree + accidental + 2``, where the degree is the position of the added scale degree in (2, 4, 6, 9, 11, 13). Added notes of the same scale degree are therefore ordered by their accidental when converted back to a `Chord`.
+
+    Examples
+    --------
+    >>> chords = ChordArray.from_strings(["C", "Am7", "F/C", "G7"])
+    >>> chords
+    ChordArray(['C', 'Am7', 'F/C', 'G7'])
+    >>> chords[chords.bass >= 0]
+    ChordArray(['F/C'])
+    >>> chords[1]
+    Am7 chord
+
+    """
+
+    __slots__ = ('root', 'quality', 'add', 'bass')
+    _degrees = (2, 4, 6, 9, 11, 13)
+    _CE = ChordEditor()
+
+    def __init__(self, root, quality, add, bass):
+        if np is None:
+            raise ImportError(
+                "The ChordArray requires NumPy, which can be installed with "
+                "'pip install chordparser[numpy]'"
+            )
+        self.root = np.asarray(root, dtype=np.int8)
+        self.quality = np.asarray(quality, dtype=np.int16)
+        self.add = np.asarray(add, dtype=np.uint32)
+        self.bass = np.asarray(bass, dtype=np.int8)
+        if not (
+                self.root.shape == self.quality.shape
+                == self.add.shape == self.bass.shape):
+            raise ValueError("The columns must have the same length")
+
+    @classmethod
+    def from_chords(cls, chords):
+        """Create a `ChordArray` from `Chords`.
+
+        Parameters
+        ----------
+        chords : iterable of Chord
+            The `Chords`.
+
+        Returns
+        -------
+        ChordArray
+            The `ChordArray` of the `Chords`.
+
+        Raises
+        ------
+        ValueError
+            If a `Chord` has an added note that is not a 2nd, 4th, 6th, 9th, 11th or 13th.
+
+        """
+        return cls._from_codes([cls._encode(chord) for chord in chords])
+
+    @classmethod
+    def from_strings(cls, notations, on_error='raise'):
+        """Create a `ChordArray` from `Chord` notations.
+
+        Each distinct notation is only parsed once.
+
+        Parameters
+        ----------
+        notations : iterable of str
+            The `Chord` notations.
+        on_error : {'raise', 'skip'}, Optional
+            The handling of invalid notations. If 'raise', the error of the first invalid notation is raised. If 'skip', invalid notations are left out. Default 'raise' when optional.
+
+        Returns
+        -------
+        ChordArray
+            The `ChordArray` of the `Chords`.
+
+        Raises
+        ------
+        ValueError
+            If `on_error` is not one of the accepted values.
+        SyntaxError
+            If a notation is invalid and `on_error` is 'raise'.
+        ValueError
+            If the quality of a notation is invalid, or its notes need more than doublesharps or doubleflats, and `on_error` is 'raise'.
+
+        """
+        if on_error not in {'raise', 'skip'}:
+            raise ValueError("on_error must be 'raise' or 'skip'")
+        known = {}  # notation -> code, or None if invalid
+        codes = []
+        for notation in notations:
+            try:
+                code = known[notation]
+            except KeyError:
+                result = cls._CE.try_create_chord(notation, frozen=True)
+                if result:
+                    code = cls._encode(result.value)
+                elif on_error == 'raise':
+                    raise cls._CE._parse_error(notation, result)
+                else:
+                    code = None
+                known[notation] = code
+            if code is not None:
+                codes.append(code)
+        return cls._from_codes(codes)
+
+    @classmethod
+    def concatenate(cls, arrays):
+        """Join `ChordArrays` end to end.
+
+        Parameters
+        ----------
+        arrays : iterable of ChordArray
+            The `ChordArrays` to join.
+
+        Returns
+        -------
+        ChordArray
+            The joined `ChordArray`.
+
+        Examples
+        --------
+        >>> a = ChordArray.from_strings(["C", "G"])
+        >>> b = ChordArray.from_strings(["Am"])
+        >>> ChordArray.concatenate([a, b])
+        ChordArray(['C', 'G', 'Am'])
+
+        """
+        arrays = list(arrays)
+        if not arrays:
+            return cls._from_codes([])
+        return cls(*(
+            np.concatenate([getattr(array, column) for array in arrays])
+            for column in cls.__slots__
+        ))
+
+    @classmethod
+    def _from_codes(cls, codes):
+        """Create a `ChordArray` from the codes of its `Chords`."""
+        if np is None:
+            return cls((), (), (), ())  # raises the ImportError
+        codes = np.array(codes, dtype=np.int64)
+        return cls(
+            codes & 0x3F,
+            codes >> 12 & 0xFFFF,
+            codes >> 28,
+            (codes >> 6 & 0x3F) - 1,
+        )
+
+    @classmethod
+    def _encode(cls, chord):
+        """Return the code of a `Chord` as a single integer."""
+        add = 0
+        for symbol, degree in chord.add or ():
+            try:
+                bit = cls._degrees.index(degree)*5
+            except ValueError:
+                raise ValueError(
+                    f"Added note {symbol}{degree} cannot be stored"
+                ) from None
+            add |= 1 << bit + Note._symbol_signs[symbol] + 2
+        bass = chord.bass.freeze()._id + 1 if chord.bass else 0
+        return (
+            chord.root.freeze()._id
+            | bass << 6
+            | chord.quality._id << 12
+            | add << 28
+        )
+
+    def _codes(self):
+        """Return the code of each `Chord`."""
+        return (
+            self.root.astype(np.int64)
+            | (self.bass.astype(np.int64) + 1) << 6
+            | self.quality.astype(np.int64) << 12
+            | self.add.astype(np.int64) << 28
+        )
+
+    @classmethod
+    def _decode(cls, code):
+        """Return the `FrozenChord` of a code."""
+        bass = code >> 6 & 0x3F
+        add = code >> 28
+        return FrozenChord(
+            FrozenNote._spellings[code & 0x3F],
+            Quality._qualities[code >> 12 & 0xFFFF],
+            tuple(
+                (Note._symbols[bit % 5 - 2], cls._degrees[bit // 5])
+                for bit in range(30)
+                if add >> bit & 1
+            ),
+            FrozenNote._spellings[bass - 1] if bass else None,
+        )
+
+    def _distinct(self, convert):
+        """Apply `convert` to each distinct `Chord` and return the results in order."""
+        codes, inverse = np.unique(self._codes(), return_inverse=True)
+        values = [convert(self._decode(int(code))) for code in codes]
+        return [values[i] for i in inverse.ravel()]
+
+    def to_chords(self, frozen=True):
+        """Return the `Chords` of the `ChordArray`.
+
+        Parameters
+        ----------
+        frozen : boolean, Optional
+            Selector to return immutable and hashable `FrozenChords`, which are shared between repeated `Chords`. Default True when optional.
+
+        Returns
+        -------
+        list of Chord
+            The `Chords` in order.
+
+        """
+        chords = self._distinct(lambda chord: chord)
+        if frozen:
+            return chords
+        return [chord.thaw() for chord in chords]
+
+    def to_strings(self):
+        """Return the notations of the `Chords` of the `ChordArray`.
+
+        Returns
+        -------
+        list of str
+            The standardised notation of each `Chord` in order.
+
+        """
+        return self._distinct(str)
+
+    def transpose(self, semitones, letters):
+        """Return the `ChordArray` transposed by semitone and letter intervals.
+
+        The `root` and `bass` of each `Chord` are transposed exactly as by `Chord.transpose`, using lookup tables of the transposition of each spelling, and the transposed `Chords` are checked against the same spelling tables as a `Chord`.
+
+        Parameters
+        ----------
+        semitones : int or array_like of int
+            The difference in semitones to the new transposed `roots`, either for all `Chords` or for each `Chord`.
+        letters : int or array_like of int
+            The difference in scale degrees to the new transposed `roots`, either for all `Chords` or for each `Chord`.
+
+        Returns
+        -------
+        ChordArray
+            The transposed `ChordArray`.
+
+        Raises
+        ------
+        ValueError
+            If the notes of a transposed `Chord` need more than doublesharps or doubleflats.
+
+        Examples
+        --------
+        >>> chords = ChordArray.from_strings(["C", "Am7", "F/C"])
+        >>> chords.transpose(6, 3)
+        ChordArray(['F\u266f', 'D\u266fm7', 'B/F\u266f'])
+
+        """
+        semitones = np.remainder(semitones, 12)
+        letters = np.remainder(letters, 7)
+        root = ChordArray._transpositions[self.root, semitones, letters]
+        return self._transposed(root, semitones, letters)
+
+    def transpose_simple(self, semitones, use_flats=False):
+        """Return the `ChordArray` transposed by semitone intervals.
+
+        The `root` of each `Chord` is spelt with sharps or flats, and the `bass` is transposed exactly by the interval between the old and new `root`, as by `Chord.transpose_simple`.
+
+        Parameters
+        ----------
+        semitones : int or array_like of int
+            The difference in semitones to the new transposed `roots`, either for all `Chords` or for each `Chord`.
+        use_flats : boolean, Optional
+            Selector to use flats or sharps for black keys. Default False when optional.
+
+        Returns
+        -------
+        ChordArray
+            The transposed `ChordArray`.
+
+        Raises
+        ------
+        ValueError
+            If the notes of a transposed `Chord` need more than doublesharps or doubleflats.
+
+        Examples
+        --------
+        >>> chords = ChordArray.from_strings(["C", "Am7", "F/C"])
+        >>> chords.transpose_simple(1, use_flats=True)
+        ChordArray(['D\u266d', 'B\u266dm7', 'G\u266d/D\u266d'])
+
+        """
+        semitones = np.remainder(semitones, 12)
+        root = ChordArray._simple_transpositions[
+            self.root, semitones, int(bool(use_flats))
+        ]
+        positions = ChordArray._positions
+        letters = (positions[root] - positions[self.root]) % 7
+        return self._transposed(root, semitones, letters)
+
+    def _transposed(self, root, semitones, letters):
+        """Return a `ChordArray` with the new `root` and the `bass` transposed exactly."""
+        has_bass = self.bass >= 0
+        bass = ChordArray._transpositions[self.bass, semitones, letters]
+        bass = np.where(has_bass, bass, -1)
+        if (
+                (root < 0).any() or (bass[has_bass] < 0).any()
+                or not self._spelled(root, bass).all()):
+            raise ValueError(
+                "Only symbols up to doublesharps and doubleflats are accepted"
+            )
+        return ChordArray(root, self.quality, self.add, bass)
+
+    def _spelled(self, root, bass):
+        """Return if the notes of each `Chord` with a new `root` and `bass` need at most double accidentals, as checked by `Chord.build`."""
+        root = np.broadcast_to(root, self.root.shape)
+        bass = np.broadcast_to(bass, self.bass.shape)
+        return (
+            ChordArray._spelled_qualities[root, self.quality]
+            & (self.add & ~ChordArray._spelled_add[root] == 0)
+            & ((bass < 0) | ChordArray._spelled_bass[root, bass])
+        )
+
+    def __len__(self):
+        return len(self.root)
+
+    def __iter__(self):
+        return iter(self.to_chords())
+
+    def __getitem__(self, index):
+        """Return the `FrozenChord` at an integer index, or a `ChordArray` of a slice, boolean mask or integer array."""
+        if isinstance(index, (int, np.integer)):
+            return self._decode(
+                int(self.root[index])
+                | (int(self.bass[index]) + 1) << 6
+                | int(self.quality[index]) << 12
+                | int(self.add[index]) << 28
+            )
+        return ChordArray(*(
+            getattr(self, column)[index] for column in ChordArray.__slots__
+        ))
+
+    def __repr__(self):
+        if len(self) > 6:
+            head = self[:3].to_strings()
+            tail = self[-3:].to_strings()
+            return f"ChordArray({str(head)[:-1]}, ..., {str(tail)[1:]})"
+        return f'ChordArray({self.to_strings()})'
+
+
+if np is not None:
+    # spelling id, semitones, letters -> spelling id, or -1 if it needs
+    # more than a double accidental
+    ChordArray._transpositions = np.array([
+        -1 if note is None else note._id
+        for note in FrozenNote._transpositions
+    ], dtype=np.int8).reshape(35, 12, 7)
+    # spelling id, semitones, use_flats -> spelling id
+    ChordArray._simple_transpositions = np.array([
+        note._id for note in FrozenNote._simple_transpositions
+    ], dtype=np.int8).reshape(35, 12, 2)
+    # spelling id -> letter position
+    ChordArray._positions = np.array([
+        note._pos for note in FrozenNote._spellings
+    ], dtype=np.int8)
+    # spelling id, quality id -> whether the root and quality can be spelled
+    ChordArray._spelled_qualities = np.array(
+        _spelled_table(), dtype=bool
+    ).reshape(35, -1)
+
+    # spelling id -> bitmask of the add notes that can be spelled
+    ChordArray._spelled_add = np.array([
+        sum(
+            1 << bit for bit in range(30)
+            if _spelled_add(root, bit % 5 - 2, ChordArray._degrees[bit // 5])
+        )
+        for root in FrozenNote._spellings
+    ], dtype=np.uint32)
+    # spelling id, bass spelling id -> whether the bass can be spelled
+    ChordArray._spelled_bass = np.array([
+        [_spelled_bass(root, bass) for bass in FrozenNote._spellings]
+        for root in FrozenNote._spellings
+    ], dtype=bool)
@@ -1,14 +1,18 @@
 from chordparser.editors.notes_editor import NoteEditor
 from chordparser.editors.scales_editor import ScaleEditor
+from chordparser.music.frozen import Frozen
 from chordparser.music.keys import Key
-from chordparser.music.notes import Note
+from chordparser.music.notes import FrozenNote, Note
+from chordparser.music.pitch_set import (
+    PitchSet, _pitch_class_mask, _spelled_mask,
+)
 from chordparser.music.quality import Quality
 
 
-class Chord:
+class Chord(PitchSet):
     """A musical class representing a chord.
 
-    The `Chord` is composed of a `root` `Note`, `quality`, optional `add` `Notes` and an optional `bass` `Note`. It automatically builds its `notes` from these components. When printed, a standardised short notation meant for chord sheets is displayed.
+    The `Chord` is composed of a `root` `Note`, `quality`, optional `add` `Notes` and an optional `bass` `Note`. It automatically builds its `notes` from these components when they are first accessed. When printed, a standardised short notation meant for chord sheets is displayed.
 
     Parameters
     ----------
@@ -49,11 +53,34 @@ class Chord:
         The accidentals of the `Chord`.
     notes : tuple of Note
         The tuple of `Notes` in the `Chord`.
+    pitch_class_mask : int
+        The 12-bit mask of the pitches of the `notes`.
+    spelled_mask : int
+        The 35-bit mask of the spellings of the `notes`.
 
     """
 
+    __slots__ = (
+        'root', 'quality', 'add', 'bass', 'string',
+        'base_intervals', 'base_degrees', 'base_symbols', 'base_notes',
+        'intervals', 'degrees', 'symbols', 'notes', 'inversion',
+        'pitch_class_mask', 'spelled_mask', '_base_scale', '_notation',
+    )
+    _notation_attrs = ('root', 'quality', 'add', 'bass', 'string', '_notation')
+    _tone_attrs = frozenset((
+        'base_intervals', 'base_degrees', 'base_symbols', 'base_notes',
+        'intervals', 'degrees', 'symbols', 'notes', 'inversion',
+        'pitch_class_mask', 'spelled_mask', '_base_scale',
+    ))
     _SE = ScaleEditor()
     _NE = NoteEditor()
+    _spelled = None  # root*qualities + quality -> bool
+    _major_semitones = (0, 2, 4, 5, 7, 9, 11)
+    _shifts = {
+        '\u266d': -1, '\U0001D12B': -2,
+        '\u266f': +1, '\U0001D12A': +2,
+        '': 0,
+        }
 
     def __init__(self, root, quality, add=None, bass=None, string=None):
         self.root = root
@@ -66,98 +93,133 @@ class Chord:
     def build(self):
         """Build the `Chord` from its attributes.
 
+        The notation is built immediately, while the `notes`, `intervals`, `degrees`, `symbols`, `inversion` and masks of the `Chord` are only built when one of them is first accessed. Whether the `notes` can be spelled is checked immediately from lookup tables.
+
         This method does not need to be used if `Chord` adjustments are done through the proper channels (i.e. `ChordEditor` or using other `Chord` methods), since those would build the `Chord` automatically.
 
+        Raises
+        ------
+        ValueError
+            If the `notes` need more than doublesharps or doubleflats.
+
         """
-        self._build_base_chord()
-        self._build_full_chord()
+        for attr in Chord._tone_attrs:
+            try:
+                object.__delattr__(self, attr)
+            except AttributeError:
+                pass
+        bass = self.bass.freeze() if self.bass else None
+        if not _spellable(self.root.freeze(), self.quality, self.add, bass):
+            raise ValueError(
+                "Only symbols up to doublesharps and doubleflats are accepted"
+            )
         self._build_notation()
 
+    def __getattr__(self, attribute):
+        """Build the chord tones when they are first accessed."""
+        if attribute not in Chord._tone_attrs:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute "
+                f"'{attribute}'"
+            )
+        try:
+            self._build_tones()
+        except ValueError as e:
+            # attributes changed without building the chord again
+            raise AttributeError(
+                f"'{type(self).__name__}' object could not build "
+                f"'{attribute}': {e}"
+            ) from e
+        return object.__getattribute__(self, attribute)
+
+    def _build_tones(self):
+        """Build the notes of the chord and their degrees and symbols."""
+        base_scale = self._SE.create_scale(self.root.freeze())
+        base_notes = self._build_base_chord()
+        notes = list(base_notes)
+        degrees = list(self.quality.degrees)
+        symbols = list(self.quality.symbols)
+        self._build_add(base_scale, notes, degrees, symbols)
+        inversion = self._build_bass_note(base_scale, notes, degrees, symbols)
+        notes = tuple(notes)
+        tones = {
+            '_base_scale': base_scale,
+            'base_intervals': self.quality.intervals,
+            'base_degrees': self.quality.degrees,
+            'base_symbols': self.quality.symbols,
+            'base_notes': base_notes,
+            'notes': notes,
+            'degrees': tuple(degrees),
+            'symbols': tuple(symbols),
+            'intervals': self._NE.get_intervals(*notes),
+            'inversion': inversion,
+            'pitch_class_mask': _pitch_class_mask(notes),
+            'spelled_mask': _spelled_mask(notes),
+        }
+        # the tones are a cache of the attributes, so they can also be
+        # filled in on a FrozenChord
+        for attr, value in tones.items():
+            object.__setattr__(self, attr, value)
+
     def _build_base_chord(self):
-        """Build the chord without any added or bass notes."""
-        self._base_scale = self._SE.create_scale(self.root.value)
-        self.base_intervals = self.quality.intervals
-        self.base_degrees = self.quality.degrees
-        self.base_symbols = self.quality.symbols
-        # get a copy of the root
-        root = self._NE.create_note(self.root.value)
-        notes = [root]
-        idx = len(self.base_intervals)
-        for i in range(idx):
-            new = self._NE.create_note(notes[-1].value)
-            new.transpose(
-                self.base_intervals[i],
-                self.base_degrees[i+1] - self.base_degrees[i]
-                )
-            notes.append(new)
-        self.base_notes = tuple(notes)
-
-    def _build_full_chord(self):
-        self.notes = list(self.base_notes)
-        self.degrees = list(self.base_degrees)
-        self.symbols = list(self.base_symbols)
-        self._build_add()
-        self._build_bass_note()
-        self.notes = tuple(self.notes)
-        self.degrees = tuple(self.degrees)
-        self.symbols = tuple(self.symbols)
-        self.intervals = self._NE.get_intervals(*self.notes)
-
-    def _build_add(self):
+        """Build the chord notes without any added or bass notes."""
+        intervals = self.quality.intervals
+        degrees = self.quality.degrees
+        # chord tones are shared FrozenNotes
+        notes = [self.root.freeze()]
+        for i in range(len(intervals)):
+            notes.append(notes[-1].transpose(
+                intervals[i],
+                degrees[i+1] - degrees[i]
+                ))
+        return tuple(notes)
+
+    def _build_add(self, base_scale, notes, degrees, symbols):
         """Add notes for chords with added notes."""
         if not self.add:
             return
-        symbols = {
-            '\u266d': -1, '\U0001D12B': -2,
-            '\u266f': +1, '\U0001D12A': +2,
-            '': 0,
-            }
         for each in self.add:
             sym = each[0]
             tone = each[1]
-            shift = symbols[sym]
+            shift = Chord._shifts[sym]
             pos = max(
-                self.degrees.index(i)
-                for i in self.degrees
+                degrees.index(i)
+                for i in degrees
                 if i < tone
                 ) + 1
-            self.symbols.insert(pos, sym)
-            self.degrees.insert(pos, tone)
-            # copy the note
-            new_note = self._NE.create_note(self._base_scale.notes[tone-1].value)
-            new_note.shift_s(shift)
-            self.notes.insert(pos, new_note)
-
-    def _build_bass_note(self):
-        """Build the bass note."""
-        self.inversion = None
+            symbols.insert(pos, sym)
+            degrees.insert(pos, tone)
+            new_note = base_scale.notes[tone-1].shift_s(shift)
+            notes.insert(pos, new_note)
+
+    def _build_bass_note(self, base_scale, notes, degrees, symbols):
+        """Build the bass note and return the inversion."""
         if not self.bass:
-            return
-        if self.bass in self.notes:
-            idx = self.notes.index(self.bass)
-            self.notes.insert(0, self.notes.pop(idx))
-            self.symbols.insert(0, self.symbols.pop(idx))
-            self.degrees.insert(0, self.degrees.pop(idx))
-            self.inversion = self.degrees[0]
-            return
-        self.notes.insert(0, self.bass)
+            return None
+        if self.bass in notes:
+            idx = notes.index(self.bass)
+            notes.insert(0, notes.pop(idx))
+            symbols.insert(0, symbols.pop(idx))
+            degrees.insert(0, degrees.pop(idx))
+            return degrees[0]
+        notes.insert(0, self.bass.freeze())
         degree = min(
-            self._base_scale.notes.index(x)
-            for x in self._base_scale.notes
+            base_scale.notes.index(x)
+            for x in base_scale.notes
             if x.letter == self.bass.letter
             ) + 1
-        self.degrees.insert(0, degree)
+        degrees.insert(0, degree)
         (shift,) = self._NE.get_min_intervals(
-            self._base_scale.notes[degree-1],
+            base_scale.notes[degree-1],
             self.bass
         )
-        symbols = {
+        shifts = {
             -1: '\u266d', -2: '\U0001D12B',
             +1: '\u266f', +2: '\U0001D12A',
             0: '',
             }
-        sym = symbols[shift]
-        self.symbols.insert(0, sym)
+        symbols.insert(0, shifts[shift])
+        return None
 
     def _build_notation(self):
         """Build a standardised chord notation."""
@@ -179,6 +241,75 @@ class Chord:
         if not self.string:
             self.string = self._notation
 
+    def copy(self):
+        """Return an independent copy of the `Chord`.
+
+        The copy is not rebuilt from its attributes, so copying is much cheaper than creating the `Chord` again. Changing the copy does not change the original `Chord`.
+
+        Returns
+        -------
+        Chord
+            The copied `Chord`.
+
+        Examples
+        --------
+        >>> CE = ChordEditor()
+        >>> c = CE.create_chord("Cadd9")
+        >>> d = c.copy()
+        >>> d.transpose(2, 1)
+        Dadd9 chord
+        >>> c
+        Cadd9 chord
+
+        """
+        chord = self._clone(Chord, lambda x: Note(x.letter, x.symbol))
+        if self.add:
+            chord.add = list(self.add)
+        return chord
+
+    def freeze(self):
+        """Return an immutable and hashable copy of the `Chord`.
+
+        Returns
+        -------
+        FrozenChord
+            The `FrozenChord` with the same attributes.
+
+        Examples
+        --------
+        >>> CE = ChordEditor()
+        >>> c = CE.create_chord("G7")
+        >>> {c.freeze(): "dominant"}
+        {G7 chord: 'dominant'}
+
+        """
+        chord = self._clone(FrozenChord, Note.freeze)
+        chord.add = tuple(self.add) if self.add else None
+        chord._freeze(chord._identity())
+        return chord
+
+    def _clone(self, cls, convert):
+        """Copy the built attributes into a new chord of `cls`.
+
+        `convert` is applied to the root and bass so that the clone does not share mutable notes with this chord. The chord tones are shared FrozenNotes and need no copying, and are only copied if they have been built.
+
+        """
+        chord = cls.__new__(cls)
+        try:
+            object.__getattribute__(self, 'notes')
+        except AttributeError:
+            attrs = Chord._notation_attrs  # the tones have not been built
+        else:
+            attrs = Chord.__slots__
+        # skip the immutability check of a FrozenChord that is being built
+        set_ = object.__setattr__ if isinstance(chord, Frozen) else setattr
+        for attr in attrs:
+            set_(chord, attr, getattr(self, attr))
+        set_(chord, 'root', convert(self.root))
+        if self.bass:
+            set_(chord, 'bass', convert(self.bass))
+        return chord
+
     def transpose(self, semitones, letter):
         """Transpose a `Chord` according to semitone and letter intervals.
 
@@ -199,9 +330,9 @@ class Chord:
         G\u266dsus chord
 
         """
-        self.root.transpose(semitones, letter)
+        self.root = self.root.transpose(semitones, letter)
         if self.bass:
-            self.bass.transpose(semitones, letter)
+            self.bass = self.bass.transpose(semitones, letter)
         self.build()
         return self
 
@@ -225,12 +356,12 @@ class Chord:
         A\u266dm chord
 
         """
-        prev = self._NE.create_note(self.root.value)
-        self.root.transpose_simple(semitones, use_flats)
+        prev = self.root.freeze()
+        self.root = self.root.transpose_simple(semitones, use_flats)
         if self.bass:
-            # bass has to be transposed exact!
-            (diff,) = self._NE.get_tone_letter(prev, self.root)
-            self.bass.transpose(*diff)
+            # bass has to be transposed exact by the interval of the root
+            letters = self.root.freeze()._pos - prev._pos
+            self.bass = self.bass.transpose(semitones, letters)
         self.build()
         return self
 
@@ -280,6 +411,167 @@ class Chord:
         return (
             self.root == other.root
             and self.quality == other.quality
-            and self.add == other.add
+            and tuple(self.add or ()) == tuple(other.add or ())
             and self.bass == other.bass
             )
+
+
+class FrozenChord(Frozen, Chord):
+    """An immutable and hashable `Chord`.
+
+    A `FrozenChord` can be used as a dictionary key or set member. Its `root` and `bass` are `FrozenNotes` and its `add` is a tuple. The methods that change a `Chord` in place return a new `FrozenChord` instead.
+
+    Parameters
+    ----------
+    root : Note
+        The root note.
+    quality : Quality
+        The `Chord` quality.
+    add : list of (str, int), Optional
+        List of added notes. The `str` is the accidental and the `int` is the scale degree of each added note.
+    bass : Note, Optional
+        Bass note.
+    string : str, Optional
+        The `Chord` notation string input.
+
+    Examples
+    --------
+    >>> CE = ChordEditor()
+    >>> c = CE.create_chord("Csus", frozen=True)
+    >>> c.transpose(2, 1)
+    Dsus chord
+    >>> c
+    Csus chord
+    >>> len({c, CE.create_chord("Csus4", frozen=True)})
+    1
+
+    """
+
+    __slots__ = ('_hash',)
+
+    def __init__(self, root, quality, add=None, bass=None, string=None):
+        super().__init__(
+            root.freeze(), quality,
+            tuple(add) if add else None,
+            bass.freeze() if bass else None,
+            string,
+        )
+        self._freeze(self._identity())
+
+    def _identity(self):
+        """Return the attributes that are compared for equality."""
+        bass = self.bass.value if self.bass else None
+        return (self.root.value, self.quality, self.add, bass)
+
+    def copy(self):
+        """Return the `FrozenChord` itself."""
+        return self
+
+    def freeze(self):
+        """Return the `FrozenChord` itself."""
+        return self
+
+    def thaw(self):
+        """Return a mutable copy of the `FrozenChord`.
+
+        Returns
+        -------
+        Chord
+            The `Chord` with the same attributes.
+
+        """
+        return Chord.copy(self)
+
+    def transpose(self, semitones, letter):
+        """Return a new `FrozenChord` transposed by semitone and letter intervals.
+
+        See Also
+        --------
+        Chord.transpose
+
+        """
+        return self.thaw().transpose(semitones, letter).freeze()
+
+    def transpose_simple(self, semitones, use_flats=False):
+        """Return a new `FrozenChord` transposed by semitone intervals.
+
+        See Also
+        --------
+        Chord.transpose_simple
+
+        """
+        return self.thaw().transpose_simple(semitones, use_flats).freeze()
+
+    def __reduce__(self):
+        return (
+            FrozenChord,
+            (self.root, self.quality, self.add, self.bass, self.string),
+        )
+
+
+def _scale_note(root, degree):
+    """Return the `FrozenNote` of a degree (from 0) of the major scale of a root `FrozenNote`, or None if it needs more than double accidentals."""
+    degree %= 7
+    return FrozenNote._transpositions[
+        root._id*84 + Chord._major_semitones[degree]*7 + degree
+    ]
+
+
+def _spellable(root, quality, add=None, bass=None):
+    """Return if the notes of a chord need at most double accidentals.
+
+    The root and quality are looked up in a table of every root, while the added and bass notes are compared with the major scale of the root that they are built from. The root and bass are `FrozenNotes`.
+
+    """
+    spelled = _spelled_table()
+    if not spelled[root._id*len(Quality._qualities) + quality._id]:
+        return False
+    for symbol, tone in add or ():
+        if not _spelled_add(root, Chord._shifts[symbol], tone):
+            return False
+    return bass is None or _spelled_bass(root, bass)
+
+
+def _spelled_add(root, shift, tone):
+    """Return if an added note with an accidental `shift` can be spelled over a root `FrozenNote`."""
+    note = _scale_note(root, tone - 1)
+    return note is not None and abs(note._symbol_num + shift) <= 2
+
+
+def _spelled_bass(root, bass):
+    """Return if a bass `FrozenNote` can be spelled over a root `FrozenNote`."""
+    note = _scale_note(root, bass._pos - root._pos)
+    return note is not None and abs(bass._symbol_num - note._symbol_num) <= 2
+
+
+def _spelled_table():
+    """Return the table of whether each root and `Quality` can be spelled, by `FrozenNote` id and then `Quality` id."""
+    if Chord._spelled is None:
+        Chord._spelled = _build_spellable()
+    return Chord._spelled
+
+
+def _build_spellable():
+    """Build the table of whether each root and `Quality` can be spelled.
+
+    A root and `Quality` can be spelled if the notes of the `Quality` and the major scale of the root, which the added and bass notes are built from, need at most doublesharps or doubleflats.
+
+    """
+    transpositions = FrozenNote._transpositions
+    spellable = []
+    for root in FrozenNote._spellings:
+        scale = all(
+            _scale_note(root, degree) is not None for degree in range(7)
+        )
+        for quality in Quality._qualities:
+            note = root if scale else None
+            degrees = quality.degrees
+            for i, interval in enumerate(quality.intervals):
+                if note is None:
+                    break
+                letters = (degrees[i+1] - degrees[i]) % 7
+                note = transpositions[
+                    note._id*84 + interval % 12 * 7 + letters
+                ]
+            spellable.append(note is not None)
+    return tuple(spellable)
@@ -0,0 +1,37 @@
+class Frozen:
+    """A mixin that makes a musical class immutable and hashable.
+
+    Attributes can be set while the object is being initialised. Once its hash has been stored with `_freeze`, setting or deleting an attribute raises an `AttributeError`. Since a frozen object cannot change, copying it returns the same object.
+
+    Classes using the mixin have to declare a `_hash` slot.
+
+    """
+
+    __slots__ = ()
+
+    def _freeze(self, key):
+        """Store the hash of `key` and make the object immutable."""
+        object.__setattr__(self, '_hash', hash(key))
+
+    def __setattr__(self, name, value):
+        if hasattr(self, '_hash'):
+            raise AttributeError(
+                f"'{type(self).__name__}' object is immutable"
+            )
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        if hasattr(self, '_hash'):
+            raise AttributeError(
+                f"'{type(self).__name__}' object is immutable"
+            )
+        object.__delattr__(self, name)
+
+    def __hash__(self):
+        return self._hash
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
@@ -1,3 +1,4 @@
+from chordparser.music.frozen import Frozen
 from chordparser.music.notes import Note
 
 
@@ -26,6 +27,8 @@ class Key:
 
     """
 
+    __slots__ = ('root', 'mode', 'submode')
+
     def __init__(self, root, mode, submode):
         self.root = root
         self.mode = mode
@@ -42,6 +45,24 @@ class Key:
             return getattr(self.root, attribute)
         raise AttributeError(f"'Key' object has no attribute '{attribute}'")
 
+    def freeze(self):
+        """Return an immutable and hashable copy of the `Key`.
+
+        Returns
+        -------
+        FrozenKey
+            The `FrozenKey` with the same attributes.
+
+        Examples
+        --------
+        >>> KE = KeyEditor()
+        >>> key = KE.create_key("D", "minor")
+        >>> {key.freeze(): "Dm"}
+        {D natural minor: 'Dm'}
+
+        """
+        return FrozenKey(self.root, self.mode, self.submode)
+
     def __repr__(self):
         if not self.submode:
             return f'{self.root} {self.mode}'
@@ -105,3 +126,75 @@ class Key:
             and self.mode == other.mode
             and self.submode == other.submode
         )
+
+
+class FrozenKey(Frozen, Key):
+    """An immutable and hashable `Key`.
+
+    A `FrozenKey` can be used as a dictionary key or set member. Its `root` is a `FrozenNote`, and the `Note` methods that would change its `root` return a new `FrozenKey` instead. `Keys` in the 'major'/ 'ionian' and 'minor'/ 'aeolian' modes have the same hash, since they compare equal.
+
+    Parameters
+    ----------
+    root : Note
+        The root note of the `Key`.
+    mode : {'major', 'minor', 'ionian', 'dorian', 'phrygian', 'lydian', 'mixolydian', 'aeolian', 'locrian'}
+        The mode of the `Key`.
+    submode : {None, 'natural', 'harmonic', 'melodic'}
+        The submode of the `Key`.
+
+    Examples
+    --------
+    >>> KE = KeyEditor()
+    >>> key = KE.create_key("C").freeze()
+    >>> key.transpose(2, 1)
+    D major
+    >>> key
+    C major
+
+    """
+
+    __slots__ = ('_hash',)
+    _same_modes = {'ionian': 'major', 'aeolian': 'minor'}
+
+    def __init__(self, root, mode, submode):
+        super().__init__(root.freeze(), mode, submode)
+        self._freeze((
+            self.root.value,
+            FrozenKey._same_modes.get(mode, mode),
+            submode,
+        ))
+
+    def __getattr__(self, attribute):
+        """Allow `Note` methods to be used on the `Key`'s `root`.
+
+        Methods that return a new `root` return a new `FrozenKey` instead.
+
+        """
+        attr = super().__getattr__(attribute)
+        if not callable(attr):
+            return attr
+
+        def method(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            if isinstance(result, Note):
+                return FrozenKey(result, self.mode, self.submode)
+            return result
+        return method
+
+    def freeze(self):
+        """Return the `FrozenKey` itself."""
+        return self
+
+    def thaw(self):
+        """Return a mutable copy of the `FrozenKey`.
+
+        Returns
+        -------
+        Key
+            The `Key` with the same attributes.
+
+        """
+        return Key(self.root.thaw(), self.mode, self.submode)
+
+    def __reduce__(self):
+        return (FrozenKey, (self.root, self.mode, self.submode))
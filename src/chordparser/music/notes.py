@@ -1,3 +1,6 @@
+from chordparser.music.frozen import Frozen
+
+
 class Note:
     """A class representing a musical note.
 
@@ -19,6 +22,7 @@ class Note:
 
     """
 
+    __slots__ = ('letter', 'symbol')
     _flat = '\u266d'
     _sharp = '\u266f'
     _doubleflat = '\U0001D12B'
@@ -66,6 +70,24 @@ class Note:
         """str: The full notation of the `Note`."""
         return self.letter + self.symbol
 
+    def freeze(self):
+        """Return an immutable and hashable copy of the `Note`.
+
+        Returns
+        -------
+        FrozenNote
+            The `FrozenNote` with the same notation.
+
+        Examples
+        --------
+        >>> NE = NoteEditor()
+        >>> d = NE.create_note("D")
+        >>> {d.freeze(): 2}
+        {D note: 2}
+
+        """
+        return FrozenNote._table[self.letter, self.symbol]
+
     def num_value(self):
         """Return the `Note`'s numerical value (basis: C = 0).
 
@@ -231,12 +253,10 @@ class Note:
         G\u266d note
 
         """
-        new_val = (self.num_value() + semitones) % 12
-        self.shift_l(letters)
-        curr_val = self.num_value()
-        shift = (new_val - curr_val) % 12
-        shift = shift - 12 if shift > 6 else shift  # shift downwards if closer
-        self.shift_s(shift)
+        new = FrozenNote._table[self.letter, self.symbol].transpose(
+            semitones, letters
+        )
+        self.letter, self.symbol = new.letter, new.symbol
         return self
 
     def transpose_simple(self, semitones, use_flats=False):
@@ -259,13 +279,10 @@ class Note:
         A\u266d note
 
         """
-        if use_flats:
-            note_list = Note._flat_tuple
-        else:
-            note_list = Note._sharp_tuple
-        self.letter, self.symbol = note_list[
-            (self.num_value() + semitones) % 12
-        ]
+        new = FrozenNote._table[self.letter, self.symbol].transpose_simple(
+            semitones, use_flats
+        )
+        self.letter, self.symbol = new.letter, new.symbol
         return self
 
     def __repr__(self):
@@ -318,3 +335,222 @@ class Note:
             return self.value == other
         else:
             return NotImplemented
+
+
+class FrozenNote(Frozen, Note):
+    """An immutable and hashable `Note`.
+
+    A `FrozenNote` can be used as a dictionary key or set member. Its hash is the hash of its `value`, as a `Note` compares equal to its notation string.
+
+    There are only 35 `FrozenNotes` (7 letters with 5 accidentals each), which are built once and shared: creating a `FrozenNote` returns the existing one with the same notation. Their numerical values are precomputed, and the methods that would change a `Note` in place look up the resulting `FrozenNote` instead.
+
+    Parameters
+    ----------
+    letter : str
+        The letter part of the `Note`'s notation. Consists of A-G.
+    symbol : str
+        The accidental part of the `Note`'s notation. Consists of the unicode characters \u266d, \u266f, \U0001D12B, or \U0001D12A. If there are no accidentals, it is an empty string.
+
+    Raises
+    ------
+    ValueError
+        If the `letter` or `symbol` is invalid.
+
+    Examples
+    --------
+    >>> NE = NoteEditor()
+    >>> c = NE.create_note("C").freeze()
+    >>> c.transpose(2, 1)
+    D note
+    >>> c
+    C note
+    >>> c in {"C", "E"}
+    True
+    >>> c is NE.create_note("C").freeze()
+    True
+
+    """
+
+    __slots__ = ('_num', '_letter_num', '_symbol_num', '_pos', '_id', '_hash')
+    _table = {}  # (letter, symbol) -> FrozenNote
+    _spellings = ()  # spelling id -> FrozenNote
+    _transpositions = ()  # id*84 + semitones*7 + letters -> FrozenNote/None
+    _simple_transpositions = ()  # id*24 + semitones*2 + use_flats -> FrozenNote
+
+    def __new__(cls, letter, symbol):
+        try:
+            return FrozenNote._table[letter, symbol]
+        except KeyError:
+            raise ValueError(
+                f"'{letter}{symbol}' is not a valid note"
+            ) from None
+
+    def __init__(self, letter, symbol):
+        pass  # the shared FrozenNotes are built once by _build
+
+    @classmethod
+    def _build(cls, pos, symbol_num):
+        """Build the shared note for a letter position and accidental."""
+        note = object.__new__(cls)
+        Note.__init__(
+            note, Note._notes_tuple[pos], Note._symbols[symbol_num]
+        )
+        note._letter_num = Note._note_values[note.letter]
+        note._symbol_num = symbol_num
+        note._num = (note._letter_num + symbol_num) % 12
+        note._pos = pos
+        note._id = pos*5 + symbol_num + 2
+        note._freeze(note.value)
+        return note
+
+    def num_value(self):
+        """Return the `Note`'s numerical value (basis: C = 0).
+
+        See Also
+        --------
+        Note.num_value
+
+        """
+        return self._num
+
+    def letter_value(self):
+        """Return the `Note`'s letter as an integer value (basis: C = 0).
+
+        See Also
+        --------
+        Note.letter_value
+
+        """
+        return self._letter_num
+
+    def symbol_value(self):
+        """Return the `Note`'s symbol as an integer value (basis: natural = 0).
+
+        See Also
+        --------
+        Note.symbol_value
+
+        """
+        return self._symbol_num
+
+    def freeze(self):
+        """Return the `FrozenNote` itself."""
+        return self
+
+    def thaw(self):
+        """Return a mutable copy of the `FrozenNote`.
+
+        Returns
+        -------
+        Note
+            The `Note` with the same notation.
+
+        """
+        return Note(self.letter, self.symbol)
+
+    def accidental(self, value):
+        """Return the `FrozenNote` with a different accidental.
+
+        See Also
+        --------
+        Note.accidental
+
+        """
+        if value not in range(-2, 3):
+            raise ValueError(
+                "Only integers between -2 and 2 are accepted"
+            )
+        return FrozenNote._spellings[self._pos*5 + value + 2]
+
+    def shift_s(self, value):
+        """Return the `FrozenNote` with a shifted accidental.
+
+        See Also
+        --------
+        Note.shift_s
+
+        """
+        value += self._symbol_num
+        if value not in range(-2, 3):
+            raise ValueError(
+                "Only symbols up to doublesharps and doubleflats are accepted"
+            )
+        return FrozenNote._spellings[self._pos*5 + value + 2]
+
+    def shift_l(self, value):
+        """Return the `FrozenNote` with a shifted letter.
+
+        See Also
+        --------
+        Note.shift_l
+
+        """
+        pos = (self._pos + value) % 7
+        return FrozenNote._spellings[pos*5 + self._symbol_num + 2]
+
+    def transpose(self, semitones, letters):
+        """Return the `FrozenNote` transposed by semitone and letter intervals.
+
+        See Also
+        --------
+        Note.transpose
+
+        """
+        new = FrozenNote._transpositions[
+            self._id*84 + semitones % 12 * 7 + letters % 7
+        ]
+        if new is None:
+            raise ValueError(
+                "Only symbols up to doublesharps and doubleflats are accepted"
+            )
+        return new
+
+    def transpose_simple(self, semitones, use_flats=False):
+        """Return the `FrozenNote` transposed by semitone intervals.
+
+        See Also
+        --------
+        Note.transpose_simple
+
+        """
+        return FrozenNote._simple_transpositions[
+            self._id*24 + semitones % 12 * 2 + bool(use_flats)
+        ]
+
+    def __reduce__(self):
+        return (FrozenNote, (self.letter, self.symbol))
+
+
+FrozenNote._spellings = tuple(
+    FrozenNote._build(pos, symbol_num)
+    for pos in range(7)
+    for symbol_num in range(-2, 3)
+)
+FrozenNote._table = {
+    (note.letter, note.symbol): note for note in FrozenNote._spellings
+}
+
+
+def _transposition(note, semitones, letters):
+    """Return the spelling of `note` transposed, or None if the spelling needs more than a double accidental."""
+    pos = (note._pos + letters) % 7
+    natural = Note._note_values[Note._notes_tuple[pos]]
+    shift = (note._num + semitones - natural) % 12
+    shift = shift - 12 if shift > 6 else shift  # shift downwards if closer
+    if shift not in range(-2, 3):
+        return None
+    return FrozenNote._spellings[pos*5 + shift + 2]
+
+
+FrozenNote._transpositions = tuple(
+    _transposition(note, semitones, letters)
+    for note in FrozenNote._spellings
+    for semitones in range(12)
+    for letters in range(7)
+)
+FrozenNote._simple_transpositions = tuple(
+    FrozenNote._table[note_list[(note._num + semitones) % 12]]
+    for note in FrozenNote._spellings
+    for semitones in range(12)
+    for note_list in (Note._sharp_tuple, Note._flat_tuple)
+)
@@ -0,0 +1,112 @@
+class PitchSet:
+    """A mixin for musical classes that are sets of `Notes`.
+
+    Classes using the mixin have `notes`, a `pitch_class_mask` and a `spelled_mask`. In the 12-bit `pitch_class_mask`, bit n is set if a `Note` has the numerical value n (basis: C = 0). In the 35-bit `spelled_mask`, bit n is set if a `Note` has the spelling id n, which is ``5*letter + accidental + 2`` with the letter counted from C = 0 and the accidental from -2 (doubleflat) to +2 (doublesharp). Comparing the pitches of two sets is a single integer operation on their masks.
+
+    """
+
+    __slots__ = ()
+
+    def contains(self, other, spelled=False):
+        """Check if all the `Notes` of another set are in this set.
+
+        Parameters
+        ----------
+        other : Chord or Scale
+            The set of `Notes` to look for.
+        spelled : boolean, Optional
+            Selector to compare the spelling of the `Notes` instead of their pitch. Default False when optional.
+
+        Returns
+        -------
+        boolean
+            Whether all the `Notes` of `other` are in this set.
+
+        Examples
+        --------
+        >>> SE = ScaleEditor()
+        >>> CE = ChordEditor()
+        >>> scale = SE.create_scale("Db", "major")
+        >>> chord = CE.create_chord("C#")
+        >>> scale.contains(chord)
+        True
+        >>> scale.contains(chord, spelled=True)
+        False
+
+        """
+        if spelled:
+            return not other.spelled_mask & ~self.spelled_mask
+        return not other.pitch_class_mask & ~self.pitch_class_mask
+
+    def common_tones(self, other, spelled=False):
+        """Count the `Notes` that are in both this set and another set.
+
+        Parameters
+        ----------
+        other : Chord or Scale
+            The other set of `Notes`.
+        spelled : boolean, Optional
+            Selector to compare the spelling of the `Notes` instead of their pitch. Default False when optional.
+
+        Returns
+        -------
+        int
+            The number of common `Notes`.
+
+        Examples
+        --------
+        >>> CE = ChordEditor()
+        >>> c = CE.create_chord("C")
+        >>> c.common_tones(CE.create_chord("Am"))
+        2
+
+        """
+        if spelled:
+            return bin(self.spelled_mask & other.spelled_mask).count('1')
+        return bin(self.pitch_class_mask & other.pitch_class_mask).count('1')
+
+    def is_enharmonic(self, other):
+        """Check if another set sounds the same as this set.
+
+        Two sets are enharmonically equivalent if they have the same pitches and their first `Notes` (the bass of a `Chord` or the root of a `Scale`) have the same pitch, however the `Notes` are spelt.
+
+        Parameters
+        ----------
+        other : Chord or Scale
+            The other set of `Notes`.
+
+        Returns
+        -------
+        boolean
+            Whether the sets are enharmonically equivalent.
+
+        Examples
+        --------
+        >>> CE = ChordEditor()
+        >>> c = CE.create_chord("C#7")
+        >>> c.is_enharmonic(CE.create_chord("Db7"))
+        True
+        >>> c.is_enharmonic(CE.create_chord("C#7/G#"))
+        False
+
+        """
+        return (
+            self.pitch_class_mask == other.pitch_class_mask
+            and self.notes[0].num_value() == other.notes[0].num_value()
+        )
+
+
+def _pitch_class_mask(notes):
+    """Return the 12-bit pitch class mask of `FrozenNotes`."""
+    mask = 0
+    for note in notes:
+        mask |= 1 << note._num
+    return mask
+
+
+def _spelled_mask(notes):
+    """Return the 35-bit spelled mask of `FrozenNotes`."""
+    mask = 0
+    for note in notes:
+        mask |= 1 << note._id
+    return mask
@@ -1,7 +1,12 @@
-class Quality:
+from chordparser.music.frozen import Frozen
+
+
+class Quality(Frozen):
     """A class representing the quality of a `Chord`.
 
-    The `Quality` class composes of its base `Chord` quality, extensions to the `Chord`, and optional flats on the extended `Note`.
+    The `Quality` class composes of its base `Chord` quality, extensions to the `Chord`, and optional flats on the extended `Note`. A `Quality` is immutable and hashable, so it can be shared between `Chords` and used as a dictionary key.
+
+    Every valid `Quality` is built once when the module is imported and kept in a catalogue. Creating a `Quality` returns the catalogued instance with the same `value`, `ext` and `flat_ext`.
 
     Parameters
     ----------
@@ -44,6 +49,12 @@ class Quality:
 
     """
 
+    __slots__ = (
+        'value', 'ext', 'flat_ext',
+        'base_intervals', 'base_degrees', 'base_symbols',
+        'intervals', 'degrees', 'symbols',
+        '_short_name', '_long_name', '_id', '_hash',
+    )
     _flat = '\u266d'
     _sharp = '\u266f'
     _doubleflat = '\U0001D12B'
@@ -54,6 +65,8 @@ class Quality:
         0: '',
     }
     _heptatonic_base = (2, 2, 1, 2, 2, 2, 1, 2, 2, 1, 2, 2, 2, 1)
+    # semitones from the root to each scale degree
+    _heptatonic_sums = (0, 2, 4, 5, 7, 9, 11, 12, 14, 16, 17, 19, 21, 23, 24)
     _base_int = {
         'power': (7,),
         'major': (4, 3),
@@ -103,19 +116,39 @@ class Quality:
         'major thirteenth': "maj13",
         'diminished seventh': "7",
     }
+    _catalogue = {}  # (value, ext, flat_ext) -> Quality
+    _qualities = ()  # catalogue id -> Quality
+
+    def __new__(cls, quality_str, ext_str=None, flat_ext=False):
+        try:
+            return Quality._catalogue[quality_str, ext_str, flat_ext]
+        except (KeyError, TypeError):
+            # not a catalogued quality: building it raises the error
+            return cls._create(quality_str, ext_str, flat_ext)
 
     def __init__(self, quality_str, ext_str=None, flat_ext=False):
-        self.value = quality_str
-        self.ext = ext_str
-        self.flat_ext = flat_ext
-        self._build()
+        pass  # catalogued qualities are built once by _create
+
+    @classmethod
+    def _create(cls, quality_str, ext_str=None, flat_ext=False, id_=None):
+        """Build a new quality."""
+        quality = object.__new__(cls)
+        quality.value = quality_str
+        quality.ext = ext_str
+        quality.flat_ext = flat_ext
+        quality._id = id_
+        quality._build()
+        quality._freeze((quality_str, ext_str, flat_ext))
+        return quality
 
     def _build(self):
-        """Build intervals, scale degrees, and symbols."""
+        """Build intervals, scale degrees, symbols and names."""
         self._check()
         self._base()
         self._ext()
         self._sym()
+        self._short_name = self._short()
+        self._long_name = self._long()
 
     def _check(self):
         if not self.ext:
@@ -156,10 +189,10 @@ class Quality:
     def _sym(self):
         """Build base symbols and symbols with extension."""
         symbols = [""]
-        for i in range(len(self.intervals)):
-            sum_interval = sum(self.intervals[:i+1])
-            next_ = self.degrees[i+1]
-            diff = sum(Quality._heptatonic_base[:next_-1])
+        sum_interval = 0
+        for interval, next_ in zip(self.intervals, self.degrees[1:]):
+            sum_interval += interval
+            diff = Quality._heptatonic_sums[next_-1]
             symbols.append(Quality._symbols[sum_interval-diff])
         if self.value == "power":
             self.base_symbols = tuple(symbols[0:2])
@@ -189,22 +222,29 @@ class Quality:
             return ext_string + string
         return string + ext_string
 
-    def __repr__(self):
+    def _long(self):
+        """Return long form for quality."""
         if not self.ext:
-            return self.value + " quality"
+            return self.value
         if self.value in {"major", "diminished"}:
             # avoid word overlap
             string = self.ext
         else:
             string = self.value + " " + self.ext
         if not self.flat_ext:
-            return string + " quality"
+            return string
         split_string = string.split()
         split_string.insert(-1, "flat")
-        return " ".join(split_string) + " quality"
+        return " ".join(split_string)
+
+    def __repr__(self):
+        return self._long_name + " quality"
 
     def __str__(self):
-        return self._short()
+        return self._short_name
+
+    def __reduce__(self):
+        return (Quality, (self.value, self.ext, self.flat_ext))
 
     def __eq__(self, other):
         """Compare between other `Qualitys`.
@@ -240,3 +280,29 @@ class Quality:
             and self.ext == other.ext
             and self.flat_ext == other.flat_ext
             )
+
+    __hash__ = Frozen.__hash__
+
+
+def _build_catalogue():
+    """Build every valid quality in a fixed order."""
+    qualities = []
+    for value in Quality._base_int:
+        for ext in (None, *Quality._ext_int):
+            for flat_ext in (False, True):
+                if flat_ext and not ext:
+                    continue
+                try:
+                    quality = Quality._create(
+                        value, ext, flat_ext, len(qualities)
+                    )
+                except ValueError:
+                    continue
+                qualities.append(quality)
+    return tuple(qualities)
+
+
+Quality._qualities = _build_catalogue()
+Quality._catalogue = {
+    (q.value, q.ext, q.flat_ext): q for q in Quality._qualities
+}
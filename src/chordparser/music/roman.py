@@ -1,7 +1,10 @@
-class Roman:
+from chordparser.music.frozen import Frozen
+
+
+class Roman(Frozen):
     """A class representing Roman numeral notation.
 
-    The `Roman` is composed of its `root`, `quality` and `inversion`. When printed, the standard Roman numeral notation is displayed.
+    The `Roman` is composed of its `root`, `quality` and `inversion`, and an optional `secondary` `Roman` that it tonicises. When printed, the standard Roman numeral notation is displayed. A `Roman` is immutable and hashable, with the same hash as its notation string.
 
     Parameters
     ----------
@@ -11,6 +14,8 @@ class Roman:
         The quality of the `Roman`.
     inversion : tuple of int
         The inversion of the `Roman` in figured bass notation (e.g. (6, 4) for second inversion).
+    secondary : Roman, Optional
+        The `Roman` that is tonicised by a secondary chord (e.g. the second V of V/V).
 
     Attributes
     ----------
@@ -20,18 +25,28 @@ class Roman:
         The quality of the `Roman`.
     inversion : tuple of int
         The inversion of the `Roman` in figured bass notation (e.g. (6, 4) for second inversion).
+    secondary : Roman or None
+        The `Roman` that is tonicised by a secondary chord, or None if the `Roman` is not a secondary chord.
 
     """
 
-    def __init__(self, root, quality, inversion):
+    __slots__ = (
+        'root', 'quality', 'inversion', 'secondary', '_notation', '_hash',
+    )
+
+    def __init__(self, root, quality, inversion, secondary=None):
         self.root = root
         self.quality = quality
         self.inversion = inversion
+        self.secondary = secondary
         self._build_notation()
+        self._freeze(self._notation)
 
     def _build_notation(self):
         inv_str = "".join(map(str, self.inversion))
         self._notation = self.root + self.quality + inv_str
+        if self.secondary is not None:
+            self._notation += "/" + str(self.secondary)
 
     def __repr__(self):
         return self._notation + " roman chord"
@@ -39,10 +54,15 @@ class Roman:
     def __str__(self):
         return self._notation
 
+    def __reduce__(self):
+        return (
+            Roman, (self.root, self.quality, self.inversion, self.secondary)
+        )
+
     def __eq__(self, other):
         """Compare between other `Romans`.
 
-        Checks if the other `Roman` has the same `root`, `quality` and `inversion`.
+        Checks if the other `Roman` has the same `root`, `quality`, `inversion` and `secondary`.
 
         Parameters
         ----------
@@ -77,8 +97,11 @@ class Roman:
             return (
                 self.root == other.root and
                 self.quality == other.quality and
-                self.inversion == other.inversion
+                self.inversion == other.inversion and
+                self.secondary == other.secondary
             )
         if isinstance(other, str):
             return str(self) == other
         return NotImplemented
+
+    __hash__ = Frozen.__hash__
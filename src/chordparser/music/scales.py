@@ -1,11 +1,13 @@
-from chordparser.editors.notes_editor import NoteEditor
 from chordparser.music.keys import Key
+from chordparser.music.pitch_set import (
+    PitchSet, _pitch_class_mask, _spelled_mask,
+)
 
 
-class Scale:
+class Scale(PitchSet):
     """A class representing a musical scale.
 
-    The `Scale` composes of a `Key` on which it is based on, and a tuple of `Notes` as part of its `notes` attribute.
+    The `Scale` composes of a `Key` on which it is based on, and a tuple of `Notes` as part of its `notes` attribute. The `notes` of each `Key` are only computed once and are shared between `Scales`.
 
     Parameters
     ----------
@@ -20,6 +22,10 @@ class Scale:
         A two-octave tuple of `Notes` of the `Scale`.
     scale_intervals : tuple
         The semitone intervals between `notes`.
+    pitch_class_mask : int
+        The 12-bit mask of the pitches of the `notes`.
+    spelled_mask : int
+        The 35-bit mask of the spellings of the `notes`.
 
     """
 
@@ -41,7 +47,7 @@ class Scale:
         "melodic": (0, 0, 0, 0, 1, 0, -1, 0, 0, 0, 0, 1, 0, -1),
         "harmonic": (0, 0, 0, 0, 0, 1, -1, 0, 0, 0, 0, 0, 1, -1),
     }
-    _NE = NoteEditor()
+    _table = {}  # (root, mode, submode) -> (scale_intervals, notes, masks)
 
     def __init__(self, key):
         self.key = key
@@ -53,8 +59,19 @@ class Scale:
         This method does not need to be used if `Scale` adjustments are done through the proper channels (i.e. `ScaleEditor` or using other `Scale` methods), since those would build the `Scale` automatically.
 
         """
-        self.scale_intervals = self._get_intervals()
-        self.notes = self._get_notes()
+        idx = (self.key.root.freeze(), self.key.mode, self.key.submode)
+        built = Scale._table.get(idx)
+        if built is None:
+            intervals = self._get_intervals()
+            notes = self._get_notes(intervals)
+            built = Scale._table[idx] = (
+                intervals, notes,
+                _pitch_class_mask(notes), _spelled_mask(notes),
+            )
+        (
+            self.scale_intervals, self.notes,
+            self.pitch_class_mask, self.spelled_mask,
+        ) = built
         return self
 
     def _get_intervals(self):
@@ -68,12 +85,11 @@ class Scale:
         intervals = [x + y for x, y in zip(mode_intervals, submode_intervals)]
         return tuple(intervals)
 
-    def _get_notes(self):
+    def _get_notes(self, intervals):
         """Get notes based on intervals."""
-        notes = [self._NE.create_note(self.key.root.value)]
-        for interval in self.scale_intervals:
-            new_note = self._NE.create_note(notes[-1].value)
-            notes.append(new_note.transpose(interval, 1))
+        notes = [self.key.root.freeze()]
+        for interval in intervals:
+            notes.append(notes[-1].transpose(interval, 1))
         return tuple(notes)
 
     def transpose(self, semitones, letter):
@@ -96,7 +112,9 @@ class Scale:
         G\u266d major scale
 
         """
-        self.key.transpose(semitones, letter)
+        key = self.key.transpose(semitones, letter)
+        if isinstance(key, Key):  # a FrozenKey returns a new key
+            self.key = key
         self.build()
         return self
 
@@ -120,7 +138,9 @@ class Scale:
         A\u266d natural minor scale
 
         """
-        self.key.transpose_simple(semitones, use_flats)
+        key = self.key.transpose_simple(semitones, use_flats)
+        if isinstance(key, Key):  # a FrozenKey returns a new key
+            self.key = key
         self.build()
         return self
 
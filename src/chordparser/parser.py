@@ -1,17 +1,21 @@
 import os.path
 
 from chordparser.analysers.chords_analyser import ChordAnalyser
+from chordparser.analysers.corpus_analyser import CorpusAnalyser
+from chordparser.analysers.key_analyser import KeyAnalyser
 from chordparser.editors.chord_roman_converter import ChordRomanConverter
 from chordparser.editors.chords_editor import ChordEditor
 from chordparser.editors.keys_editor import KeyEditor
 from chordparser.editors.notes_editor import NoteEditor
+from chordparser.editors.roman_editor import RomanEditor
 from chordparser.editors.scales_editor import ScaleEditor
+from chordparser.readers.chordpro_reader import ChordProReader
 
 
-class Parser(KeyEditor, NoteEditor, ScaleEditor, ChordEditor, ChordAnalyser, ChordRomanConverter):
+class Parser(KeyEditor, NoteEditor, ScaleEditor, ChordEditor, RomanEditor, ChordAnalyser, CorpusAnalyser, KeyAnalyser, ChordRomanConverter, ChordProReader):
     """A class that acts as a central collection for `Editors` and `Analysers`.
 
-    The `Parser` inherits all the various `Editors` and `Analysers`. As such, all the examples using the `Editors` and `Analysers` can also use the `Parser` to create and interact with musical objects. This makes it more convenient to initialise the various musical classes without having to initialise many different `Editors` for each class beforehand.
+    The `Parser` inherits all the various `Editors`, `Analysers` and `Readers`. As such, all the examples using the `Editors` and `Analysers` can also use the `Parser` to create and interact with musical objects. This makes it more convenient to initialise the various musical classes without having to initialise many different `Editors` for each class beforehand.
 
     Examples
     --------
@@ -0,0 +1,173 @@
+import io
+import mmap
+import re
+
+from chordparser.readers.chordpro_reader import ChordProReader
+
+
+class ChordProCorpus:
+    """A collection of songs in one concatenated ChordPro file.
+
+    The `ChordProCorpus` memory-maps the file, so opening it does not read it. The file is split into songs at each title directive (``{t:}`` or ``{title:}``, in any case) as the songs are accessed, and each part of the file is only scanned once. Any text before the first title is a song of its own.
+
+    Each `CorpusSong` refers to its part of the file without copying it, and is only decoded when it is read. A `ChordProCorpus` can be used as a context manager, which closes the file when done.
+
+    Parameters
+    ----------
+    path : str or path-like
+        The path of the ChordPro file.
+
+    Examples
+    --------
+    >>> with ChordProCorpus("songs.cho") as corpus:
+    ...     for song in corpus:
+    ...         print(song.title)
+    All I Want For Christmas Is You
+    Silent Night
+
+    """
+
+    _title_pattern = re.compile(
+        rb'^[ \t]*\{(?:t|title)[ \t]*:', re.MULTILINE | re.IGNORECASE
+    )
+    _blank_pattern = re.compile(rb'\s*')
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # an empty file cannot be mapped
+                self._mmap = b''
+        self._view = memoryview(self._mmap)
+        self._starts = self._find_starts()
+        self._bounds = []  # the start of each song found so far
+
+    def _find_starts(self):
+        """Yield the start of each song, then the end of the file."""
+        data = self._mmap
+        titles = ChordProCorpus._title_pattern.finditer(data)
+        title = next(titles, None)
+        if title is None:
+            if len(data):
+                yield 0
+        else:
+            start = title.start()
+            if not ChordProCorpus._blank_pattern.fullmatch(data, 0, start):
+                yield 0
+            yield start
+            for title in titles:
+                yield title.start()
+        yield len(data)
+
+    def _scan(self):
+        """Find the next song boundary, and return whether there was one."""
+        start = next(self._starts, None)
+        if start is None:
+            return False
+        self._bounds.append(start)
+        return True
+
+    def _song(self, index):
+        """Return the song at `index` of the songs found so far."""
+        start, end = self._bounds[index], self._bounds[index+1]
+        return CorpusSong(self._view[start:end], start)
+
+    def __iter__(self):
+        index = 0
+        while len(self._bounds) > index + 1 or self._scan():
+            if len(self._bounds) > index + 1:
+                yield self._song(index)
+                index += 1
+
+    def __len__(self):
+        while self._scan():
+            pass
+        return max(len(self._bounds) - 1, 0)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        while len(self._bounds) <= index + 1 and self._scan():
+            pass
+        if not 0 <= index < len(self._bounds) - 1:
+            raise IndexError("Song index out of range")
+        return self._song(index)
+
+    def close(self):
+        """Close the file.
+
+        If songs of the `ChordProCorpus` are still in use, the file cannot be closed yet, and the songs can still be read. The file then stays open until `close` is called again after the songs are released, or until the `ChordProCorpus` is garbage collected.
+
+        """
+        self._starts.close()  # the scan of the titles holds the file too
+        self._view.release()
+        try:
+            self._mmap.close()
+        except (AttributeError, BufferError):
+            pass  # the mapping is closed when it is garbage collected
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class CorpusSong:
+    """A song of a `ChordProCorpus`.
+
+    The `CorpusSong` holds a view of its part of the file, and decodes it only when it is read.
+
+    Attributes
+    ----------
+    data : memoryview
+        The UTF-8 encoded ChordPro text of the song.
+    offset : int
+        The position of the song in the file.
+
+    """
+
+    __slots__ = ('data', 'offset')
+    _CPR = ChordProReader()
+    _title_pattern = re.compile(
+        rb'[ \t]*\{(?:t|title)[ \t]*:[ \t]*([^}\r\n]*?)[ \t]*\}',
+        re.IGNORECASE
+    )
+
+    def __init__(self, data, offset):
+        self.data = data
+        self.offset = offset
+
+    @property
+    def title(self):
+        """str: The title of the song, or None if it does not start with a title."""
+        match = CorpusSong._title_pattern.match(self.data)
+        if not match:
+            return None
+        return match.group(1).decode('utf-8')
+
+    def decode(self):
+        """Return the ChordPro text of the song.
+
+        Returns
+        -------
+        str
+            The decoded text.
+
+        """
+        return str(self.data, 'utf-8')
+
+    def read_chordpro(self, frozen=True):
+        """Read the events of the song.
+
+        The line numbers of the events start from the first line of the song.
+
+        See Also
+        --------
+        ChordProReader.read_chordpro
+
+        """
+        return self._CPR.read_chordpro(io.StringIO(self.decode()), frozen)
+
+    def __repr__(self):
+        return f'{self.title} song'
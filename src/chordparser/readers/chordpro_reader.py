@@ -0,0 +1,124 @@
+from collections import namedtuple
+import os
+
+from chordparser.editors.chords_editor import ChordEditor
+
+
+DirectiveEvent = namedtuple(
+    'DirectiveEvent', ['line', 'column', 'name', 'value']
+)
+DirectiveEvent.__doc__ = """A ChordPro directive, such as ``{t:Title}``.
+
+The `name` of the directive is written in full (e.g. 'title' for 't'), and its `value` is None if the directive has no value.
+
+"""
+LyricEvent = namedtuple('LyricEvent', ['line', 'text'])
+LyricEvent.__doc__ = """A line of lyrics, without its chords."""
+ChordEvent = namedtuple('ChordEvent', ['line', 'column', 'notation', 'chord'])
+ChordEvent.__doc__ = """A ``[chord]`` in a line of lyrics.
+
+The `chord` is None if the `notation` is not a valid `Chord`.
+
+"""
+
+
+class ChordProReader:
+    """A reader that streams the contents of ChordPro chord sheets.
+
+    The `ChordProReader` reads a chord sheet one line at a time and yields its directives, lines of lyrics and chords as events, so chord sheets of any size can be read in constant memory.
+
+    """
+
+    _CE = ChordEditor()
+    _aliases = {
+        't': 'title',
+        'st': 'subtitle',
+        'c': 'comment',
+        'ci': 'comment_italic',
+        'cb': 'comment_box',
+        'soc': 'start_of_chorus',
+        'eoc': 'end_of_chorus',
+        'sov': 'start_of_verse',
+        'eov': 'end_of_verse',
+        'sob': 'start_of_bridge',
+        'eob': 'end_of_bridge',
+        'sot': 'start_of_tab',
+        'eot': 'end_of_tab',
+    }
+
+    def read_chordpro(self, source, frozen=True):
+        """Read the events of a ChordPro chord sheet.
+
+        The chord sheet is read lazily. Each line yields either a `DirectiveEvent`, or a `LyricEvent` followed by a `ChordEvent` for each of its chords. Lines starting with '#' are comments and are skipped. Line and column numbers start from 1.
+
+        Parameters
+        ----------
+        source : str, path-like or text stream
+            The path of the chord sheet, or a text stream of its contents.
+        frozen : boolean, Optional
+            Selector to create immutable and hashable `FrozenChords`, which are shared between repeated chords. Default True when optional.
+
+        Yields
+        ------
+        DirectiveEvent, LyricEvent or ChordEvent
+            The events of the chord sheet in order.
+
+        Examples
+        --------
+        >>> CPR = ChordProReader()
+        >>> sheet = io.StringIO("{t:Song}\\n[G]Hello [C]world")
+        >>> for event in CPR.read_chordpro(sheet):
+        ...     print(event)
+        DirectiveEvent(line=1, column=1, name='title', value='Song')
+        LyricEvent(line=2, text='Hello world')
+        ChordEvent(line=2, column=1, notation='G', chord=G chord)
+        ChordEvent(line=2, column=10, notation='C', chord=C chord)
+
+        """
+        if isinstance(source, (str, bytes, os.PathLike)):
+            with open(source, encoding='utf-8') as f:
+                yield from self._read_lines(f, frozen)
+        else:
+            yield from self._read_lines(source, frozen)
+
+    def _read_lines(self, lines, frozen):
+        """Yield the events of each line."""
+        for number, line in enumerate(lines, 1):
+            line = line.rstrip('\r\n')
+            stripped = line.strip()
+            if stripped.startswith('#'):
+                continue
+            if stripped.startswith('{') and stripped.endswith('}'):
+                yield self._read_directive(number, line, stripped)
+            else:
+                yield from self._read_lyrics(number, line, frozen)
+
+    def _read_directive(self, number, line, stripped):
+        """Return the directive event of a line."""
+        name, colon, value = stripped[1:-1].partition(':')
+        name = name.strip().lower()
+        return DirectiveEvent(
+            number,
+            line.index('{') + 1,
+            ChordProReader._aliases.get(name, name),
+            value.strip() if colon else None,
+        )
+
+    def _read_lyrics(self, number, line, frozen):
+        """Yield the lyric event of a line, then its chord events."""
+        text = []
+        chords = []
+        start = 0
+        while True:
+            open_ = line.find('[', start)
+            close = line.find(']', open_ + 1)
+            if open_ < 0 or close < 0:
+                break
+            text.append(line[start:open_])
+            chords.append((open_, line[open_+1:close]))
+            start = close + 1
+        text.append(line[start:])
+        yield LyricEvent(number, ''.join(text))
+        for column, notation in chords:
+            result = self._CE.try_create_chord(notation.strip(), frozen)
+            yield ChordEvent(number, column + 1, notation, result.value)
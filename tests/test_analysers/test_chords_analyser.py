@@ -51,6 +51,30 @@ def test_diatonic_default_sus():
     ) == [('i', 'minor', 'natural')]
 
 
+@pytest.mark.parametrize(
+    "chord, submode, result", [
+        ("Ebaug", "harmonic", [('III+', 'minor', 'harmonic')]),
+        ("Ebaug7", "harmonic", [('III+7', 'minor', 'harmonic')]),
+        ("G7/B", "harmonic", [('V65', 'minor', 'harmonic')]),
+        ("G7/B", "natural", []),
+        ("Bdim7", "harmonic", [('vii\u00b07', 'minor', 'harmonic')]),
+        ]
+    )
+def test_diatonic_submode(chord, submode, result):
+    c = CE.create_chord(chord)
+    s = SE.create_scale("C", "minor", submode)
+    assert CA.analyse_diatonic(c, s) == result
+
+
+def test_diatonic_index_shared():
+    s = SE.create_scale("D", "dorian")
+    CA.analyse_diatonic(CE.create_chord("Em"), s)
+    s2 = SE.create_scale("D", "dorian")
+    degrees = CA._diatonic_degrees(s2.key.root.freeze(), "dorian", None)
+    assert degrees is CA._diatonic_degrees(s.key.root.freeze(), "dorian", None)
+    assert 2 == degrees[CE.create_chord("Em").base_notes]
+
+
 def test_all():
     c = CE.create_chord("Db")
     s = SE.create_scale("C", "locrian")
@@ -107,3 +131,80 @@ def test_secondary_limit():
     s = SE.create_scale("F")
     assert "" == CA.analyse_secondary(c2, c, s)
     assert "ii/V" == CA.analyse_secondary(c2, c, s, limit=False)
+
+
+@pytest.mark.parametrize("incl_submodes", [False, True])
+@pytest.mark.parametrize("limit", [False, True])
+def test_secondary_sequence(incl_submodes, limit):
+    chords = CE.create_chords(
+        ["C", "A7", "Dm", "D7", "G", "C", "E", "Am", "Bdim7", "C", "G5", "F"]
+    )
+    s = SE.create_scale("C")
+    expected = [
+        CA.analyse_secondary(c, c2, s, incl_submodes, limit=limit)
+        for c, c2 in zip(chords, chords[1:])
+    ]
+    assert CA.analyse_secondary_sequence(
+        chords, s, incl_submodes, limit=limit
+    ) == expected + [""]
+
+
+def test_secondary_sequence_result():
+    chords = CE.create_chords(["F", "D7", "G7", "C"])
+    s = SE.create_scale("C")
+    assert CA.analyse_secondary_sequence(chords, s) == ["", "V7/V", "", ""]
+
+
+@pytest.mark.parametrize("chords", [[], ["C"]])
+def test_secondary_sequence_short(chords):
+    s = SE.create_scale("C")
+    result = CA.analyse_secondary_sequence(CE.create_chords(chords), s)
+    assert result == [""] * len(chords)
+
+
+def test_secondary_sequence_power_sus():
+    chords = CE.create_chords(["D5", "G", "Dsus4", "G"])
+    s = SE.create_scale("C")
+    assert CA.analyse_secondary_sequence(
+        chords, s, allow_power_sus=True
+    ) == ["V/V", "", "V/V", ""]
+
+
+def test_tonicised_scale_shared():
+    c = CE.create_chord("G7")
+    assert CA._tonicised_scale(c) is CA._tonicised_scale(CE.create_chord("G"))
+
+
+def test_all_order():
+    c = CE.create_chord("Dm")
+    results = [
+        CA.analyse_all(c, SE.create_scale("C", mode))
+        for mode in ("dorian", "major", "dorian")
+    ]
+    assert results[0] == results[2]
+    assert ('ii', 'major', None) == results[1][0]
+    assert ('ii', 'dorian', None) == results[0][0]
+    assert 'major' == CA._mode_list[0]
+
+
+def test_all_mode_alias():
+    c = CE.create_chord("Dm")
+    results = CA.analyse_all(c, SE.create_scale("C", "ionian"))
+    assert ['ionian', 'dorian', 'mixolydian'] == [
+        mode for roman, mode, submode in results
+    ]
+
+
+def test_all_threads():
+    from concurrent.futures import ThreadPoolExecutor
+    chords = [CE.create_chord(c) for c in ("C", "Dm", "E7", "F#dim", "Bb")]
+    scales = [
+        SE.create_scale(root, mode)
+        for root in ("C", "D", "Bb")
+        for mode in CA._mode_list
+    ]
+    tasks = [(c, s) for c in chords for s in scales] * 4
+    expected = [CA.analyse_all(c, s, True) for c, s in tasks]
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda t: CA.analyse_all(*t, True), tasks))
+    assert expected == results
@@ -0,0 +1,51 @@
+import pytest
+
+from chordparser.analysers.corpus_analyser import CorpusAnalyser, SongAnalysis
+from chordparser.readers.chordpro_corpus import ChordProCorpus
+
+
+CA = CorpusAnalyser()
+SONGS = [
+    "{t:First}\n{key:C}\n[C]one [Am]two [E7]three [x]\n",
+    "{title: Second}\n{key: F#m}\n[F#m]one [C#7]two\n",
+    "[G]no key\n",
+]
+RESULTS = [
+    SongAnalysis('First', 'C', ('C', 'Am', 'E7'), ('I', 'vi', None), 1),
+    SongAnalysis(
+        'Second', 'F#m', ('F\u266fm', 'C\u266f7'), ('i', None), 0
+    ),
+    SongAnalysis(None, None, ('G',), (None,), 0),
+]
+
+
+def test_in_process():
+    assert RESULTS == list(CA.analyse_corpus(SONGS, workers=0))
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 32])
+def test_workers(chunksize):
+    songs = SONGS * 3
+    results = list(CA.analyse_corpus(songs, workers=2, chunksize=chunksize))
+    assert RESULTS * 3 == results
+
+
+def test_corpus(tmp_path):
+    path = tmp_path / "corpus.cho"
+    path.write_text(''.join(SONGS[:2]), encoding='utf-8')
+    with ChordProCorpus(path) as corpus:
+        results = list(CA.analyse_corpus(corpus, workers=0))
+    assert RESULTS[:2] == results
+
+
+def test_bytes():
+    songs = [song.encode('utf-8') for song in SONGS]
+    assert RESULTS == list(CA.analyse_corpus(songs, workers=0))
+
+
+@pytest.mark.parametrize(
+    "workers, chunksize", [(-1, 32), (0, 0)]
+)
+def test_invalid_arguments(workers, chunksize):
+    with pytest.raises(ValueError):
+        CA.analyse_corpus(SONGS, workers, chunksize)
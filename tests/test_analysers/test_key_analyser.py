@@ -0,0 +1,82 @@
+import pytest
+
+from chordparser.analysers.key_analyser import KeyAnalyser, KeyEstimate
+from chordparser.editors.chords_editor import ChordEditor
+from chordparser.editors.keys_editor import KeyEditor
+from chordparser.music.keys import FrozenKey
+
+
+np = pytest.importorskip("numpy")
+
+CE = ChordEditor()
+KE = KeyEditor()
+KA = KeyAnalyser()
+
+
+@pytest.mark.parametrize(
+    "chords, key", [
+        (["C", "F", "G", "C"], ("C", "major", None)),
+        (["G", "D", "Em", "C"], ("G", "major", None)),
+        (["Bb", "Eb", "F7", "Bb"], ("B\u266d", "major", None)),
+        (["Am", "G", "F", "G", "Am"], ("A", "minor", "natural")),
+        (["Am", "Dm", "E7", "Am"], ("A", "minor", "harmonic")),
+        (["F#m", "C#7", "F#m"], ("F\u266f", "minor", "harmonic")),
+        (["Em", "F", "Em", "Dm"], ("E", "phrygian", None)),
+    ]
+)
+def test_estimate_key(chords, key):
+    (estimate,) = KA.estimate_key(CE.create_chords(chords))
+    assert estimate.key == KE.create_key(*key)
+    assert isinstance(estimate.key, FrozenKey)
+
+
+def test_estimate_key_frozen():
+    chords = CE.create_chords(["D", "G", "A7", "D"], frozen=True)
+    assert KA.estimate_key(chords)[0].key == KE.create_key("D")
+
+
+def test_estimate_key_ranked():
+    estimates = KA.estimate_key(CE.create_chords(["C", "F", "G"]), top=None)
+    assert len(estimates) == 108
+    scores = [estimate.score for estimate in estimates]
+    assert scores == sorted(scores, reverse=True)
+    assert len({estimate.key for estimate in estimates}) == 108
+
+
+def test_estimate_key_top():
+    estimates = KA.estimate_key(CE.create_chords(["Am", "Dm", "E7"]), top=3)
+    assert len(estimates) == 3
+    assert all(isinstance(estimate, KeyEstimate) for estimate in estimates)
+
+
+def test_estimate_key_empty():
+    assert KA.estimate_key([]) == []
+
+
+def test_estimate_key_top_error():
+    with pytest.raises(ValueError):
+        KA.estimate_key(CE.create_chords(["C"]), top=0)
+
+
+def test_estimate_keys():
+    songs = [
+        CE.create_chords(["C", "F", "G", "C"]),
+        [],
+        CE.create_chords(["Em", "Am", "B7", "Em"]),
+    ]
+    estimates = KA.estimate_keys(songs, top=2)
+    assert estimates[1] == []
+    assert estimates[0] == KA.estimate_key(songs[0], top=2)
+    assert estimates[2] == KA.estimate_key(songs[2], top=2)
+
+
+def test_estimate_keys_generator():
+    songs = (CE.create_chords(song) for song in (["C", "G"], ["Dm", "A7"]))
+    estimates = KA.estimate_keys(songs)
+    assert [e[0].key for e in estimates] == [
+        KE.create_key("C"), KE.create_key("D", "minor", "harmonic"),
+    ]
+
+
+def test_estimate_keys_empty():
+    assert KA.estimate_keys([]) == []
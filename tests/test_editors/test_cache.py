@@ -0,0 +1,57 @@
+import pytest
+
+from chordparser.editors.cache import LRUCache
+
+
+def test_get_put():
+    cache = LRUCache(2)
+    cache.put("C", 1)
+    assert 1 == cache.get("C")
+    assert None is cache.get("D")
+
+
+def test_eviction():
+    cache = LRUCache(2)
+    cache.put("C", 1)
+    cache.put("D", 2)
+    cache.get("C")  # D is now the least recently used
+    cache.put("E", 3)
+    assert "C" in cache
+    assert "D" not in cache
+    assert 2 == len(cache)
+
+
+def test_resize():
+    cache = LRUCache(3)
+    for i, key in enumerate("CDE"):
+        cache.put(key, i)
+    cache.maxsize = 1
+    assert ["E"] == list(cache._data)
+
+
+def test_zero_size():
+    cache = LRUCache(0)
+    cache.put("C", 1)
+    assert 0 == len(cache)
+
+
+def test_unbounded():
+    cache = LRUCache(None)
+    for i in range(2000):
+        cache.put(i, i)
+    assert 2000 == len(cache)
+
+
+def test_negative_size():
+    with pytest.raises(ValueError):
+        LRUCache(-1)
+
+
+def test_info():
+    cache = LRUCache(4)
+    cache.put("C", 1)
+    cache.get("C")
+    cache.get("D")
+    assert (1, 1, 4, 1) == cache.info()
+    cache.clear()
+    assert (0, 0, 4, 0) == cache.info()
@@ -4,6 +4,7 @@ from chordparser.editors.chords_editor import ChordEditor
 from chordparser.editors.keys_editor import KeyEditor
 from chordparser.editors.notes_editor import NoteEditor
 from chordparser.editors.scales_editor import ScaleEditor
+from chordparser.music.chords import FrozenChord
 from chordparser.music.notes import Note
 
 
@@ -44,6 +45,11 @@ def test_quality_capital():
         ('add13', [('', 13)]),
         ('add2#6', [('', 2), ('\u266f', 6)]),
         ('b11', [('\u266d', 11)]),
+        ('b13#9b9 #11', [
+            ('\u266f', 9), ('\u266d', 9), ('\u266f', 11), ('\u266d', 13),
+        ]),
+        ('\u266d9add9', [('\u266d', 9), ('', 9)]),
+        ('add9add9', [('', 9)]),
         (None, None),
     ]
 )
@@ -57,6 +63,16 @@ def test_add_parse_error():
         c = CE._parse_add('add21')
 
 
+def test_add_parse_error_between():
+    with pytest.raises(SyntaxError):
+        c = CE._parse_add('b9x#11')
+
+
+def test_add_jazz_chord():
+    c = CE.create_chord("C7b9#9#11b13")
+    assert "C7\u266d9\u266f9\u266f11\u266d13" == str(c)
+
+
 @pytest.mark.parametrize(
     "string, bass", [
         ('G', 'G'),
@@ -176,3 +192,214 @@ def test_change_chord_not_inplace():
     n = CE.change_chord(o, bass='G', inplace=False)
     assert n == o
     assert n is not o
+
+
+def test_cache_hit():
+    CE.clear_chord_cache()
+    CE.create_chord("Amadd9")
+    CE.create_chord("Amadd9")
+    info = CE.chord_cache_info()
+    assert 1 == info.hits
+    assert 1 == info.misses
+
+
+def test_cache_not_poisoned():
+    c = CE.create_chord("Dm7/A")
+    c.transpose(2, 1)
+    CE.change_chord(c, quality="maj7", add="9")
+    assert "Dm7/A chord" == repr(CE.create_chord("Dm7/A"))
+
+
+def test_cache_size():
+    CE.set_chord_cache_size(2)
+    try:
+        for each in ("C", "D", "E"):
+            CE.create_chord(each)
+        assert 2 == CE.chord_cache_info().currsize
+    finally:
+        CE.set_chord_cache_size(4096)
+
+
+def test_cache_error_not_stored():
+    CE.clear_chord_cache()
+    with pytest.raises(SyntaxError):
+        CE.create_chord("H")
+    assert 0 == CE.chord_cache_info().currsize
+
+
+def test_change_chord_frozen():
+    o = CE.create_chord('C', frozen=True)
+    n = CE.change_chord(o, quality='m7')
+    assert CE.create_chord('Cm7') == n
+    assert {n}
+    assert 'C' == str(o)
+
+
+@pytest.mark.parametrize(
+    "string", [
+        "C", "c", "C#m7b5/G", "Ebsus4add9", "Bbbaug", "EmM7", "F-Maj9",
+        "G+7", "Ao7", "A\u00f8", "D\u03947", "Dmb5", "Gb13", "Gbb13",
+        "C7#9b13", "Csus", "C/Hb", "C/Gb/E", "C6/9", "Cx/G",
+        ])
+def test_scanner_same_as_regex(string):
+    try:
+        expected = CE._parse_chord_regex(string)
+    except SyntaxError:
+        with pytest.raises(SyntaxError):
+            CE._parse_chord(string)
+        return
+    c = CE._parse_chord(string)
+    assert expected == c
+    assert expected.string == c.string
+
+
+def test_create_chords():
+    chords = CE.create_chords(["C", "Am/E", "C", "G7"])
+    assert ["C", "Am/E", "C", "G7"] == [str(c) for c in chords]
+    assert chords[0] is not chords[2]
+
+
+def test_create_chords_frozen():
+    chords = CE.create_chords(iter(["C", "Am", "C"]), frozen=True)
+    assert chords[0] is chords[2]
+
+
+@pytest.mark.parametrize(
+    "on_error, chords", [
+        ('none', ["C", None, "Am", None]),
+        ('skip', ["C", "Am"]),
+    ]
+)
+def test_create_chords_on_error(on_error, chords):
+    created = CE.create_chords(["C", "N.C.", "Am", "N.C."], on_error)
+    assert chords == [c and str(c) for c in created]
+
+
+def test_create_chords_raise():
+    with pytest.raises(SyntaxError):
+        CE.create_chords(["C", "x2"])
+
+
+def test_create_chords_on_error_value_error():
+    with pytest.raises(ValueError):
+        CE.create_chords(["C"], on_error='ignore')
+
+
+def test_try_create_chord():
+    result = CE.try_create_chord("Am7/G")
+    assert result
+    assert "Am7/G" == str(result.value)
+    assert (0, 5) == result.span
+
+
+@pytest.mark.parametrize(
+    "string, error, span", [
+        ("N.C.", 'root', (0, 4)),
+        ("Cdim9", 'quality', (1, 5)),
+        ("C7 b9 x #11", 'add', (6, 7)),
+        ("Cbdim7", 'spelling', (0, 6)),
+        ("D##5", 'spelling', (0, 4)),
+        ("Cbb5b9", 'spelling', (0, 6)),
+        ("G/Fbb", 'spelling', (0, 5)),
+    ]
+)
+def test_try_create_chord_error(string, error, span):
+    result = CE.try_create_chord(string)
+    assert not result
+    assert result.value is None
+    assert error == result.error
+    assert span == result.span
+
+
+@pytest.mark.parametrize(
+    "string, notation", [("C ", "C"), ("Am7 ", "Am7"), ("G /B", "G/B")]
+)
+def test_create_chord_blank_add(string, notation):
+    c = CE.create_chord(string)
+    assert notation == str(c)
+    assert CE.create_chord(string, frozen=True).add is None
+
+
+def test_try_create_chord_blank_add():
+    result = CE.try_create_chord("G /B")
+    assert result
+    assert "G/B" == str(result.value)
+
+
+def test_try_create_chord_frozen():
+    result = CE.try_create_chord("G", frozen=True)
+    assert result.value is CE.create_chord("G", frozen=True)
+
+
+def test_create_chords_quality_error():
+    assert [None] == CE.create_chords(["Cdim9"], on_error='none')
+    with pytest.raises(ValueError):
+        CE.create_chords(["Cdim9"])
+
+
+@pytest.mark.parametrize("string", ["Cbdim7", "D##5", "G/Fbb"])
+def test_create_chord_spelling_error(string):
+    with pytest.raises(ValueError):
+        CE.create_chord(string)
+
+
+def test_change_chord_spelling_error():
+    with pytest.raises(ValueError):
+        CE.change_chord(CE.create_chord("C"), root="Cb", quality="dim7")
+
+
+def test_create_chords_spelling_error():
+    assert [] == CE.create_chords(["Cbdim7"], on_error='skip')
+    with pytest.raises(ValueError):
+        CE.create_chords(["C", "Cbdim7"])
+
+
+@pytest.mark.parametrize(
+    "notes, notation", [
+        ([60, 64, 67], "C"),
+        ([60, 64, 67, 70], "C7"),
+        ([60, 64, 70], "C7"),
+        ([52, 60, 67], "C/E"),
+        ([57, 60, 64, 67], "Am7"),
+        ([60, 64, 67, 69], "C6"),
+        ([60, 64, 67, 74], "Cadd9"),
+        ([60, 63, 66, 69], "Cdim7"),
+        ([62, 65, 69, 72, 76], "Dm9"),
+        ([60, 64, 67, 71, 78], "Cmaj7#11"),
+        ([60, 67, 72], "C5"),
+        ([48, 64, 67, 72, 76], "C"),
+        (["E", "G", "C", "A"], "Am7/E"),
+        (["Db", "F", "Ab"], "Db"),
+        (["C#", "F", "G#"], "C#"),
+    ]
+)
+def test_identify(notes, notation):
+    assert CE.create_chord(notation) == CE.identify(notes)
+
+
+@pytest.mark.parametrize("use_flats, notation", [(False, "C#"), (True, "Db")])
+def test_identify_spelling(use_flats, notation):
+    assert CE.create_chord(notation) == CE.identify([61, 65, 68], use_flats)
+
+
+@pytest.mark.parametrize("notes", [[], [60], [60, 72]])
+def test_identify_none(notes):
+    assert CE.identify(notes) is None
+
+
+def test_identify_numpy():
+    np = pytest.importorskip("numpy")
+    assert "C" == str(CE.identify(np.array([0, 4, 7])))
+    assert "C7/E" == str(CE.identify(np.array([52, 60, 67, 70], np.uint8)))
+
+
+def test_identify_frozen():
+    c = CE.identify([60, 64, 67], frozen=True)
+    assert isinstance(c, FrozenChord)
+    assert not isinstance(CE.identify([60, 64, 67]), FrozenChord)
+
+
+def test_identify_every_chord():
+    for notation in ("Cm7b5", "Fmaj9", "Bb13", "Ebsus2", "Gaug", "Adim"):
+        c = CE.create_chord(notation)
+        assert c == CE.identify(c.notes)
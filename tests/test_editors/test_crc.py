@@ -4,6 +4,8 @@ from chordparser.editors.chord_roman_converter import ChordRomanConverter
 from chordparser.editors.chords_editor import ChordEditor
 from chordparser.editors.keys_editor import KeyEditor
 from chordparser.editors.scales_editor import ScaleEditor
+from chordparser.music.chords import FrozenChord
+from chordparser.music.roman import Roman
 
 
 SE = ScaleEditor()
@@ -76,3 +78,135 @@ def test_sus_warning():
         CRC.to_roman(c, s)
 
 
+def test_roman_sequence():
+    chords = CE.create_chords(["C", "Am", "Dm7", "G7/B", "Bb", "C"])
+    s = SE.create_scale("C", "major")
+    romans = CRC.to_roman_sequence(chords, s)
+    assert romans == [CRC.to_roman(c, s) for c in chords]
+    assert romans == ["I", "vi", "ii7", "V65", "\u266dVII", "I"]
+
+
+def test_roman_sequence_key():
+    chords = CE.create_chords(["Em", "C", "D", "B7"], frozen=True)
+    k = KE.create_key("E", "minor")
+    romans = CRC.to_roman_sequence(chords, k)
+    assert romans == ["i", "VI", "VII", "V7"]
+
+
+def test_roman_sequence_empty():
+    s = SE.create_scale("C", "major")
+    assert CRC.to_roman_sequence([], s) == []
+
+
+def test_roman_sequence_warning():
+    chords = CE.create_chords(["C5", "Csus", "G", "Dsus2"])
+    s = SE.create_scale("C", "major")
+    with pytest.warns(UserWarning) as record:
+        romans = CRC.to_roman_sequence(chords, s)
+    assert len(record) == 1
+    assert "3 power and sus chords" in str(record[0].message)
+    assert romans == ["I", "I", "V", "II"]
+
+
+@pytest.mark.parametrize(
+    "roman, chord", [
+        (Roman("I", "", ()), "C"),
+        (Roman("ii", "", ()), "Dm"),
+        (Roman("vii", "\u00B0", ()), "Bdim"),
+        (Roman("III", "+", ()), "Eaug"),
+        (Roman("V", "", (7,)), "G7"),
+        (Roman("IV", "M", (7,)), "Fmaj7"),
+        (Roman("i", "M", (7,)), "Cmmaj7"),
+        (Roman("vii", "\u00f8", (7,)), "Bm7b5"),
+        (Roman("vii", "\u00B07", ()), None),
+        (Roman("ii", "", (9,)), "Dm9"),
+        (Roman("\u266dVII", "", ()), "Bb"),
+        (Roman("\u266fiv", "\u00B0", (7,)), "F#dim7"),
+        (Roman("I", "", (6,)), "C/E"),
+        (Roman("I", "", (6, 4)), "C/G"),
+        (Roman("V", "", (6, 5)), "G7/B"),
+        (Roman("V", "", (4, 3)), "G7/D"),
+        (Roman("V", "", (4, 2)), "G7/F"),
+    ]
+)
+def test_to_chord(roman, chord):
+    s = SE.create_scale("C", "major")
+    if chord is None:
+        with pytest.raises(ValueError):
+            CRC.to_chord(roman, s)
+    else:
+        assert CRC.to_chord(roman, s) == CE.create_chord(chord)
+
+
+def test_to_chord_key():
+    k = KE.create_key("E", "minor")
+    assert CRC.to_chord(Roman("VII", "", ()), k) == CE.create_chord("D")
+
+
+def test_to_chord_frozen():
+    s = SE.create_scale("C", "major")
+    c = CRC.to_chord(Roman("I", "", ()), s)
+    c.transpose(2, 1)
+    assert str(CRC.to_chord(Roman("I", "", ()), s)) == "C"
+    assert isinstance(CRC.to_chord(Roman("I", "", ()), s, True), FrozenChord)
+
+
+@pytest.mark.parametrize(
+    "roman", [
+        Roman("", "", ()),
+        Roman("VIII", "", ()),
+        Roman("Iv", "", ()),
+        Roman("bII", "", ()),
+        Roman("I", "x", ()),
+        Roman("I", "", (5,)),
+        Roman("I", "\u00B0", (9,)),
+    ]
+)
+def test_to_chord_invalid(roman):
+    s = SE.create_scale("C", "major")
+    with pytest.raises(ValueError, match="is not a valid Roman"):
+        CRC.to_chord(roman, s)
+
+
+def test_to_chord_accidental_error():
+    s = SE.create_scale("F\u266d", "major")
+    with pytest.raises(ValueError, match="Only symbols up to"):
+        CRC.to_chord(Roman("\u266dIV", "", ()), s)
+
+
+@pytest.mark.parametrize("key", ["C", "Eb", "F#", "Am", "C#m"])
+def test_to_chords_round_trip(key):
+    k = CE.create_chord(key)
+    s = SE.create_scale(k.root, k.quality.value)
+    chords = CE.create_chords(
+        ["Am7", "D7/F#", "Gmaj7", "Cdim7", "Bm7b5/F", "Ebaug", "F/A"]
+    )
+    romans = CRC.to_roman_sequence(chords, s)
+    assert CRC.to_chords(romans, s) == chords
+
+
+def test_to_chord_string():
+    s = SE.create_scale("C", "major")
+    assert CRC.to_chord("bVII", s) == CE.create_chord("Bb")
+    assert CRC.to_chord("ii\u00f865", s) == CE.create_chord("Dm7b5/F")
+
+
+@pytest.mark.parametrize(
+    "roman, chord", [
+        ("V/V", "D"),
+        ("V7/ii", "A7"),
+        ("vii\u00B07/V", "F#dim7"),
+        ("V/vi", "E"),
+        ("iv/IV", "Bbm"),
+        ("V/V/V", "A"),
+    ]
+)
+def test_to_chord_secondary(roman, chord):
+    s = SE.create_scale("C", "major")
+    assert CRC.to_chord(roman, s) == CE.create_chord(chord)
+
+
+def test_to_chord_secondary_error():
+    s = SE.create_scale("C", "major")
+    with pytest.raises(ValueError, match="cannot be tonicised"):
+        CRC.to_chord("V/vii\u00B0", s)
@@ -116,3 +116,18 @@ def test_change_key_not_inplace():
     okey = KE.create_key("C")
     nkey = KE.change_key(okey, root="C", inplace=False)
     assert nkey is not okey
+
+
+def test_relative_major_frozen():
+    okey = KE.create_key("D", "minor").freeze()
+    nkey = KE.relative_major(okey)
+    assert KE.create_key("F") == nkey
+    assert KE.create_key("D", "minor") == okey
+    assert {nkey}
+
+
+def test_change_key_frozen():
+    okey = KE.create_key("C").freeze()
+    nkey = KE.change_key(okey, root="D")
+    assert KE.create_key("D") == nkey
+    assert okey.root == "C"
@@ -0,0 +1,13 @@
+from chordparser.editors.parse_result import ParseResult
+
+
+def test_parsed():
+    result = ParseResult("C", span=(0, 1))
+    assert result
+    assert "ParseResult('C', span=(0, 1))" == repr(result)
+
+
+def test_error():
+    result = ParseResult(None, ParseResult.ROOT, (0, 4))
+    assert not result
+    assert "ParseResult(error='root', span=(0, 4))" == repr(result)
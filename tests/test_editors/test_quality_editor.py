@@ -1,3 +1,5 @@
+import re
+
 import pytest
 
 from chordparser.editors.quality_editor import QualityEditor
@@ -103,3 +105,23 @@ def test_none():
 def test_none_2():
     q = QE.create_quality(None, False)
     assert "minor" == q.value
+
+
+def test_shared_quality():
+    q1 = QE.create_quality("maj7")
+    q2 = QE.create_quality("\u03947")
+    assert q1 is q2
+
+
+@pytest.mark.parametrize(
+    "string", [
+        "", "5", "m", "mM", "mMaj7", "m7b5", "aug", "+M7", "dim7", "o",
+        "\u00f89", "maj", "b9", "bb13", "sus", "sus2", "7sus4", "m\u266d5",
+        "#5", "Maj13sus2", "x",
+        ])
+def test_scanner_same_as_regex(string):
+    rgx = re.match(QE.quality_pattern, string, re.UNICODE)
+    end, parts = QE._scan_quality(string)
+    groups = QE._match_quality(string, 0, end, parts)
+    assert rgx.group(0) == groups.group(0)
+    assert rgx.groups() == groups.groups()
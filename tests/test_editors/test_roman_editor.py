@@ -0,0 +1,75 @@
+import pytest
+
+from chordparser.editors.chord_roman_converter import ChordRomanConverter
+from chordparser.editors.chords_editor import ChordEditor
+from chordparser.editors.roman_editor import RomanEditor
+from chordparser.editors.scales_editor import ScaleEditor
+from chordparser.music.roman import Roman
+
+
+RE = RomanEditor()
+CE = ChordEditor()
+SE = ScaleEditor()
+CRC = ChordRomanConverter()
+
+
+@pytest.mark.parametrize(
+    "notation, roman", [
+        ("I", Roman("I", "", ())),
+        ("vi", Roman("vi", "", ())),
+        ("\u266dVII", Roman("\u266dVII", "", ())),
+        ("bVII", Roman("\u266dVII", "", ())),
+        ("##iv", Roman("\U0001D12Aiv", "", ())),
+        ("vii\u00f865", Roman("vii", "\u00f8", (6, 5))),
+        ("viio7", Roman("vii", "\u00B0", (7,))),
+        ("IVM7", Roman("IV", "M", (7,))),
+        ("IM+7", Roman("I", "M+", (7,))),
+        ("III+", Roman("III", "+", ())),
+        ("ii64", Roman("ii", "", (6, 4))),
+        ("V13", Roman("V", "", (13,))),
+        ("V/V", Roman("V", "", (), Roman("V", "", ()))),
+        ("V7/V/V", Roman("V", "", (7,), Roman("V", "", (), Roman("V", "", ())))),
+    ]
+)
+def test_create_roman(notation, roman):
+    assert RE.create_roman(notation) == roman
+
+
+@pytest.mark.parametrize(
+    "notation", ["", "VIII", "IIV", "H", "bb", "I5", "V/", "/V", "V//V", None]
+)
+def test_create_roman_error(notation):
+    with pytest.raises(SyntaxError):
+        RE.create_roman(notation)
+
+
+def test_interned():
+    r = RE.create_roman("bVII7")
+    assert r is RE.create_roman("bVII7")
+    assert r is RE.create_roman("\u266dVII7")
+
+
+def test_interned_after_eviction():
+    r = RE.create_roman("bVII7")
+    RomanEditor._romans.clear()  # as if the notations were evicted
+    assert r is RE.create_roman("\u266dVII7")
+    assert r is RE.create_roman("bVII7")
+
+
+def test_immutable():
+    r = RE.create_roman("V7")
+    with pytest.raises(AttributeError):
+        r.root = "IV"
+
+
+@pytest.mark.parametrize(
+    "chord", [
+        "C", "Dm7", "Fmaj7", "G7/B", "Bm7b5", "Bbaug", "C#dim7/E",
+        "Edim/E", "F#/F#", "C/C", "Cadd9/D",
+    ]
+)
+def test_round_trip(chord):
+    s = SE.create_scale("C", "major")
+    roman = CRC.to_roman(CE.create_chord(chord), s)
+    assert RE.create_roman(str(roman)) == roman
+    assert CRC.to_roman(CRC.to_chord(str(roman), s), s) == roman
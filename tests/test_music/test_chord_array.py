@@ -0,0 +1,193 @@
+import pytest
+
+from chordparser.editors.chords_editor import ChordEditor
+from chordparser.music.chords import FrozenChord
+
+np = pytest.importorskip("numpy")
+from chordparser.music.chord_array import ChordArray  # noqa: E402
+
+
+CE = ChordEditor()
+NOTATIONS = [
+    "C", "Am7", "F/C", "G7", "Cadd9", "Dbm7b5/Fb", "E9b5", "C", "Bbsus4add13",
+]
+
+
+@pytest.fixture
+def chords():
+    return ChordArray.from_strings(NOTATIONS)
+
+
+def test_columns(chords):
+    assert np.int8 == chords.root.dtype
+    assert np.int16 == chords.quality.dtype
+    assert np.uint32 == chords.add.dtype
+    assert np.int8 == chords.bass.dtype
+    assert [2, 27, 17, 22] == list(chords.root[:4])
+    assert [-1, -1, 2, -1] == list(chords.bass[:4])
+
+
+def test_to_chords(chords):
+    results = chords.to_chords()
+    assert CE.create_chords(NOTATIONS) == results
+    assert all(isinstance(chord, FrozenChord) for chord in results)
+    assert results[0] is results[7]
+
+
+def test_to_mutable_chords(chords):
+    results = chords.to_chords(frozen=False)
+    assert CE.create_chords(NOTATIONS) == results
+    assert not any(isinstance(chord, FrozenChord) for chord in results)
+    assert results[0] is not results[7]
+
+
+def test_to_strings(chords):
+    expected = [str(chord) for chord in CE.create_chords(NOTATIONS)]
+    assert expected == chords.to_strings()
+
+
+def test_from_chords():
+    chords = CE.create_chords(NOTATIONS)
+    assert chords == ChordArray.from_chords(chords).to_chords()
+
+
+def test_from_strings_skip():
+    chords = ChordArray.from_strings(["C", "N.C.", "G"], on_error='skip')
+    assert ["C", "G"] == chords.to_strings()
+
+
+@pytest.mark.parametrize(
+    "notations, on_error, error", [
+        (["C", "N.C."], 'raise', SyntaxError),
+        (["C"], 'none', ValueError),
+    ]
+)
+def test_from_strings_error(notations, on_error, error):
+    with pytest.raises(error):
+        ChordArray.from_strings(notations, on_error)
+
+
+def test_index(chords):
+    assert CE.create_chord("Am7") == chords[1]
+    assert CE.create_chord("Bbsus4add13") == chords[-1]
+
+
+@pytest.mark.parametrize(
+    "index, result", [
+        (slice(1, 3), ["Am7", "F/C"]),
+        (slice(None, None, 4), ["C", "Cadd9", "Bbsus4add13"]),
+        ([3, 0], ["G7", "C"]),
+    ]
+)
+def test_slice(chords, index, result):
+    assert CE.create_chords(result) == chords[index].to_chords()
+
+
+def test_mask(chords):
+    sliced = chords[chords.bass >= 0]
+    assert isinstance(sliced, ChordArray)
+    assert CE.create_chords(["F/C", "Dbm7b5/Fb"]) == sliced.to_chords()
+
+
+def test_concatenate(chords):
+    joined = ChordArray.concatenate([chords, chords[:2]])
+    assert 11 == len(joined)
+    assert CE.create_chords(NOTATIONS + ["C", "Am7"]) == list(joined)
+
+
+def test_concatenate_empty():
+    assert 0 == len(ChordArray.concatenate([]))
+
+
+def test_added_notes_order():
+    chords = ChordArray.from_strings(["Cadd#9b9"])
+    assert [('\u266d', 9), ('\u266f', 9)] == list(chords[0].add)
+
+
+def test_invalid_columns():
+    with pytest.raises(ValueError):
+        ChordArray([0, 1], [0], [0], [-1])
+
+
+@pytest.mark.parametrize(
+    "notations, result", [
+        (["C", "G"], "ChordArray(['C', 'G'])"),
+        (
+            ["C", "D", "E", "F", "G", "A", "B"],
+            "ChordArray(['C', 'D', 'E', ..., 'G', 'A', 'B'])",
+        ),
+    ]
+)
+def test_repr(notations, result):
+    assert result == repr(ChordArray.from_strings(notations))
+
+
+@pytest.mark.parametrize(
+    "semitones, letters", [(2, 1), (6, 3), (5, 3), (-1, -1)]
+)
+def test_transpose(chords, semitones, letters):
+    expected = [
+        chord.transpose(semitones, letters)
+        for chord in CE.create_chords(NOTATIONS)
+    ]
+    assert expected == chords.transpose(semitones, letters).to_chords()
+
+
+@pytest.mark.parametrize("semitones", [1, 6, -3, 13])
+@pytest.mark.parametrize("use_flats", [False, True])
+def test_transpose_simple(chords, semitones, use_flats):
+    expected = [
+        chord.transpose_simple(semitones, use_flats)
+        for chord in CE.create_chords(NOTATIONS)
+    ]
+    result = chords.transpose_simple(semitones, use_flats).to_chords()
+    assert expected == result
+
+
+def test_transpose_simple_bass():
+    chords = ChordArray.from_strings(["C#/G", "C/Gb"])
+    result = chords.transpose_simple(1).to_strings()
+    assert ["D/A\u266d", "C\u266f/G"] == result
+    result = chords.transpose_simple(1, use_flats=True).to_strings()
+    assert ["D/A\u266d", "D\u266d/A\U0001D12B"] == result
+
+
+def test_transpose_each():
+    chords = ChordArray.from_strings(["C", "C", "C/E"])
+    result = chords.transpose([2, 7, 4], [1, 4, 2]).to_strings()
+    assert ["D", "G", "E/G\u266f"] == result
+
+
+@pytest.mark.parametrize(
+    "method, args", [
+        ("transpose", (-1, 0)),
+        ("transpose_simple", (9,)),
+    ]
+)
+def test_transpose_error(method, args):
+    chords = ChordArray.from_strings(["C", "Cbb", "Db/B"])
+    with pytest.raises(ValueError):
+        getattr(chords, method)(*args)
+
+
+@pytest.mark.parametrize(
+    "notation, semitones, letters", [
+        ("Cdim7", -1, 0),
+        ("Gbm7b5", -1, 0),
+        ("Dbadd#11/Ab", -1, 0),
+        ("G#7#9", 1, 0),
+        ("E/Gb", 1, 0),
+    ]
+)
+def test_transpose_spelling_error(notation, semitones, letters):
+    chord = CE.create_chord(notation, frozen=True)
+    chords = ChordArray.from_chords([CE.create_chord("C"), chord])
+    try:
+        expected = chord.transpose(semitones, letters)
+    except ValueError:
+        expected = None
+    if expected is None:
+        with pytest.raises(ValueError):
+            chords.transpose(semitones, letters)
+    else:
+        assert expected == chords.transpose(semitones, letters)[1]
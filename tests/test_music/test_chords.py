@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 
 from chordparser.editors.chords_editor import ChordEditor
@@ -5,6 +7,7 @@ from chordparser.editors.keys_editor import KeyEditor
 from chordparser.editors.notes_editor import NoteEditor
 from chordparser.editors.scales_editor import ScaleEditor
 from chordparser.music.chords import Chord
+from chordparser.music.notes import FrozenNote, Note
 
 
 NE = NoteEditor()
@@ -122,3 +125,165 @@ def test_chord_equality():
 def test_chord_not_implemented():
     c = CE.create_chord('C')
     assert c != len
+
+
+def test_copy():
+    c = CE.create_chord("Cadd9/E")
+    d = c.copy()
+    d.transpose(2, 1)
+    assert "Cadd9/E chord" == repr(c)
+    assert "Dadd9/F\u266f chord" == repr(d)
+    assert c.notes == ('E', 'C', 'G', 'D')
+
+
+def test_frozen_chord_hash():
+    c = CE.create_chord("Dsus", frozen=True)
+    assert c in {CE.create_chord("Dsus4", frozen=True)}
+    assert c == CE.create_chord("Dsus4")
+
+
+def test_frozen_chord_shared():
+    assert CE.create_chord("Am7", frozen=True) is CE.create_chord("Am7", frozen=True)
+
+
+def test_frozen_chord_transpose():
+    c = CE.create_chord("Cadd9/E", frozen=True)
+    assert "Dadd9/F\u266f" == str(c.transpose(2, 1))
+    assert "Cadd9/E" == str(c)
+    assert "D\u266dadd9/F" == str(c.transpose_simple(1, use_flats=True))
+
+
+def test_frozen_chord_immutable():
+    c = CE.create_chord("C", frozen=True)
+    with pytest.raises(AttributeError):
+        c.bass = NE.create_note("G")
+
+
+def test_frozen_chord_thaw():
+    c = CE.create_chord("C", frozen=True).thaw()
+    c.transpose(2, 1)
+    assert "D" == str(c)
+    assert "C" == str(CE.create_chord("C", frozen=True))
+
+
+def test_notes_shared():
+    c = CE.create_chord("Cmaj7")
+    d = CE.create_chord("Em")
+    assert c.notes[1] is d.notes[0]
+    assert isinstance(c.root, Note)
+    assert not isinstance(c.root, FrozenNote)
+
+
+def test_diatonic_root_mutable():
+    c = CE.create_diatonic(SE.create_scale("C"), 2)
+    c.transpose(2, 1)
+    assert "Em chord" == repr(c)
+
+
+def test_spelling_error():
+    dim7 = CE.create_chord("Cdim7").quality
+    with pytest.raises(ValueError):
+        Chord(NE.create_note("Cb"), dim7)
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_transpose_spelling_error(frozen):
+    c = CE.create_chord("Cdim7", frozen=frozen)
+    with pytest.raises(ValueError):
+        c.transpose(-1, 0)
+
+
+def test_transpose_simple_spelling_error():
+    c = CE.create_chord("C/Abb")
+    with pytest.raises(ValueError):
+        c.transpose_simple(1, use_flats=True)
+
+
+def test_lazy_notes_not_built():
+    c = CE.create_chord("Cdim7")
+    c.root = NE.create_note("Cb")
+    assert not hasattr(c, "notes")
+    assert "Cdim7" == str(copy.deepcopy(c))
+
+
+def test_lazy_notes_rebuilt():
+    c = CE.create_chord("Am/C")
+    assert 3 == c.inversion
+    CE.change_chord(c, bass="G")
+    assert c.inversion is None
+    assert "G" == c.notes[0]
+
+
+def test_lazy_frozen_notes():
+    c = CE.create_chord("G7", frozen=True)
+    assert "B" == c.notes[1]
+    assert (4, 3, 3) == c.intervals
+
+
+def test_no_attribute():
+    c = CE.create_chord("C")
+    with pytest.raises(AttributeError):
+        c.foo
+
+
+@pytest.mark.parametrize(
+    "name, pitch_classes, spellings", [
+        ("C", 0b000010010001, (2, 12, 22)),
+        ("Cm7/Bb", 0b010010001001, (2, 11, 22, 31)),
+        ("Db", 0b000100100010, (6, 17, 26)),
+        ("C#", 0b000100100010, (3, 13, 23)),
+    ]
+)
+def test_masks(name, pitch_classes, spellings):
+    c = CE.create_chord(name)
+    assert pitch_classes == c.pitch_class_mask
+    assert sum(1 << id_ for id_ in spellings) == c.spelled_mask
+
+
+def test_masks_rebuilt():
+    c = CE.create_chord("C")
+    c.pitch_class_mask
+    c.transpose(2, 1)
+    assert CE.create_chord("D").pitch_class_mask == c.pitch_class_mask
+
+
+@pytest.mark.parametrize(
+    "chord, other, spelled, result", [
+        ("Cmaj7", "Em", False, True),
+        ("Cmaj7", "E", False, False),
+        ("C7", "Edim", False, True),
+        ("Db7", "C#", False, True),
+        ("Db7", "C#", True, False),
+    ]
+)
+def test_contains(chord, other, spelled, result):
+    c = CE.create_chord(chord)
+    assert result == c.contains(CE.create_chord(other), spelled)
+
+
+@pytest.mark.parametrize(
+    "chord, other, spelled, result", [
+        ("C", "Am", False, 2),
+        ("C", "F#", False, 0),
+        ("Cmaj7", "Em7", False, 3),
+        ("Db", "C#", False, 3),
+        ("Db", "C#", True, 0),
+    ]
+)
+def test_common_tones(chord, other, spelled, result):
+    c = CE.create_chord(chord)
+    assert result == c.common_tones(CE.create_chord(other), spelled)
+
+
+@pytest.mark.parametrize(
+    "chord, other, result", [
+        ("C#7", "Db7", True),
+        ("C6", "Am7/C", True),
+        ("C6", "Am7", False),
+        ("C#7", "C#7/G#", False),
+        ("C", "Cm", False),
+    ]
+)
+def test_is_enharmonic(chord, other, result):
+    c = CE.create_chord(chord, frozen=True)
+    assert result == c.is_enharmonic(CE.create_chord(other))
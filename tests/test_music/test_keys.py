@@ -62,3 +62,20 @@ def test_key_equality_2():
 def test_key_inequality(root, mode, submode):
     nkey = KE.create_key('C', 'aeolian', 'natural')
     assert nkey != KE.create_key(root, mode, submode)
+
+
+def test_frozen_key_hash():
+    nkey = KE.create_key('C', 'aeolian').freeze()
+    assert nkey in {KE.create_key('C', 'minor').freeze()}
+
+
+def test_frozen_key_transpose():
+    nkey = KE.create_key('C').freeze()
+    assert nkey.transpose(2, 1) == KE.create_key('D')
+    assert nkey.root == 'C'
+
+
+def test_frozen_key_immutable():
+    nkey = KE.create_key('C').freeze()
+    with pytest.raises(AttributeError):
+        nkey.mode = 'minor'
@@ -1,7 +1,7 @@
 import pytest
 
 from chordparser.editors.notes_editor import NoteEditor
-from chordparser.music.notes import Note
+from chordparser.music.notes import FrozenNote, Note
 
 
 NE = NoteEditor()
@@ -165,3 +165,80 @@ def test_note_equality(note):
 def test_note_inequality(note):
     new_note = NE.create_note('C')
     assert new_note != note
+
+
+def test_frozen_note_hash():
+    n = NE.create_note('D\u266f').freeze()
+    assert {n: 1}['D\u266f'] == 1
+    assert n in {NE.create_note('D#').freeze()}
+
+
+@pytest.mark.parametrize(
+    "method, args, new_note", [
+        ("accidental", (-1,), 'C\u266d'),
+        ("shift_s", (2,), 'C\U0001D12A'),
+        ("shift_l", (2,), 'E'),
+        ("transpose", (6, 3), 'F\u266f'),
+        ("transpose_simple", (3, True), 'E\u266d'),
+    ]
+)
+def test_frozen_note_methods(method, args, new_note):
+    n = NE.create_note('C').freeze()
+    assert getattr(n, method)(*args) == new_note
+    assert n == 'C'
+
+
+def test_frozen_note_immutable():
+    n = NE.create_note('C').freeze()
+    with pytest.raises(AttributeError):
+        n.letter = 'D'
+
+
+def test_frozen_note_thaw():
+    n = NE.create_note('C').freeze().thaw()
+    n.transpose(2, 1)
+    assert n == 'D'
+
+
+def test_frozen_note_interned():
+    n = NE.create_note('Eb').freeze()
+    assert n is FrozenNote('E', '\u266d')
+    assert n.transpose(2, 1) is NE.create_note('F').freeze()
+    assert 35 == len(FrozenNote._spellings)
+
+
+def test_frozen_note_invalid():
+    with pytest.raises(ValueError):
+        FrozenNote('H', '')
+
+
+@pytest.mark.parametrize(
+    "note, num, letter, symbol", [
+        ('C', 0, 0, 0), ('D\u266f', 3, 2, 1), ('G\u266d', 6, 7, -1),
+        ('A\U0001D12B', 7, 9, -2), ('B\U0001D12A', 1, 11, 2)])
+def test_frozen_note_values(note, num, letter, symbol):
+    n = NE.create_note(note).freeze()
+    assert num == n.num_value()
+    assert letter == n.letter_value()
+    assert symbol == n.symbol_value()
+
+
+def test_frozen_note_transpose_error():
+    n = NE.create_note('B\U0001D12A').freeze()
+    with pytest.raises(ValueError):
+        n.transpose(2, 1)
+
+
+def test_transposition_table():
+    assert 35 * 12 * 7 == len(FrozenNote._transpositions)
+    assert 35 * 12 * 2 == len(FrozenNote._simple_transpositions)
+
+
+@pytest.mark.parametrize(
+    "note, semitone, letter", [
+        ('B\U0001D12A', 2, 1), ('C', 5, 1), ('F\U0001D12B', -4, -1)])
+def test_note_transpose_error(note, semitone, letter):
+    nnote = NE.create_note(note)
+    with pytest.raises(ValueError):
+        nnote.transpose(semitone, letter)
+    assert nnote == note
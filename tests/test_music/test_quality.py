@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from chordparser.music.quality import Quality
@@ -161,3 +163,38 @@ def test_equality():
     q1 = Quality("major", "major seventh")
     q2 = Quality("major", "major seventh")
     assert q1 == q2
+
+
+def test_hash():
+    q1 = Quality("major", "major seventh")
+    q2 = Quality("major", "major seventh")
+    assert q1 in {q2}
+
+
+def test_immutable():
+    q = Quality("major")
+    with pytest.raises(AttributeError):
+        q.value = "minor"
+
+
+def test_catalogued():
+    q1 = Quality("major", "major seventh")
+    q2 = Quality("major", "major seventh")
+    assert q1 is q2
+
+
+def test_catalogue_size():
+    assert len(Quality._qualities) == len(Quality._catalogue)
+    assert all(
+        q is Quality._qualities[q._id] for q in Quality._qualities
+    )
+
+
+def test_not_catalogued():
+    with pytest.raises(ValueError):
+        Quality("major", "ninth", True)
+
+
+def test_pickle_catalogued():
+    q = Quality("dominant", "ninth", True)
+    assert q is pickle.loads(pickle.dumps(q))
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from chordparser.music.roman import Roman
@@ -37,3 +39,33 @@ def test_equality_2():
 def test_equality_not_implemented():
     r = Roman("I", "", ())
     assert r != len
+
+
+def test_hash():
+    r = Roman("IV", "+", (6,))
+    assert r in {Roman("IV", "+", (6,))}
+    assert {r: 1}["IV+6"] == 1
+
+
+def test_immutable():
+    r = Roman("IV", "+", (6,))
+    with pytest.raises(AttributeError):
+        r.root = "V"
+
+
+def test_secondary():
+    r = Roman("vii", "\u00B0", (7,), Roman("V", "", ()))
+    assert "vii\u00B07/V" == str(r)
+    assert r.secondary == "V"
+
+
+def test_secondary_equality():
+    r = Roman("V", "", (), Roman("V", "", ()))
+    assert r == Roman("V", "", (), Roman("V", "", ()))
+    assert r != Roman("V", "", ())
+    assert r != Roman("V", "", (), Roman("ii", "", ()))
+
+
+def test_pickle():
+    r = Roman("V", "", (7,), Roman("ii", "", ()))
+    assert pickle.loads(pickle.dumps(r)) == r
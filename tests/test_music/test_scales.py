@@ -1,11 +1,13 @@
 import pytest
 
+from chordparser.editors.chords_editor import ChordEditor
 from chordparser.editors.keys_editor import KeyEditor
 from chordparser.editors.scales_editor import ScaleEditor
 
 
 KE = KeyEditor()
 SE = ScaleEditor()
+CE = ChordEditor()
 
 
 @pytest.mark.parametrize(
@@ -101,3 +103,52 @@ def test_scale_equality():
 def test_scale_not_implemented():
     s = SE.create_scale('C')
     assert s != len
+
+
+def test_scale_notes_shared():
+    s = SE.create_scale('D', 'minor', 'melodic')
+    s2 = SE.create_scale('D', 'minor', 'melodic')
+    assert s.notes is s2.notes
+
+
+def test_scale_transpose_shared():
+    s = SE.create_scale('C', 'dorian')
+    s2 = SE.create_scale('D', 'dorian')
+    s.transpose(2, 1)
+    assert s.notes is s2.notes
+    s.transpose(-2, -1)
+    assert "D" == s.notes[1]
+
+
+def test_scale_masks():
+    s = SE.create_scale("C", "major")
+    assert 0b101010110101 == s.pitch_class_mask
+    assert sum(1 << (pos*5 + 2) for pos in range(7)) == s.spelled_mask
+
+
+def test_scale_masks_transpose():
+    s = SE.create_scale("C", "major")
+    s.transpose(2, 1)
+    assert SE.create_scale("D", "major").spelled_mask == s.spelled_mask
+
+
+@pytest.mark.parametrize(
+    "key, chord, spelled, result", [
+        ("C", "G7", False, True),
+        ("C", "Bb", False, False),
+        ("Db", "C#", False, True),
+        ("Db", "C#", True, False),
+        ("Db", "Db", True, True),
+    ]
+)
+def test_scale_contains(key, chord, spelled, result):
+    s = SE.create_scale(key, "major")
+    assert result == s.contains(CE.create_chord(chord), spelled)
+
+
+def test_scale_contains_scale():
+    s = SE.create_scale("A", "minor", "harmonic")
+    assert not SE.create_scale("C", "major").contains(s)
+    assert SE.create_scale("C", "major").is_enharmonic(
+        SE.create_scale("B#", "major")
+    )
@@ -35,12 +35,20 @@ def test_chords():
     assert cp.create_chord("C") == CE.create_chord("C")
 
 
+def test_chords_batch():
+    assert cp.create_chords(["C", "Dm"]) == CE.create_chords(["C", "Dm"])
+
+
 def test_CA():
     c = CE.create_chord("C")
     s = SE.create_scale("C")
     assert cp.to_roman(c, s) == "I"
 
 
+def test_romans():
+    assert cp.create_roman("V7/V") == "V7/V"
+
+
 def test_attribute_error():
     with pytest.raises(AttributeError):
         Note.num_value(cp)
@@ -0,0 +1,80 @@
+import pytest
+
+from chordparser.readers.chordpro_corpus import ChordProCorpus
+from chordparser.readers.chordpro_reader import ChordEvent
+
+
+@pytest.fixture
+def corpus_path(tmp_path):
+    path = tmp_path / "corpus.cho"
+    path.write_text(
+        "{t:First}\n[G]one\n{title: Second }\n[C]two [Am]\u00e9\n",
+        encoding='utf-8',
+    )
+    return path
+
+
+def test_songs(corpus_path):
+    with ChordProCorpus(corpus_path) as corpus:
+        titles = [song.title for song in corpus]
+    assert ["First", "Second"] == titles
+
+
+def test_song_views(corpus_path):
+    with ChordProCorpus(corpus_path) as corpus:
+        song = corpus[1]
+        assert isinstance(song.data, memoryview)
+        assert 17 == song.offset
+        assert "{title: Second }\n[C]two [Am]\u00e9\n" == song.decode()
+        del song
+
+
+def test_len_and_index(corpus_path):
+    corpus = ChordProCorpus(corpus_path)
+    assert "Second" == corpus[-1].title
+    assert 2 == len(corpus)
+    with pytest.raises(IndexError):
+        corpus[2]
+    corpus.close()
+
+
+def test_close_while_scanning(corpus_path):
+    corpus = ChordProCorpus(corpus_path)
+    assert "First" == corpus[0].title
+    corpus.close()
+    assert corpus._mmap.closed
+
+
+def test_close_with_songs(corpus_path):
+    corpus = ChordProCorpus(corpus_path)
+    song = corpus[0]
+    corpus.close()
+    assert "First" == song.title
+    del song
+    corpus.close()
+    assert corpus._mmap.closed
+
+
+def test_song_events(corpus_path):
+    with ChordProCorpus(corpus_path) as corpus:
+        events = list(corpus[1].read_chordpro())
+    chords = [str(x.chord) for x in events if isinstance(x, ChordEvent)]
+    assert ["C", "Am"] == chords
+
+
+@pytest.mark.parametrize(
+    "text, titles", [
+        ("", []),
+        ("[G]no title", [None]),
+        ("\n\n{t:A}\n", ["A"]),
+        ("intro\n{t:A}\n", [None, "A"]),
+        ("{t:A}\nnot {t:B}\n", ["A"]),
+        ("{Title: A}\n[G]a\n{T:B}\n[C]b\n", ["A", "B"]),
+        ("{TITLE:A}\n", ["A"]),
+    ]
+)
+def test_boundaries(tmp_path, text, titles):
+    path = tmp_path / "corpus.cho"
+    path.write_text(text, encoding='utf-8')
+    with ChordProCorpus(path) as corpus:
+        assert titles == [song.title for song in corpus]
@@ -0,0 +1,76 @@
+import io
+
+import pytest
+
+from chordparser.readers.chordpro_reader import (
+    ChordEvent, ChordProReader, DirectiveEvent, LyricEvent,
+)
+from chordparser.parser import Parser
+
+
+CPR = ChordProReader()
+
+
+def read(text):
+    return list(CPR.read_chordpro(io.StringIO(text)))
+
+
+@pytest.mark.parametrize(
+    "line, name, value", [
+        ("{t:Song}", 'title', "Song"),
+        ("{title: Song }", 'title', "Song"),
+        ("{key:G}", 'key', "G"),
+        ("{c: }", 'comment', ""),
+        ("{soc}", 'start_of_chorus', None),
+    ]
+)
+def test_directive(line, name, value):
+    assert [DirectiveEvent(1, 1, name, value)] == read(line)
+
+
+def test_lyrics():
+    events = read("[G]Hello [C]world\n")
+    assert LyricEvent(1, "Hello world") == events[0]
+    assert ChordEvent(1, 1, "G", Parser().create_chord("G")) == events[1]
+    assert (1, 10, "C") == events[2][:3]
+
+
+def test_chord_blank_add():
+    (lyric, chord) = read("[G /B]la")
+    assert "la" == lyric.text
+    assert "G/B" == str(chord.chord)
+
+
+def test_invalid_chord():
+    (lyric, chord) = read("[N.C.] stop")
+    assert " stop" == lyric.text
+    assert chord.chord is None
+
+
+def test_frozen():
+    events = read("[G]one [G]two")
+    assert events[1].chord is events[2].chord
+
+
+def test_unclosed_chord():
+    assert [LyricEvent(1, "[G one")] == read("[G one")
+
+
+def test_comment_and_blank_lines():
+    events = read("# comment\n\n{t:Song}")
+    assert [LyricEvent(2, ""), DirectiveEvent(3, 1, 'title', "Song")] == events
+
+
+def test_lazy():
+    lines = iter(["{t:Song}\n", "[G]la\n"])
+    events = CPR.read_chordpro(lines)
+    assert 'title' == next(events).name
+    assert ["[G]la\n"] == list(lines)
+
+
+def test_path():
+    cp = Parser()
+    events = list(cp.read_chordpro(cp._path))
+    assert DirectiveEvent(1, 1, 'title', cp.sample.split('\n')[0][3:-1]) == events[0]
+    chords = [x for x in events if isinstance(x, ChordEvent)]
+    assert cp.sample.count('[') == len(chords)